@@ -0,0 +1,125 @@
+"""Compare class progression lookups against recomputing them per derive.
+
+Derives the class x level matrix the test suite uses, once with the
+precomputed ``CLASS_LEVELS`` tables and once with the previous
+``_class_block``, which rebuilt the feature list, hit points and save
+map on every call::
+
+    python benchmarks/class_tables.py --repeat 2000
+
+Prints time per call for the class block alone and for a whole derive.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import dndcs  # noqa: E402,F401  - sets up sys.path for main-Core
+from dndcs.core import loader, models  # noqa: E402
+from dndcs.modules.fivee_stock.classes import CLASSES  # noqa: E402
+from tests.conftest import CLASS_NAMES, LEVEL_TIERS  # noqa: E402
+
+ABILS = ("STR", "DEX", "CON", "INT", "WIS", "CHA")
+
+
+def legacy_class_block(char: models.Character, mods: Dict[str, int]) -> Optional[Dict[str, Any]]:
+    """``_class_block`` as it was before the tables."""
+    cls = (char.class_ or "").lower()
+    data = CLASSES.get(cls)
+    if not data:
+        return None
+    level = int(char.level)
+    con_mod = mods.get("CON", 0)
+    hd = int(data.get("hit_die", 0))
+    avg = (hd // 2) + 1
+    hp = hd + con_mod
+    if level > 1:
+        hp += (level - 1) * (avg + con_mod)
+    features: List[str] = []
+    for L in range(1, level + 1):
+        features.extend(data.get("features", {}).get(L, []))
+    st_prof = {a: (a in data.get("saving_throws", [])) for a in ABILS}
+    return {
+        "hit_points": hp,
+        "hit_dice": f"{level}d{hd}",
+        "class_features": features,
+        "saving_throw_proficiencies": st_prof,
+    }
+
+
+def matrix() -> List[models.Character]:
+    """The characters of the ``character`` test fixture."""
+    chars = []
+    for cls in CLASS_NAMES:
+        for level in LEVEL_TIERS:
+            items = [models.Item(name="Spellbook", props={"spellbook": {"prepared": {}}})] if cls == "wizard" else []
+            chars.append(
+                models.Character(
+                    name=f"{cls}-{level}",
+                    level=level,
+                    module="fivee_stock",
+                    class_=cls,
+                    abilities={a: models.AbilityScore(name=a, score=10) for a in ABILS},
+                    items=items,
+                )
+            )
+    return chars
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    mod = loader.load_module_by_manifest_id("fivee_stock")
+    impl = sys.modules[type(mod).__module__]
+    chars = matrix()
+    mods = {"CON": 2}
+    tables = impl._class_block
+
+    def blocks(fn: Callable[..., Any]) -> Callable[[], None]:
+        def run() -> None:
+            for c in chars:
+                fn(c, mods)
+        return run
+
+    def derives() -> None:
+        for c in chars:
+            mod.derive(c)
+
+    timings: Dict[str, List[float]] = {}
+    outputs: Dict[str, List[Any]] = {}
+    for name, fn in (("legacy", legacy_class_block), ("tables", tables)):
+        impl._class_block = fn
+        try:
+            timings[name] = [_time(blocks(fn), args.repeat), _time(derives, max(1, args.repeat // 10))]
+            outputs[name] = [mod.derive(c) for c in chars]
+        finally:
+            impl._class_block = tables
+    assert outputs["legacy"] == outputs["tables"]
+
+    n = len(chars)
+    print(f"{n} characters ({len(CLASS_NAMES)} classes x levels {LEVEL_TIERS})")
+    print(f"{'':<14}{'legacy':>10}{'tables':>10}{'speedup':>9}")
+    for i, label in enumerate(("class block", "derive")):
+        old, new = timings["legacy"][i] / n, timings["tables"][i] / n
+        print(f"{label:<14}{old * 1e6:>8.2f}us{new * 1e6:>8.2f}us{old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
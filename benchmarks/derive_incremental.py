@@ -0,0 +1,114 @@
+"""Compare full and incremental derivation of single-field edits.
+
+Builds a large multiclass character (many items, feats and companions),
+then times each edit two ways: parsing and deriving the edited character
+from scratch, and applying the edit as a JSON Patch to the previous
+derive state::
+
+    python benchmarks/derive_incremental.py --items 400 --companions 100
+
+Times are per edit and exclude JSON encoding of the response, which is
+the same either way.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import dndcs  # noqa: E402,F401  - sets up sys.path for main-Core
+from dndcs.core import loader  # noqa: E402
+from dndcs.core.jsonpatch import apply_patch  # noqa: E402
+
+ABILS = ("STR", "DEX", "CON", "INT", "WIS", "CHA")
+
+EDITS: Dict[str, List[Dict[str, Any]]] = {
+    "ability score": [{"op": "replace", "path": "/abilities/DEX/score", "value": 15}],
+    "level": [{"op": "replace", "path": "/level", "value": 11}],
+    "one item": [{"op": "replace", "path": "/items/1/quantity", "value": 3}],
+    "one companion": [{"op": "replace", "path": "/companions/0/name", "value": "Renamed"}],
+    "notes": [{"op": "replace", "path": "/notes", "value": "edited"}],
+}
+
+
+def large_character(items: int, feats: int, companions: int, spells: int) -> Dict[str, Any]:
+    """Return a multiclass caster with the given numbers of items, feats and companions."""
+    names = [f"Spell {i}" for i in range(spells)]
+    return {
+        "name": "Benchmark",
+        "level": 12,
+        "module": "fivee_stock",
+        "class": "wizard",
+        "abilities": {a: {"name": a, "score": 10 + i} for i, a in enumerate(ABILS)},
+        "skills": [{"name": "Arcana", "ability": "INT"}, {"name": "Stealth", "ability": "DEX"}],
+        "items": [{"name": "Spellbook", "props": {"spellbook": {"prepared": {"1": names, "2": names}}}}]
+        + [
+            {
+                "name": f"Item {i}",
+                "quantity": 1,
+                "props": {
+                    "ability_bonuses": {ABILS[i % 6]: 1} if i % 7 == 0 else {},
+                    "saving_throw_bonuses": {"all": 1} if i % 50 == 0 else {},
+                    "weight": i % 5,
+                },
+            }
+            for i in range(items)
+        ],
+        "feats": [{"name": name} for name in ("Actor", "Keen Mind")]
+        + [{"name": f"Homebrew {i}", "props": {"skill_proficiencies": ["Arcana"]}} for i in range(feats)],
+        "spellcasting": {
+            "classes": {"wizard": 12, "cleric": 3, "warlock": 5, "paladin": 4},
+            "cleric": {"prepared": names},
+            "warlock": {"known": names},
+            "paladin": {"prepared": names},
+        },
+        "companions": [
+            {"name": f"Pet {i}", "template": "owl" if i % 2 else "wolf", "abilities": {"STR": {"name": "STR", "score": 8}}}
+            for i in range(companions)
+        ],
+        "notes": "benchmark character",
+    }
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=400)
+    parser.add_argument("--feats", type=int, default=50)
+    parser.add_argument("--companions", type=int, default=100)
+    parser.add_argument("--spells", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    mod = loader.load_module_by_manifest_id("fivee_stock")
+    payload = large_character(args.items, args.feats, args.companions, args.spells)
+    base = mod.derive_state(payload)
+    print(f"items={args.items} feats={args.feats} companions={args.companions}")
+    print(f"{'edit':<16}{'full':>10}{'patch':>10}{'speedup':>9}  stages rerun")
+    for name, patch in EDITS.items():
+        edited, _ = apply_patch(payload, patch)
+        full = _time(lambda: mod.derive_state(edited), args.repeat)
+        incremental = _time(lambda: mod.derive_incremental(base, patch), args.repeat)
+        state = mod.derive_incremental(base, patch)
+        assert state.output == mod.derive_state(edited).output
+        print(
+            f"{name:<16}{full * 1e6:>8.0f}us{incremental * 1e6:>8.0f}us{full / incremental:>8.1f}x"
+            f"  {', '.join(state.rerun) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Measure derive throughput of the web UI backends.
+
+Runs the same character through the ``thread`` backend and through the
+``process`` backend with each requested worker count, keeping
+``--concurrency`` requests in flight, and prints requests per second::
+
+    python benchmarks/derive_throughput.py --processes 1 2 4 --requests 2000
+
+The process pool is started before timing, so the numbers exclude worker
+start-up.  Gains level off once the worker count reaches the number of
+cores.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import dndcs  # noqa: E402,F401  - sets up sys.path for main-Core
+from webui.backends import DeriveBackend, ProcessBackend, ThreadBackend  # noqa: E402
+from webui.dispatch import Dispatcher  # noqa: E402
+
+DEFAULT_CHARACTER = ROOT / "tests" / "data" / "wizard_l17.json"
+
+
+async def _drive(backend: DeriveBackend, payload: Dict[str, Any], requests: int, concurrency: int) -> float:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one() -> None:
+        async with sem:
+            await backend.execute("derive", payload)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_one() for _ in range(requests)))
+    return time.perf_counter() - start
+
+
+def measure(backend: DeriveBackend, payload: Dict[str, Any], requests: int, concurrency: int) -> float:
+    """Return requests per second after a short warm-up."""
+    backend.start()
+    asyncio.run(_drive(backend, payload, min(requests, concurrency * 2), concurrency))
+    secs = asyncio.run(_drive(backend, payload, requests, concurrency))
+    return requests / secs
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--character", type=Path, default=DEFAULT_CHARACTER, help="Character JSON to derive")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per measurement")
+    parser.add_argument("--concurrency", type=int, default=64, help="Requests kept in flight")
+    parser.add_argument(
+        "--processes", type=int, nargs="+", default=[1, 2, os.cpu_count() or 1],
+        help="Worker counts to try with the process backend",
+    )
+    parser.add_argument("--batch", type=int, default=16, help="Process backend batch size")
+    parser.add_argument("--threads", type=int, default=None, help="Thread backend pool size")
+    args = parser.parse_args(argv)
+
+    payload = json.loads(args.character.read_text())
+    print(f"cores={os.cpu_count()} requests={args.requests} concurrency={args.concurrency}")
+
+    dispatcher = Dispatcher(max_workers=args.threads)
+    try:
+        rate = measure(ThreadBackend(dispatcher), payload, args.requests, args.concurrency)
+    finally:
+        dispatcher.shutdown()
+    print(f"{'thread':<16}{rate:>10.0f} req/s")
+
+    for processes in sorted(set(args.processes)):
+        backend = ProcessBackend(processes=processes, batch_size=args.batch)
+        try:
+            rate = measure(backend, payload, args.requests, args.concurrency)
+        finally:
+            backend.shutdown()
+        print(f"{f'process x{processes}':<16}{rate:>10.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
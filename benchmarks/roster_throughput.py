@@ -0,0 +1,125 @@
+"""Compare roster derivation against deriving characters one at a time.
+
+Generates a league of random fivee_stock characters (classes, levels,
+scores, armor, feats and multiclass casters), derives them once with
+``module.derive`` per character and once as a NumPy
+:class:`~dndcs.modules.fivee_stock.roster.Roster`, checks that the
+roster columns match, and prints characters per second on one core::
+
+    python benchmarks/roster_throughput.py --characters 20000
+
+Needs the ``roster`` extra.  The roster time is split into packing the
+inputs, which is plain Python per character, and the array computation.
+The league is moved out of the garbage collector's reach before timing,
+as a long-lived report process would, so neither side pays for
+collections over it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import dndcs  # noqa: E402,F401  - sets up sys.path for main-Core
+from dndcs.core import loader, models  # noqa: E402
+from dndcs.modules.fivee_stock.roster import Roster  # noqa: E402
+from tests.conftest import CLASS_NAMES  # noqa: E402
+
+ABILS = ("STR", "DEX", "CON", "INT", "WIS", "CHA")
+ITEMS: List[Dict[str, Any]] = [
+    {"name": "Leather", "props": {"armor": {"base": 11, "category": "light"}}},
+    {"name": "Half Plate", "props": {"armor": {"base": 15, "category": "medium", "dex_cap": 2}}},
+    {"name": "Plate", "props": {"armor": {"base": 18, "category": "heavy"}}},
+    {"name": "Shield", "props": {"shield_bonus": 2}},
+    {"name": "Mage Armor", "props": {"ac_base": 13}},
+    {"name": "Belt of Giant Strength", "props": {"ability_bonuses": {"STR": 2}}},
+    {"name": "Cloak of Protection", "props": {"saving_throw_bonuses": {"all": 1}}},
+    {"name": "Spellbook", "props": {"spellbook": {"prepared": {}}}},
+    {"name": "Rope", "props": {"weight": 10}},
+]
+FEATS: List[Dict[str, Any]] = [
+    {"name": "Actor"},
+    {"name": "Keen Mind"},
+    {"name": "Resilient", "props": {"saving_throw_proficiencies": ["CON"]}},
+    {"name": "Skilled", "props": {"skill_proficiencies": ["Stealth", "Arcana"]}},
+]
+
+
+def league(size: int, seed: int = 0) -> List[models.Character]:
+    """Return ``size`` random characters."""
+    rng = random.Random(seed)
+    chars = []
+    for n in range(size):
+        payload: Dict[str, Any] = {
+            "name": f"Player {n}",
+            "level": rng.randint(1, 20),
+            "module": "fivee_stock",
+            "class": rng.choice(CLASS_NAMES),
+            "abilities": {a: {"name": a, "score": rng.randint(8, 18)} for a in ABILS},
+            "skills": [{"name": "Perception", "ability": "WIS"}] if n % 3 == 0 else [],
+            "items": rng.sample(ITEMS, rng.randint(0, 4)),
+            "feats": rng.sample(FEATS, rng.randint(0, 2)),
+        }
+        if n % 5 == 0:
+            payload["spellcasting"] = {"classes": {"cleric": 3, "warlock": 2}}
+        chars.append(models.Character.model_validate(payload))
+    return chars
+
+
+def scalar_row(out: Dict[str, Any]) -> Dict[str, Any]:
+    """The fields of ``module.derive`` output the roster computes, as ``RosterResult.row``."""
+    blocks = (out.get("spellcasting") or {}).get("classes", [])
+    return {
+        "proficiency_bonus": out["proficiency_bonus"],
+        "ability_mods": out["ability_mods"],
+        "saving_throws": out["saving_throws"],
+        "skills": out["skills"],
+        "ac": out["ac"]["value"],
+        "spell_save_dc": {b["class"]: b["spell_save_dc"] for b in blocks},
+    }
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--characters", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    mod = loader.load_module_by_manifest_id("fivee_stock")
+    chars = league(args.characters, args.seed)
+    Roster.pack(mod, chars[:100]).derive()  # warm the compiled effect caches
+    gc.collect()
+    gc.freeze()
+
+    start = time.perf_counter()
+    scalar = [mod.derive(c) for c in chars]
+    scalar_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    roster = Roster.pack(mod, chars)
+    packed = time.perf_counter()
+    result = roster.derive()
+    done = time.perf_counter()
+
+    for i, out in enumerate(scalar):
+        assert result.row(i) == scalar_row(out), chars[i].name
+
+    n = len(chars)
+    pack_secs, array_secs = packed - start, done - packed
+    print(f"{n} characters, results identical")
+    print(f"{'scalar derive':<16}{n / scalar_secs:>12,.0f} chars/s")
+    print(f"{'roster':<16}{n / (done - start):>12,.0f} chars/s  {scalar_secs / (done - start):.1f}x")
+    print(f"{'  pack':<16}{n / pack_secs:>12,.0f} chars/s")
+    print(f"{'  arrays':<16}{n / array_secs:>12,.0f} chars/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,85 @@
 import json
+import sys
+from pathlib import Path
+
 import click
 
-from dndcs.logger import init_logging
+# Commands that only read data; they do not get a log file.
+READ_ONLY_COMMANDS = {"spells", "profile-startup"}
+
 
 @click.group()
-def main():
+@click.pass_context
+def main(ctx: click.Context):
     """DnDCS CLI."""
+    if ctx.invoked_subcommand in READ_ONLY_COMMANDS:
+        return
     # Configure logging so each run produces a log file and warnings/errors
     # are echoed to the terminal for easier debugging.
+    from dndcs.logger import init_logging
+
     init_logging()
 
 @main.command("ui")
 @click.option("--host", default="127.0.0.1", show_default=True)
 @click.option("--port", default=8000, type=int, show_default=True)
 @click.option("--no-open", is_flag=True, help="Do not auto-open the browser")
-def ui(host: str, port: int, no_open: bool):
+@click.option("--warmup", is_flag=True, help="Fully load the default module before serving")
+@click.option(
+    "--load-workers",
+    default=None,
+    type=int,
+    help="Threads used to import subsystem files during warmup",
+)
+@click.option("--watch", is_flag=True, help="Reload rules modules when their files change")
+@click.option("--watch-interval", default=1.0, type=float, show_default=True, help="Seconds between file checks")
+@click.option(
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    show_default=True,
+    help="Server processes forked after preloading modules (POSIX only)",
+)
+@click.option(
+    "--dispatch-threads",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Threads running derive/validate off the event loop (default: Python's thread pool default)",
+)
+@click.option(
+    "--derive-backend",
+    type=click.Choice(["thread", "process"]),
+    default="thread",
+    show_default=True,
+    help="Run derive/validate in this process or in a pool of worker processes",
+)
+@click.option(
+    "--derive-processes",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Worker processes for --derive-backend process (default: CPU count)",
+)
+@click.option(
+    "--derive-batch",
+    default=16,
+    type=click.IntRange(min=1),
+    show_default=True,
+    help="Maximum requests shipped to a worker process at once",
+)
+def ui(
+    host: str,
+    port: int,
+    no_open: bool,
+    warmup: bool,
+    load_workers: int | None,
+    watch: bool,
+    watch_interval: float,
+    workers: int,
+    dispatch_threads: int | None,
+    derive_backend: str,
+    derive_processes: int | None,
+    derive_batch: int,
+):
     """Start local web UI and open it in your browser."""
     try:
         from dndcs.ui.server import serve
@@ -24,7 +89,20 @@ def ui(host: str, port: int, no_open: bool):
         click.echo('Tip (PowerShell): python -m pip install -e ".[ui]"', err=True)
         click.echo(f"\nImport error: {e}\n{traceback.format_exc()}", err=True)
         sys.exit(1)
-    serve(host=host, port=port, open_browser=(not no_open))
+    serve(
+        host=host,
+        port=port,
+        open_browser=(not no_open),
+        warmup=warmup,
+        load_workers=load_workers,
+        watch=watch,
+        watch_interval=watch_interval,
+        dispatch_threads=dispatch_threads,
+        derive_backend=derive_backend,
+        derive_processes=derive_processes,
+        derive_batch=derive_batch,
+        workers=workers,
+    )
 
 
 @main.group()
@@ -69,5 +147,94 @@ def search_spells(name: str | None, cls: str | None):
         click.echo(f"{sp['name']} (Level {sp['level']} {sp['school']})")
 
 
+@main.group()
+def modules():
+    """Rules module discovery helpers."""
+    pass
+
+
+@modules.command("lock")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Lockfile path (default: $DNDCS_MODULE_LOCK or ./dndcs-modules.lock).",
+)
+@click.option("--check", is_flag=True, help="Verify an existing lockfile instead of writing one.")
+def lock_modules(output: Path | None, check: bool):
+    """Snapshot discovered modules into a lockfile for fast startup."""
+    from dndcs.core.discovery import lockfile_path, read_lockfile, write_lockfile
+
+    target = output or lockfile_path()
+    if check:
+        if read_lockfile(target, verify_hashes=True) is None:
+            click.echo(f"{target} is missing or stale", err=True)
+            sys.exit(1)
+        click.echo(f"{target} is up to date")
+        return
+    data = write_lockfile(target)
+    click.echo(f"Locked {len(data['modules'])} module(s) from {len(data['roots'])} root(s) to {target}")
+
+
+_PROFILE_CHILD = """
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location("dndcs_core.services.profiling", sys.argv[1])
+mod = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = mod
+spec.loader.exec_module(mod)
+mod._child_main(sys.argv[2:])
+"""
+
+
+@main.command("profile-startup")
+@click.option(
+    "--target",
+    type=click.Choice(["cli", "ui", "module"]),
+    default="module",
+    show_default=True,
+    help="What to cold-start: the CLI, the UI server or a module load.",
+)
+@click.option("--module", "module_id", default=None, help="Module id to load (default module if omitted).")
+@click.option("--format", "fmt", type=click.Choice(["text", "json"]), default="text", show_default=True)
+@click.option(
+    "--alloc/--no-alloc",
+    default=True,
+    show_default=True,
+    help="Trace allocations with tracemalloc (slows the measured steps).",
+)
+@click.option("--min-ms", default=0.0, type=float, help="Hide text rows faster than this.")
+def profile_startup(target: str, module_id: str | None, fmt: str, alloc: bool, min_ms: float):
+    """Report a timing/allocation tree for a cold start in a fresh interpreter."""
+    import os
+    import subprocess
+
+    from dndcs_core.services import profiling
+
+    # The profiler is loaded from its file in the child so that importing it
+    # does not pull in the packages being measured.
+    core_dir = Path(profiling.__file__).resolve().parents[2]
+    repo_dir = Path(__file__).resolve().parents[1]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(repo_dir), str(core_dir)] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROFILE_CHILD, profiling.__file__, target, module_id or "", "1" if alloc else "0"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if proc.returncode != 0:
+        click.echo(proc.stderr, err=True)
+        sys.exit(proc.returncode)
+    result = json.loads(proc.stdout)
+    if fmt == "json":
+        click.echo(json.dumps(result, indent=2))
+        return
+    click.echo(f"cold start: {result['target']} (Python {result['python']})")
+    click.echo(profiling.render_text(result["profile"], min_ms=min_ms))
+
+
 if __name__ == "__main__":
     main()
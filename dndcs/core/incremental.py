@@ -0,0 +1,5 @@
+"""Compatibility wrapper for the relocated incremental derivation engine."""
+
+from dndcs_core.services.incremental import *  # noqa: F401,F403
+
+__all__ = [name for name in globals() if not name.startswith("_")]
@@ -0,0 +1,5 @@
+"""Compatibility wrapper for the relocated JSON Patch helpers."""
+
+from dndcs_core.services.jsonpatch import *  # noqa: F401,F403
+
+__all__ = [name for name in globals() if not name.startswith("_")]
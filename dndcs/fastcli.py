@@ -0,0 +1,97 @@
+"""Startup-optimised entry point for the ``dndcs`` command.
+
+Read-only spell lookups are answered straight from the header index of the
+fivee_stock spell catalog without importing click, pydantic, the web stack
+or the logging setup, and without creating a log file.  Everything else
+(including ``--help`` and malformed arguments) is handed to
+:func:`dndcs.cli.main` unchanged, so the output of both paths is identical.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+def _spell_catalog():
+    from dndcs.modules.fivee_stock import _BASE_PATH
+    from dndcs_core.services.catalog import open_catalog
+
+    return open_catalog(_BASE_PATH / "spells" / "spells.jsonl")
+
+
+def _parse_options(args: Sequence[str], names: Tuple[str, ...]) -> Optional[Dict[str, str]]:
+    """Parse ``--opt VALUE``/``--opt=VALUE`` pairs; None if anything else appears."""
+    opts: Dict[str, str] = {}
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        key, sep, value = arg.partition("=")
+        if key not in names:
+            return None
+        if not sep:
+            if i + 1 >= len(args):
+                return None
+            value = args[i + 1]
+            i += 1
+        opts[key] = value
+        i += 1
+    return opts
+
+
+def _print_rows(cat, positions: List[int], fmt: str) -> None:
+    rows = sorted(
+        (cat.value(p, "level"), cat.value(p, "name"), cat.value(p, "school")) for p in positions
+    )
+    out = sys.stdout
+    for level, name, school in rows:
+        out.write(fmt.format(level=level, name=name, school=school) + "\n")
+
+
+def _spells(args: List[str]) -> bool:
+    """Serve a ``spells`` subcommand; return False to defer to click."""
+    if not args or any(a in ("-h", "--help") for a in args):
+        return False
+    cmd, rest = args[0], args[1:]
+    if cmd in ("find", "for-class"):
+        if len(rest) != 1 or rest[0].startswith("-"):
+            return False
+        cat = _spell_catalog()
+        if cmd == "find":
+            pos = cat.lookup("name", str.lower).get(rest[0].lower())
+            if pos is None:
+                sys.stderr.write("Spell not found\n")
+                return True
+            import json
+
+            sys.stdout.write(json.dumps(cat.record(pos), indent=2) + "\n")
+            return True
+        positions = cat.group("classes").get(rest[0].lower(), [])
+        _print_rows(cat, positions, "Level {level}: {name}")
+        return True
+    if cmd == "search":
+        opts = _parse_options(rest, ("--name", "--class"))
+        if opts is None:
+            return False
+        cat = _spell_catalog()
+        cls, name = opts.get("--class"), opts.get("--name")
+        positions = cat.group("classes").get(cls.lower(), []) if cls else list(range(len(cat)))
+        if name:
+            n = name.lower()
+            positions = [p for p in positions if n in cat.value(p, "name").lower()]
+        _print_rows(cat, positions, "{name} (Level {level} {school})")
+        return True
+    return False
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = list(sys.argv[1:] if argv is None else argv)
+    if args and args[0] == "spells" and _spells(args[1:]):
+        return
+    from dndcs.cli import main as cli_main
+
+    cli_main(args, prog_name="dndcs")
+
+
+if __name__ == "__main__":
+    main()
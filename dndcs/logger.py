@@ -1,11 +1,130 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional, cast
 
 _LOG_FILE: Optional[Path] = None
+_QUEUE_HANDLER: Optional["DroppingQueueHandler"] = None
+_LISTENER: Optional["_Listener"] = None
+_HANDLERS: List[logging.Handler] = []
+
+_DEFAULT_QUEUE_SIZE = 10000
+_DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+_DEFAULT_BACKUPS = 5
+_DEFAULT_ROTATE_SECONDS = 24 * 60 * 60
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Hand records to the writer thread without ever blocking the caller.
+
+    When the bounded queue is full, records below ``ERROR`` are dropped;
+    an error or worse replaces the oldest queued record instead.  Dropped
+    records are counted per level name in :attr:`dropped`.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[Any]") -> None:
+        super().__init__(log_queue)
+        self.dropped: Dict[str, int] = {}
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Runs under the handler lock, which also guards ``dropped``.
+        log_queue = cast("queue.Queue[Any]", self.queue)
+        try:
+            log_queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        lost = record
+        if record.levelno >= logging.ERROR:
+            try:
+                oldest = log_queue.get_nowait()
+                if oldest is None:
+                    # The writer's stop sentinel must stay queued.
+                    log_queue.put_nowait(oldest)
+                else:
+                    log_queue.put_nowait(record)
+                    lost = oldest
+            except (queue.Empty, queue.Full):
+                pass
+        self.dropped[lost.levelname] = self.dropped.get(lost.levelname, 0) + 1
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Wait for room rather than fail when the queue is full at exit;
+        # None is QueueListener's sentinel.
+        cast("queue.Queue[Any]", self.queue).put(None)
+
+
+class RotatingLogHandler(RotatingFileHandler):
+    """Roll the log over at ``max_bytes`` or after ``interval`` seconds.
+
+    Forked server workers append to the same file; a worker that finds the
+    file was rolled over by another process reopens it instead of rolling
+    it over again.
+    """
+
+    def __init__(self, filename: Path, max_bytes: int, backups: int, interval: float) -> None:
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+        self.interval = interval
+        self._opened = time.time()
+
+    def _rotated_elsewhere(self, stream: Any) -> bool:
+        try:
+            return os.stat(self.baseFilename).st_ino != os.fstat(stream.fileno()).st_ino
+        except OSError:
+            return True
+
+    def shouldRollover(self, record: logging.LogRecord) -> int:
+        if self.stream is not None and self._rotated_elsewhere(self.stream):
+            self.stream.close()
+            self.stream = self._open()
+            self._opened = time.time()
+            return 0
+        if self.interval > 0 and time.time() - self._opened >= self.interval:
+            return 1
+        return super().shouldRollover(record)
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._opened = time.time()
+
+
+def _int_from_env(name: str, default: int) -> int:
+    env_val = os.getenv(name)
+    try:
+        return int(env_val) if env_val else default
+    except ValueError:
+        return default
+
+
+def _start_listener(log_queue: "queue.Queue[Any]") -> None:
+    global _LISTENER
+    _LISTENER = _Listener(log_queue, *_HANDLERS, respect_handler_level=True)
+    _LISTENER.start()
+
+
+def _restart_after_fork() -> None:
+    # The writer thread does not survive fork(); records the parent had
+    # queued stay with the parent.
+    if _LISTENER is None or _QUEUE_HANDLER is None:
+        return
+    log_queue: "queue.Queue[Any]" = queue.Queue(cast("queue.Queue[Any]", _QUEUE_HANDLER.queue).maxsize)
+    _QUEUE_HANDLER.queue = log_queue
+    _QUEUE_HANDLER.dropped = {}
+    _start_listener(log_queue)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
 
 def init_logging(log_dir: str | Path = "logs", console_level: int = logging.WARNING) -> Path:
     """Initialize application-wide logging.
@@ -13,8 +132,15 @@ def init_logging(log_dir: str | Path = "logs", console_level: int = logging.WARN
     Creates a timestamped log file in ``log_dir`` and attaches handlers
     to the ``dndcs`` root logger. Further calls are ignored and simply
     return the path to the previously created log file.
+
+    Callers only put records on a bounded queue (``DNDCS_LOG_QUEUE_SIZE``,
+    default 10000); a background thread writes them to the console and
+    to the file, which is rolled over at ``DNDCS_LOG_MAX_BYTES`` (default
+    10 MiB) or every ``DNDCS_LOG_ROTATE_SECONDS`` (default one day),
+    keeping ``DNDCS_LOG_BACKUPS`` old files (default 5).  ``0`` disables
+    the size or time limit.
     """
-    global _LOG_FILE
+    global _LOG_FILE, _QUEUE_HANDLER
     if _LOG_FILE is not None:
         return _LOG_FILE
 
@@ -25,16 +151,26 @@ def init_logging(log_dir: str | Path = "logs", console_level: int = logging.WARN
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
 
-    file_handler = logging.FileHandler(_LOG_FILE, encoding="utf-8")
+    file_handler = RotatingLogHandler(
+        _LOG_FILE,
+        max_bytes=_int_from_env("DNDCS_LOG_MAX_BYTES", _DEFAULT_MAX_BYTES),
+        backups=_int_from_env("DNDCS_LOG_BACKUPS", _DEFAULT_BACKUPS),
+        interval=_int_from_env("DNDCS_LOG_ROTATE_SECONDS", _DEFAULT_ROTATE_SECONDS),
+    )
     file_handler.setLevel(logging.DEBUG)
     fmt = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
     file_handler.setFormatter(fmt)
-    root_logger.addHandler(file_handler)
 
     console_handler = logging.StreamHandler()
     console_handler.setLevel(console_level)
     console_handler.setFormatter(fmt)
-    root_logger.addHandler(console_handler)
+
+    _HANDLERS[:] = [file_handler, console_handler]
+    log_queue: "queue.Queue[Any]" = queue.Queue(max(1, _int_from_env("DNDCS_LOG_QUEUE_SIZE", _DEFAULT_QUEUE_SIZE)))
+    _QUEUE_HANDLER = DroppingQueueHandler(log_queue)
+    _start_listener(log_queue)
+    root_logger.addHandler(_QUEUE_HANDLER)
+    atexit.register(stop_logging)
 
     for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
         logging.getLogger(name).handlers.clear()
@@ -44,6 +180,33 @@ def init_logging(log_dir: str | Path = "logs", console_level: int = logging.WARN
     return _LOG_FILE
 
 
+def stop_logging() -> None:
+    """Write out everything queued and stop the writer thread.
+
+    Called at interpreter exit; processes leaving through ``os._exit``
+    must call it themselves.
+    """
+    global _LISTENER
+    listener, _LISTENER = _LISTENER, None
+    if listener is not None:
+        listener.stop()
+    for handler in _HANDLERS:
+        handler.flush()
+
+
+def logging_stats() -> Dict[str, Any]:
+    """Queue depth and dropped record counts; empty before :func:`init_logging`."""
+    if _QUEUE_HANDLER is None:
+        return {}
+    log_queue = cast("queue.Queue[Any]", _QUEUE_HANDLER.queue)
+    return {
+        "file": str(_LOG_FILE),
+        "queued": log_queue.qsize(),
+        "capacity": log_queue.maxsize,
+        "dropped": dict(_QUEUE_HANDLER.dropped),
+    }
+
+
 def get_logger(name: str) -> logging.Logger:
     """Return a logger namespaced under ``dndcs``."""
-    return logging.getLogger(f"dndcs.{name}")
\ No newline at end of file
+    return logging.getLogger(f"dndcs.{name}")
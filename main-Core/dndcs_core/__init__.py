@@ -7,6 +7,15 @@ repository layout to follow the feature-first structure mandated in
 ``AGENTS.md``.
 """
 
-from . import domain, services
+from importlib import import_module
+from typing import Any
 
 __all__ = ["domain", "services"]
+
+
+def __getattr__(name: str) -> Any:
+    # Subpackages are imported on first use so that light-weight helpers
+    # (for example ``dndcs_core.services.catalog``) do not pay for pydantic.
+    if name in __all__:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,22 @@
 """Service layer utilities for the DnDCS core engine."""
 
-from . import discovery, loader, module_base, registry
+from importlib import import_module
+from typing import Any
 
-__all__ = ["discovery", "loader", "module_base", "registry"]
+__all__ = [
+    "catalog",
+    "discovery",
+    "loader",
+    "module_base",
+    "module_objects",
+    "profiling",
+    "registry",
+    "watcher",
+]
+
+
+def __getattr__(name: str) -> Any:
+    # Imported on first use; see ``dndcs_core.__getattr__``.
+    if name in __all__:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
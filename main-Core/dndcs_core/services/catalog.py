@@ -0,0 +1,223 @@
+"""Memory-mapped, offset-indexed JSON-lines catalogs for bulky rules data.
+
+A catalog file starts with a one-line JSON header followed by one JSON
+record per line::
+
+    {"format": "dndcs-catalog", "version": 1, "fields": ["name", ...],
+     "index": [[offset, length, name, ...], ...]}
+    {"name": "Acid Arrow", ...}
+    ...
+
+The header lists the byte span of every record together with a few small
+index fields so that lookups and filters never decode the records
+themselves.  Records are decoded on first access and then kept.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import threading
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+FORMAT = "dndcs-catalog"
+VERSION = 1
+
+
+def write_catalog(
+    path: Path,
+    records: Iterable[Dict[str, Any]],
+    fields: List[str],
+    extra: Optional[List[Dict[str, Any]]] = None,
+) -> int:
+    """Write ``records`` to ``path`` indexing the given top-level ``fields``.
+
+    ``extra`` optionally supplies, per record, index values that are not
+    part of the record itself (for example the group an item belongs to).
+    Returns the number of records written.
+    """
+    records = list(records)
+    lines = [
+        json.dumps(rec, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        for rec in records
+    ]
+    rows = []
+    for i, (line, rec) in enumerate(zip(lines, records)):
+        values = dict(rec, **(extra[i] if extra else {}))
+        rows.append([0, len(line)] + [values.get(f) for f in fields])
+
+    def _header() -> bytes:
+        head = {"format": FORMAT, "version": VERSION, "fields": fields, "index": rows}
+        return json.dumps(head, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+    # Offsets depend on the header length, which depends on the offsets;
+    # iterate until the header size settles (normally twice).
+    size = -1
+    header = _header()
+    while len(header) != size:
+        size = len(header)
+        offset = size
+        for row, line in zip(rows, lines):
+            row[0] = offset
+            offset += len(line) + 1
+        header = _header()
+    tmp = Path(path).with_name(Path(path).name + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(header)
+        for line in lines:
+            fh.write(line + b"\n")
+    os.replace(tmp, path)
+    return len(lines)
+
+
+class Catalog:
+    """Read-only view of a catalog file mapped into memory."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        end = self._mm.find(b"\n")
+        header = json.loads(self._mm[: end if end >= 0 else len(self._mm)])
+        if header.get("format") != FORMAT or header.get("version") != VERSION:
+            raise ValueError(f"{self.path} is not a {FORMAT} v{VERSION} file")
+        self.fields: List[str] = list(header["fields"])
+        self._index: List[List[Any]] = header["index"]
+        self._records: List[Optional[Dict[str, Any]]] = [None] * len(self._index)
+        self._lookups: Dict[Tuple[str, Optional[Callable]], Dict[Any, int]] = {}
+        self._groups: Dict[Tuple[str, Optional[Callable]], Dict[Any, List[int]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def record(self, pos: int) -> Dict[str, Any]:
+        """Decode (once) and return the record at position ``pos``."""
+        rec = self._records[pos]
+        if rec is None:
+            off, length = self._index[pos][0], self._index[pos][1]
+            rec = json.loads(self._mm[off : off + length])
+            self._records[pos] = rec
+        return rec
+
+    def value(self, pos: int, field: str) -> Any:
+        """Return an indexed field of a record without decoding it."""
+        return self._index[pos][2 + self.fields.index(field)]
+
+    def decoded(self) -> int:
+        """Number of records decoded so far."""
+        return sum(1 for r in self._records if r is not None)
+
+    def lookup(self, field: str, key: Optional[Callable[[Any], Any]] = None) -> Dict[Any, int]:
+        """Map ``key(value)`` of a unique indexed field to record positions."""
+        cache_key = (field, key)
+        table = self._lookups.get(cache_key)
+        if table is None:
+            col = 2 + self.fields.index(field)
+            with self._lock:
+                table = {
+                    (key(row[col]) if key else row[col]): pos for pos, row in enumerate(self._index)
+                }
+                self._lookups[cache_key] = table
+        return table
+
+    def group(self, field: str, key: Optional[Callable[[Any], Any]] = None) -> Dict[Any, List[int]]:
+        """Group record positions by an indexed field; list values fan out."""
+        cache_key = (field, key)
+        table = self._groups.get(cache_key)
+        if table is None:
+            col = 2 + self.fields.index(field)
+            built: Dict[Any, List[int]] = {}
+            for pos, row in enumerate(self._index):
+                values = row[col] if isinstance(row[col], list) else [row[col]]
+                for v in values:
+                    built.setdefault(key(v) if key else v, []).append(pos)
+            with self._lock:
+                table = self._groups.setdefault(cache_key, built)
+        return table
+
+    def view(self, positions: Optional[List[int]] = None) -> "CatalogView":
+        return CatalogView(self, positions)
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+class CatalogView(Sequence):
+    """Lazy sequence of catalog records; items are decoded when accessed."""
+
+    def __init__(self, catalog: Catalog, positions: Optional[List[int]] = None) -> None:
+        self._catalog = catalog
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions) if self._positions is not None else len(self._catalog)
+
+    def __getitem__(self, i):  # type: ignore[override]
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        pos = self._positions[i] if self._positions is not None else range(len(self._catalog))[i]
+        return self._catalog.record(pos)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        positions = self._positions if self._positions is not None else range(len(self._catalog))
+        for pos in positions:
+            yield self._catalog.record(pos)
+
+    def __add__(self, other: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return list(self) + list(other)
+
+    def __repr__(self) -> str:
+        return f"<CatalogView {self._catalog.path.name} [{len(self)} records]>"
+
+    def positions(self) -> List[int]:
+        return list(self._positions) if self._positions is not None else list(range(len(self._catalog)))
+
+    def filter(self, field: str, pred: Callable[[Any], bool]) -> "CatalogView":
+        """Return the records whose indexed ``field`` satisfies ``pred``."""
+        return CatalogView(
+            self._catalog, [p for p in self.positions() if pred(self._catalog.value(p, field))]
+        )
+
+
+class CatalogMapping(Mapping):
+    """Lazy mapping from an index key to a record or a view of records."""
+
+    def __init__(self, catalog: Catalog, table: Dict[Any, Any]) -> None:
+        self._catalog = catalog
+        self._table = table
+
+    def __getitem__(self, key: Any):
+        pos = self._table[key]
+        if isinstance(pos, list):
+            return self._catalog.view(pos)
+        return self._catalog.record(pos)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._table
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._table)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
+_OPEN: Dict[str, Tuple[int, Catalog]] = {}
+_OPEN_LOCK = threading.Lock()
+
+
+def open_catalog(path: Path) -> Catalog:
+    """Return a shared :class:`Catalog` for ``path``, reopening it after edits."""
+    resolved = str(Path(path).resolve())
+    mtime = os.stat(resolved).st_mtime_ns
+    with _OPEN_LOCK:
+        cached = _OPEN.get(resolved)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        cat = Catalog(Path(resolved))
+        _OPEN[resolved] = (mtime, cat)
+        return cat
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+from .profiling import span
+
 
 def _read_manifest(manifest_path: Path) -> Dict[str, Any]:
-    man = yaml.safe_load(manifest_path.read_text(encoding="utf-8")) or {}
+    with span(f"parse {manifest_path}"):
+        man = yaml.safe_load(manifest_path.read_text(encoding="utf-8")) or {}
     man["__manifest_dir__"] = str(manifest_path.parent)
     return man
 
@@ -53,7 +60,47 @@ def _user_modules_root() -> Path:
         return Path(os.getenv("XDG_CONFIG_HOME", Path.home() / ".config")) / "dndcs" / "modules"
 
 
-def module_search_paths(extra: Optional[List[Path]] = None) -> List[Path]:
+_ROOTS: Optional[Tuple[Tuple[Optional[str], ...], List[Path]]] = None
+
+_DEFAULT_REVALIDATE_INTERVAL = 1.0
+
+
+def revalidate_interval() -> float:
+    """Seconds between filesystem checks of the index and cached modules.
+
+    Read from ``DNDCS_REVALIDATE_INTERVAL`` (default 1.0); ``0`` checks on
+    every lookup.  Empty or invalid values fall back to the default.
+    """
+    env_val = os.getenv("DNDCS_REVALIDATE_INTERVAL")
+    try:
+        return max(0.0, float(env_val)) if env_val else _DEFAULT_REVALIDATE_INTERVAL
+    except ValueError:
+        return _DEFAULT_REVALIDATE_INTERVAL
+
+
+def _roots_key() -> Tuple[Optional[str], ...]:
+    # Everything the search roots are derived from, besides existence checks.
+    return (
+        os.getcwd(),
+        os.getenv("DNDCS_MODULE_PATH"),
+        os.getenv("APPDATA"),
+        os.getenv("XDG_CONFIG_HOME"),
+        os.getenv("HOME"),
+    )
+
+
+def module_search_paths(extra: Optional[List[Path]] = None, refresh: bool = False) -> List[Path]:
+    """Return the resolved module search roots in priority order.
+
+    The result is memoized until the working directory or a relevant
+    environment variable changes; ``refresh`` re-resolves it, which also
+    picks up repository roots created since.
+    """
+    global _ROOTS
+    key = _roots_key()
+    cached = _ROOTS
+    if extra is None and not refresh and cached is not None and cached[0] == key:
+        return list(cached[1])
     paths: List[Path] = []
     paths.append(_dropin_mods_root())
     env = os.getenv("DNDCS_MODULE_PATH")
@@ -76,6 +123,8 @@ def module_search_paths(extra: Optional[List[Path]] = None) -> List[Path]:
         if rp not in seen:
             uniq.append(rp)
             seen.add(rp)
+    if extra is None:
+        _ROOTS = (key, list(uniq))
     return uniq
 
 
@@ -85,8 +134,260 @@ def discover_modules(modules_dir: Optional[Path] = None) -> List[Dict[str, Any]]
     for root in roots:
         if not root.exists():
             continue
-        for mfile in root.glob("*/manifest.yaml"):
+        for mfile in sorted(root.glob("*/manifest.yaml")):
             man = _read_manifest(mfile)
             man["__root__"] = str(root)
             manifests.append(man)
     return manifests
+
+
+def _dir_mtime(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _listing_entry(man: Dict[str, Any]) -> Dict[str, Any]:
+    entry = {
+        "id": man.get("id"),
+        "name": man.get("name"),
+        "version": man.get("version"),
+        "description": man.get("description", ""),
+    }
+    icon_rel = man.get("icon")
+    if icon_rel:
+        entry["icon"] = f"/mods/{man['id']}/assets/{icon_rel.split('assets/')[-1]}"
+    return entry
+
+
+class ModuleIndex:
+    """Id-keyed index over the manifests found in the module search roots.
+
+    Roots are scanned once in search order.  When several roots provide the
+    same id the first one wins, mirroring how the loader resolves modules;
+    the losing manifest directories are recorded in ``shadowed``.  The
+    index remembers the mtime of every root so :meth:`is_stale` can tell
+    whether a module folder was added or removed without globbing again.
+    """
+
+    def __init__(self, roots: Optional[List[Path]] = None, scan: bool = True) -> None:
+        self.roots: List[Path] = list(roots) if roots is not None else module_search_paths()
+        self.entries: List[Dict[str, Any]] = []
+        self.manifests: Dict[str, Dict[str, Any]] = {}
+        self.asset_roots: Dict[str, Path] = {}
+        self.shadowed: Dict[str, List[str]] = {}
+        self._root_mtimes: Tuple[int, ...] = ()
+        self._listing: Optional[List[Dict[str, Any]]] = None
+        if scan:
+            self._scan()
+
+    @classmethod
+    def from_lockfile(
+        cls, path: Optional[Path] = None, roots: Optional[List[Path]] = None
+    ) -> Optional["ModuleIndex"]:
+        """Build an index from a lockfile, or return ``None`` if it is stale.
+
+        See :func:`read_lockfile` for the checks performed.
+        """
+        data = read_lockfile(path, roots)
+        if data is None:
+            return None
+        index = cls([Path(r["path"]) for r in data["roots"]], scan=False)
+        index._root_mtimes = tuple(int(r["mtime_ns"]) for r in data["roots"])
+        for rec in data["modules"]:
+            index._add(rec["manifest"])
+        return index
+
+    def _scan(self) -> None:
+        self._root_mtimes = tuple(_dir_mtime(root) for root in self.roots)
+        for root in self.roots:
+            if not root.exists():
+                continue
+            with span(f"scan {root}"):
+                for man in discover_modules(root):
+                    self._add(man)
+
+    def _add(self, man: Dict[str, Any]) -> None:
+        self.entries.append(man)
+        mod_id = man.get("id")
+        if not mod_id:
+            return
+        if mod_id in self.manifests:
+            self.shadowed.setdefault(mod_id, []).append(man["__manifest_dir__"])
+            return
+        self.manifests[mod_id] = man
+        assets = Path(man["__manifest_dir__"]) / "assets"
+        if assets.is_dir():
+            self.asset_roots[mod_id] = assets
+
+    def __contains__(self, module_id: object) -> bool:
+        return module_id in self.manifests
+
+    def __len__(self) -> int:
+        return len(self.manifests)
+
+    def get(self, module_id: str) -> Optional[Dict[str, Any]]:
+        """Return the winning manifest for ``module_id`` or ``None``."""
+        return self.manifests.get(module_id)
+
+    def ids(self) -> List[str]:
+        return list(self.manifests)
+
+    def asset_root(self, module_id: str) -> Optional[Path]:
+        """Return the ``assets`` directory of ``module_id`` if it has one."""
+        return self.asset_roots.get(module_id)
+
+    def listing(self) -> List[Dict[str, Any]]:
+        """Return the public module summaries served by ``/api/modules``."""
+        if self._listing is None:
+            self._listing = [_listing_entry(man) for man in self.manifests.values()]
+        return self._listing
+
+    def reload(self, module_id: str) -> Optional[Dict[str, Any]]:
+        """Re-read the manifest of ``module_id`` from disk after an edit."""
+        man = self.manifests.get(module_id)
+        if man is None:
+            return None
+        mfile = Path(man["__manifest_dir__"]) / "manifest.yaml"
+        if not mfile.exists():
+            return None
+        fresh = _read_manifest(mfile)
+        fresh["__root__"] = man.get("__root__")
+        if fresh.get("id") != module_id:
+            return None
+        self.manifests[module_id] = fresh
+        self._listing = None
+        return fresh
+
+    def is_stale(self, roots: Optional[List[Path]] = None) -> bool:
+        """Return True if the search roots or their contents have changed."""
+        current = roots if roots is not None else module_search_paths()
+        if current != self.roots:
+            return True
+        return tuple(_dir_mtime(root) for root in self.roots) != self._root_mtimes
+
+
+LOCKFILE_NAME = "dndcs-modules.lock"
+LOCKFILE_VERSION = 1
+
+
+def lockfile_path() -> Path:
+    """Return the discovery lockfile location.
+
+    ``DNDCS_MODULE_LOCK`` overrides the default ``dndcs-modules.lock`` in the
+    current working directory.
+    """
+    env_val = os.getenv("DNDCS_MODULE_LOCK")
+    return Path(env_val).expanduser() if env_val else Path.cwd() / LOCKFILE_NAME
+
+
+def _file_state(path: Path) -> Tuple[int, str]:
+    data = path.read_bytes()
+    return path.stat().st_mtime_ns, hashlib.sha256(data).hexdigest()
+
+
+def write_lockfile(path: Optional[Path] = None, roots: Optional[List[Path]] = None) -> Dict[str, Any]:
+    """Scan every root and snapshot the result into a lockfile.
+
+    The lockfile records each resolved root with its mtime and every
+    manifest (shadowed ones included, in scan order) with the mtime and
+    SHA-256 of its ``manifest.yaml``.  Returns the written data.
+    """
+    index = ModuleIndex(roots)
+    modules = []
+    for man in index.entries:
+        mtime, digest = _file_state(Path(man["__manifest_dir__"]) / "manifest.yaml")
+        modules.append({"manifest": man, "mtime_ns": mtime, "sha256": digest})
+    data = {
+        "version": LOCKFILE_VERSION,
+        "roots": [
+            {"path": str(root), "mtime_ns": mtime}
+            for root, mtime in zip(index.roots, index._root_mtimes)
+        ],
+        "modules": modules,
+    }
+    target = path or lockfile_path()
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+    os.replace(tmp, target)
+    return data
+
+
+def read_lockfile(
+    path: Optional[Path] = None, roots: Optional[List[Path]] = None, verify_hashes: bool = False
+) -> Optional[Dict[str, Any]]:
+    """Load a lockfile if it still describes the current module roots.
+
+    The cheap checks compare the root list and root directory mtimes, then
+    stat each recorded ``manifest.yaml``.  ``verify_hashes`` additionally
+    re-hashes every manifest.  Returns ``None`` when the lockfile is
+    missing, unreadable or stale.
+    """
+    target = path or lockfile_path()
+    try:
+        data = json.loads(target.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != LOCKFILE_VERSION:
+        return None
+    current = roots if roots is not None else module_search_paths()
+    locked = data.get("roots") or []
+    if [str(p) for p in current] != [r.get("path") for r in locked]:
+        return None
+    for rec in locked:
+        if _dir_mtime(Path(rec["path"])) != rec.get("mtime_ns"):
+            return None
+    for rec in data.get("modules") or []:
+        mfile = Path(rec["manifest"]["__manifest_dir__"]) / "manifest.yaml"
+        try:
+            if mfile.stat().st_mtime_ns != rec.get("mtime_ns"):
+                return None
+            if verify_hashes and _file_state(mfile)[1] != rec.get("sha256"):
+                return None
+        except OSError:
+            return None
+    return data
+
+
+_INDEX: Optional[ModuleIndex] = None
+_INDEX_CHECKED = 0.0
+_INDEX_LOCK = threading.Lock()
+
+
+def get_module_index(refresh: bool = False) -> ModuleIndex:
+    """Return the process-wide :class:`ModuleIndex`, rebuilding it if stale.
+
+    The first build uses the discovery lockfile when it is still valid and
+    falls back to a full scan otherwise.  Root mtimes are re-checked at most
+    every :func:`revalidate_interval` seconds; a change of search roots is
+    noticed immediately.
+    """
+    global _INDEX, _INDEX_CHECKED
+    roots = module_search_paths()
+    now = time.monotonic()
+    index = _INDEX
+    if (
+        not refresh
+        and index is not None
+        and index.roots == roots
+        and now - _INDEX_CHECKED < revalidate_interval()
+    ):
+        return index
+    with _INDEX_LOCK:
+        roots = module_search_paths(refresh=True)
+        if _INDEX is None and not refresh:
+            with span("read lockfile"):
+                _INDEX = ModuleIndex.from_lockfile(roots=roots)
+        if refresh or _INDEX is None or _INDEX.is_stale(roots):
+            _INDEX = ModuleIndex(roots)
+        _INDEX_CHECKED = now
+        return _INDEX
+
+
+def invalidate_module_index() -> None:
+    """Force the next :func:`get_module_index` call to rescan every root."""
+    global _INDEX, _ROOTS
+    with _INDEX_LOCK:
+        _INDEX = None
+        _ROOTS = None
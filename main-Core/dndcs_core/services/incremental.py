@@ -0,0 +1,215 @@
+"""Incremental derivation driven by JSON Patch edits.
+
+A module that wants cheap edits describes its ``derive`` as a
+:class:`DerivePlan`: a list of named :class:`Stage` functions, each
+declaring the top-level character members it reads (``inputs``, by their
+JSON names) and the earlier stages whose results it uses (``needs``).
+:func:`derive_incremental` applies an RFC 6902 patch to the character a
+:class:`DeriveState` was computed from, re-validates only the members (or
+list and mapping elements) the patch touched and reruns only the stages
+that depend on them.  A rerun stage whose result compares equal to the
+previous one does not invalidate the stages after it.
+
+Modules without a plan still work: their ``derive`` is simply rerun on the
+patched character.
+"""
+
+from __future__ import annotations
+
+import logging
+import typing
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import TypeAdapter
+
+from ..domain.models import Character
+from .jsonpatch import Changes, apply_patch
+
+log = logging.getLogger("dndcs.core.incremental")
+
+# character member JSON name -> model field name
+_FIELDS: Dict[str, str] = {(f.alias or name): name for name, f in Character.model_fields.items()}
+_ELEMENT_ADAPTERS: Dict[str, Optional[TypeAdapter]] = {}
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One step of a :class:`DerivePlan`.
+
+    ``fn(char, results)`` computes the stage from the character and the
+    results of earlier stages.  With ``each`` (a list member, which must
+    also be an input), ``fn(element, results)`` is called per element
+    instead and ``combine(parts, results)`` builds the stage result, so
+    editing one element only recomputes that element's part.
+    """
+
+    name: str
+    fn: Callable[[Any, Dict[str, Any]], Any]
+    inputs: Tuple[str, ...] = ()
+    needs: Tuple[str, ...] = ()
+    each: Optional[str] = None
+    combine: Optional[Callable[[List[Any], Dict[str, Any]], Any]] = None
+
+
+class DerivePlan:
+    """Ordered stages plus ``assemble``, which builds the derive output from their results."""
+
+    def __init__(self, stages: Sequence[Stage], assemble: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
+        seen: set[str] = set()
+        for stage in stages:
+            missing = [n for n in stage.needs if n not in seen]
+            if missing:
+                raise ValueError(f"Stage {stage.name!r} needs {missing} which must come before it")
+            if stage.each is not None and (stage.each not in stage.inputs or stage.combine is None):
+                raise ValueError(f"Stage {stage.name!r} maps over {stage.each!r}: list it in inputs and give combine")
+            seen.add(stage.name)
+        self.stages = tuple(stages)
+        self.assemble = assemble
+
+    def run(self, char: Character) -> Tuple[Dict[str, Any], Dict[str, List[Any]]]:
+        """Compute every stage; return the results and the per-element parts."""
+        results: Dict[str, Any] = {}
+        parts: Dict[str, List[Any]] = {}
+        for stage in self.stages:
+            if stage.each is None:
+                results[stage.name] = stage.fn(char, results)
+                continue
+            assert stage.combine is not None
+            parts[stage.name] = [stage.fn(e, results) for e in getattr(char, _FIELDS[stage.each])]
+            results[stage.name] = stage.combine(parts[stage.name], results)
+        return results, parts
+
+    def rerun(
+        self, char: Character, previous: "DeriveState", changes: Changes
+    ) -> Tuple[Dict[str, Any], Dict[str, List[Any]], List[str]]:
+        """Recompute the stages affected by ``changes``, reusing the rest of ``previous``.
+
+        Returns the results, the per-element parts and the names of the
+        stages that were rerun.
+        """
+        results: Dict[str, Any] = {}
+        parts: Dict[str, List[Any]] = {}
+        dirty: set[str] = set()
+        rerun: List[str] = []
+        for stage in self.stages:
+            if changes.keys().isdisjoint(stage.inputs) and dirty.isdisjoint(stage.needs):
+                results[stage.name] = previous.results[stage.name]
+                if stage.each is not None:
+                    parts[stage.name] = previous.parts[stage.name]
+                continue
+            rerun.append(stage.name)
+            if stage.each is None:
+                value = stage.fn(char, results)
+            else:
+                assert stage.combine is not None
+                elements = getattr(char, _FIELDS[stage.each])
+                old_parts = previous.parts[stage.name]
+                keys = changes.get(stage.each)
+                everything = (
+                    keys is None
+                    or len(old_parts) != len(elements)
+                    or not dirty.isdisjoint(stage.needs)
+                    or any(m in changes for m in stage.inputs if m != stage.each)
+                )
+                if everything:
+                    new_parts = [stage.fn(e, results) for e in elements]
+                else:
+                    new_parts = list(old_parts)
+                    for key in keys or ():
+                        new_parts[int(key)] = stage.fn(elements[int(key)], results)
+                parts[stage.name] = new_parts
+                value = stage.combine(new_parts, results)
+            old = previous.results[stage.name]
+            if value == old:
+                value = old
+            else:
+                dirty.add(stage.name)
+            results[stage.name] = value
+        return results, parts, rerun
+
+
+@dataclass
+class DeriveState:
+    """Everything needed to apply the next patch: treat as immutable."""
+
+    payload: Dict[str, Any]
+    char: Character
+    output: Dict[str, Any]
+    results: Dict[str, Any] = field(default_factory=dict)
+    parts: Dict[str, List[Any]] = field(default_factory=dict)
+    rerun: List[str] = field(default_factory=list)
+
+
+def _as_dict(derived: Any) -> Dict[str, Any]:
+    return derived.model_dump() if hasattr(derived, "model_dump") else dict(derived)
+
+
+def derive_state(module: Any, payload: Dict[str, Any]) -> DeriveState:
+    """Derive ``payload`` from scratch and keep what later patches need."""
+    char = Character.model_validate(payload)
+    plan: Optional[DerivePlan] = getattr(module, "derive_plan", None)
+    if plan is None:
+        return DeriveState(payload, char, _as_dict(module.derive(char)))
+    results, parts = plan.run(char)
+    return DeriveState(payload, char, plan.assemble(results), results, parts, [s.name for s in plan.stages])
+
+
+def _element_adapter(name: str) -> Optional[TypeAdapter]:
+    """Validator for one element of list or dict field ``name``, else None."""
+    if name not in _ELEMENT_ADAPTERS:
+        annotation = Character.model_fields[name].annotation
+        origin = typing.get_origin(annotation)
+        args = typing.get_args(annotation)
+        adapter = None
+        if origin is list and args:
+            adapter = TypeAdapter(args[0])
+        elif origin is dict and len(args) == 2:
+            adapter = TypeAdapter(args[1])
+        _ELEMENT_ADAPTERS[name] = adapter
+    return _ELEMENT_ADAPTERS[name]
+
+
+def _revalidate(char: Character, payload: Dict[str, Any], changes: Changes) -> Character:
+    updated = char.model_copy()
+    validator = Character.__pydantic_validator__
+    for member, keys in sorted(changes.items()):
+        name = _FIELDS.get(member)
+        if name is None:
+            continue  # not part of the model; ignored like on a full parse
+        adapter = _element_adapter(name) if keys is not None and member in payload else None
+        if adapter is not None and keys is not None:
+            container = getattr(char, name).copy()
+            for key in keys:
+                index = int(key) if isinstance(container, list) else key
+                container[index] = adapter.validate_python(payload[member][index])
+            setattr(updated, name, container)
+            continue
+        if member in payload:
+            value = payload[member]
+        else:
+            info = Character.model_fields[name]
+            if info.is_required():
+                raise ValueError(f"{member}: field required")
+            value = info.get_default(call_default_factory=True)
+        validator.validate_assignment(updated, name, value)
+    return updated
+
+
+def derive_incremental(module: Any, previous_state: DeriveState, patch: Any) -> DeriveState:
+    """Apply ``patch`` to the character behind ``previous_state`` and derive it.
+
+    Raises :class:`~.jsonpatch.InvalidPatch` for patches that are malformed
+    or do not apply, and :class:`ValueError` (a pydantic ``ValidationError``)
+    when the patched character is invalid.
+    """
+    payload, changes = apply_patch(previous_state.payload, patch)
+    if not isinstance(payload, dict):
+        raise ValueError("the patched character must be a JSON object")
+    plan: Optional[DerivePlan] = getattr(module, "derive_plan", None)
+    if changes is None or "module" in changes or plan is None or not previous_state.results:
+        return derive_state(module, payload)
+    char = _revalidate(previous_state.char, payload, changes)
+    results, parts, rerun = plan.rerun(char, previous_state, changes)
+    log.debug("derive_incremental: %s changed, reran %s", sorted(changes), rerun)
+    return DeriveState(payload, char, plan.assemble(results), results, parts, rerun)
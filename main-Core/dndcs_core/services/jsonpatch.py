@@ -0,0 +1,182 @@
+"""RFC 6902 JSON Patch for character documents.
+
+:func:`apply_patch` never modifies its input.  Containers along each
+patched path are copied and everything else is shared with the original,
+so patching one field of a large character costs little more than the
+depth of the path.  It also reports which top-level members, and which
+of their elements, were touched; :mod:`.incremental` uses that to decide
+what to re-validate and recompute.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+OPS = ("add", "remove", "replace", "move", "copy", "test")
+
+# top-level member -> keys of the elements that changed, or None when the
+# member changed as a whole (including elements being added or removed)
+Changes = Dict[str, Optional[Set[str]]]
+
+
+class InvalidPatch(ValueError):
+    """The patch document itself is malformed."""
+
+
+class PatchConflict(InvalidPatch):
+    """A well-formed operation does not apply to the document (or a ``test`` failed)."""
+
+
+def parse_pointer(pointer: Any) -> List[str]:
+    """Split an RFC 6901 JSON Pointer into unescaped reference tokens."""
+    if not isinstance(pointer, str):
+        raise InvalidPatch(f"JSON Pointer must be a string, not {type(pointer).__name__}")
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise InvalidPatch(f"JSON Pointer {pointer!r} must start with '/'")
+    return [t.replace("~1", "/").replace("~0", "~") for t in pointer[1:].split("/")]
+
+
+def _index(container: List[Any], token: str, pointer: str, append: bool = False) -> int:
+    if append and token == "-":
+        return len(container)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise PatchConflict(f"{pointer!r}: {token!r} is not an array index")
+    idx = int(token)
+    if idx > len(container) or (idx == len(container) and not append):
+        raise PatchConflict(f"{pointer!r}: index {idx} is out of range")
+    return idx
+
+
+def _get(doc: Any, tokens: List[str], pointer: str) -> Any:
+    for token in tokens:
+        if isinstance(doc, dict):
+            if token not in doc:
+                raise PatchConflict(f"{pointer!r}: member {token!r} does not exist")
+            doc = doc[token]
+        elif isinstance(doc, list):
+            doc = doc[_index(doc, token, pointer)]
+        else:
+            raise PatchConflict(f"{pointer!r}: cannot index into a {type(doc).__name__}")
+    return doc
+
+
+def _parent(root: Any, tokens: List[str], pointer: str) -> Tuple[Any, Any]:
+    """Return ``(new_root, parent)`` with every container down to the parent copied."""
+    new_root = root.copy() if isinstance(root, (dict, list)) else root
+    parent = new_root
+    for token in tokens[:-1]:
+        if isinstance(parent, dict):
+            if token not in parent:
+                raise PatchConflict(f"{pointer!r}: member {token!r} does not exist")
+            key: Any = token
+        elif isinstance(parent, list):
+            key = _index(parent, token, pointer)
+        else:
+            raise PatchConflict(f"{pointer!r}: cannot index into a {type(parent).__name__}")
+        child = parent[key]
+        if not isinstance(child, (dict, list)):
+            raise PatchConflict(f"{pointer!r}: cannot index into a {type(child).__name__}")
+        child = child.copy()
+        parent[key] = child
+        parent = child
+    return new_root, parent
+
+
+def _add(doc: Any, tokens: List[str], value: Any, pointer: str) -> Any:
+    if not tokens:
+        return value
+    doc, parent = _parent(doc, tokens, pointer)
+    token = tokens[-1]
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_index(parent, token, pointer, append=True), value)
+    else:
+        raise PatchConflict(f"{pointer!r}: cannot add to a {type(parent).__name__}")
+    return doc
+
+
+def _remove(doc: Any, tokens: List[str], pointer: str) -> Tuple[Any, Any]:
+    if not tokens:
+        raise PatchConflict("cannot remove the whole document")
+    doc, parent = _parent(doc, tokens, pointer)
+    token = tokens[-1]
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise PatchConflict(f"{pointer!r}: member {token!r} does not exist")
+        return doc, parent.pop(token)
+    if isinstance(parent, list):
+        return doc, parent.pop(_index(parent, token, pointer))
+    raise PatchConflict(f"{pointer!r}: cannot remove from a {type(parent).__name__}")
+
+
+def _field(op: Dict[str, Any], name: str) -> Any:
+    if name not in op:
+        raise InvalidPatch(f"{op.get('op')!r} operation is missing {name!r}")
+    return op[name]
+
+
+def _record(changes: Optional[Changes], tokens: List[str], in_place: bool) -> Optional[Changes]:
+    # ``in_place``: the operation keeps the member's set of elements intact.
+    if changes is None or not tokens:
+        return None
+    member = tokens[0]
+    if len(tokens) == 1 or (len(tokens) == 2 and not in_place):
+        changes[member] = None
+    else:
+        keys = changes.setdefault(member, set())
+        if keys is not None:
+            keys.add(tokens[1])
+    return changes
+
+
+def apply_patch(doc: Any, patch: Any) -> Tuple[Any, Optional[Changes]]:
+    """Apply the operations in ``patch`` to ``doc``.
+
+    Returns the patched document and the :data:`Changes` it made, or
+    ``None`` for those when an operation replaced the whole document.
+    Raises :class:`InvalidPatch` for a malformed patch and
+    :class:`PatchConflict` when an operation cannot be applied; either way
+    ``doc`` is left untouched.
+    """
+    if not isinstance(patch, list):
+        raise InvalidPatch("a JSON Patch must be an array of operations")
+    changes: Optional[Changes] = {}
+    for op in patch:
+        if not isinstance(op, dict):
+            raise InvalidPatch("each JSON Patch operation must be an object")
+        name = op.get("op")
+        if name not in OPS:
+            raise InvalidPatch(f"unknown JSON Patch operation {name!r}")
+        pointer = _field(op, "path")
+        tokens = parse_pointer(pointer)
+        if name == "test":
+            if _get(doc, tokens, pointer) != _field(op, "value"):
+                raise PatchConflict(f"test failed at {pointer!r}")
+            continue
+        if name == "add":
+            doc = _add(doc, tokens, copy.deepcopy(_field(op, "value")), pointer)
+        elif name == "remove":
+            doc, _ = _remove(doc, tokens, pointer)
+        elif name == "replace":
+            _get(doc, tokens, pointer)
+            if tokens:
+                doc, _ = _remove(doc, tokens, pointer)
+            doc = _add(doc, tokens, copy.deepcopy(_field(op, "value")), pointer)
+        else:
+            source = _field(op, "from")
+            from_tokens = parse_pointer(source)
+            if name == "move":
+                if tokens[: len(from_tokens)] == from_tokens and tokens != from_tokens:
+                    raise PatchConflict(f"cannot move {source!r} into its own child {pointer!r}")
+                doc, value = _remove(doc, from_tokens, source)
+            else:
+                value = copy.deepcopy(_get(doc, from_tokens, source))
+            doc = _add(doc, tokens, value, pointer)
+            if name == "move":
+                changes = _record(changes, from_tokens, in_place=False)
+        changes = _record(changes, tokens, in_place=name == "replace")
+    return doc, changes
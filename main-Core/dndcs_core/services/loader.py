@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import hashlib
 import importlib
-import importlib.util
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from .discovery import discover_modules
+from .discovery import get_module_index, revalidate_interval
+from .module_objects import MODULE_OBJECTS
+from .profiling import span
 
+_DEFAULT_CACHE_SIZE = 8
 
-def _load_from_module_file(py_path: Path, class_name: str):
-    spec = importlib.util.spec_from_file_location(f"dndcs_mod_{py_path.stem}", py_path)
-    if spec is None or spec.loader is None:
-        raise ImportError(f"Cannot load module from {py_path}")
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)  # type: ignore[attr-defined]
+Fingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+def _load_from_module_file(py_path: Path, class_name: str, owner: Optional[str] = None):
+    mod = MODULE_OBJECTS.load(py_path, f"dndcs_mod_{py_path.stem}", owner=owner)
     return getattr(mod, class_name)
 
 
@@ -38,19 +45,364 @@ def _resolve_entry(manifest: Dict[str, Any]):
         py_path = Path(manifest["__manifest_dir__"]) / modrel
         if not py_path.exists():
             raise ImportError(f"entry_point points to missing file: {py_path}")
-        return _load_from_module_file(py_path, clsname)
+        return _load_from_module_file(py_path, clsname, manifest.get("id"))
 
     candidate = Path(manifest["__manifest_dir__"]) / f"{modrel}.py"
     if candidate.exists():
-        return _load_from_module_file(candidate, clsname)
+        return _load_from_module_file(candidate, clsname, manifest.get("id"))
 
     mod = importlib.import_module(modrel)
     return getattr(mod, clsname)
 
 
-def load_module_by_manifest_id(module_id: str):
-    for man in discover_modules():
-        if man.get("id") == module_id:
-            cls = _resolve_entry(man)
-            return cls(man) if cls else None
-    return None
+def _source_paths(manifest: Dict[str, Any]) -> List[Path]:
+    """Return the files and directories whose mtimes identify a module build.
+
+    Directories are included so that adding or removing a subsystem file is
+    noticed without globbing the module tree again on every lookup.
+    """
+    base = Path(manifest.get("__manifest_dir__", "."))
+    sections = [str(s) for s in manifest.get("subsystems") or []]
+    files = iter_module_files(base, sections)
+    entry = str(manifest.get("entry_point") or manifest.get("file_entry") or manifest.get("entrypoint") or "")
+    modrel = entry.partition(":")[0]
+    if modrel.endswith(".py") and base / modrel not in files:
+        files.append(base / modrel)
+    dirs = {base} | {base / sect for sect in sections}
+    return files + sorted(dirs)
+
+
+# Suffixes of the files a module build reads: code and catalog data.
+SOURCE_SUFFIXES = (".py", ".jsonl")
+
+
+def iter_module_files(base: Path, sections: Optional[List[str]] = None) -> List[Path]:
+    """Return the manifest, code and catalog files of the module at ``base``.
+
+    That is ``manifest.yaml``, the ``.py`` files next to it and the ``.py``
+    and ``.jsonl`` files of each subsystem directory in ``sections``
+    (default: every subdirectory).  Assets and other files are ignored.
+    """
+    files = [base / "manifest.yaml"]
+    files.extend(sorted(p for p in base.glob("*.py") if p.is_file()))
+    if sections is None:
+        dirs = sorted(p for p in base.iterdir() if p.is_dir() and p.name != "__pycache__") if base.is_dir() else []
+    else:
+        dirs = [base / sect for sect in sections]
+    for sect_dir in dirs:
+        if not sect_dir.is_dir():
+            continue
+        files.extend(
+            sorted(p for p in sect_dir.iterdir() if p.suffix in SOURCE_SUFFIXES and p.is_file())
+        )
+    return files
+
+
+def _fingerprint(paths: List[Path]) -> Fingerprint:
+    out = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            out.append((str(path), -1, -1))
+            continue
+        out.append((str(path), st.st_mtime_ns, st.st_size))
+    return tuple(out)
+
+
+class _CacheEntry:
+    __slots__ = ("instance", "location", "paths", "fingerprint", "checked", "token")
+
+    def __init__(self, instance: Any, location: str, paths: List[Path], version: str = "") -> None:
+        self.instance = instance
+        self.location = location
+        self.paths = paths
+        self.fingerprint = _fingerprint(paths)
+        self.checked = time.monotonic()
+        digest = hashlib.blake2b(repr((location, self.fingerprint)).encode("utf-8"), digest_size=8)
+        self.token = f"{version}:{digest.hexdigest()}"
+
+    def is_current(self, location: str, max_age: Optional[float]) -> bool:
+        """Compare the source fingerprint unless it was checked within ``max_age`` seconds.
+
+        ``max_age=None`` trusts the entry for as long as its location holds.
+        """
+        if self.location != location:
+            return False
+        if max_age is None:
+            return True
+        now = time.monotonic()
+        if now - self.checked < max_age:
+            return True
+        if _fingerprint(self.paths) != self.fingerprint:
+            return False
+        self.checked = now
+        return True
+
+
+class ModuleCache:
+    """Process-wide, thread-safe registry of rules module instances.
+
+    Instances are keyed by manifest id and shared by every caller.  An entry
+    is rebuilt when the id resolves to a different manifest directory (for
+    example because another root now shadows it) or when the mtime of the
+    manifest or any of the module's source files changes.  Source files
+    are re-checked at most every :func:`revalidate_interval` seconds, and
+    not at all while ``watched`` is set because a :class:`ModuleReloader`
+    is already reloading changed modules.  At most ``max_size`` modules
+    stay resident; the least recently used one is evicted first.
+    """
+
+    def __init__(self, max_size: int = _DEFAULT_CACHE_SIZE) -> None:
+        self.max_size = max(1, int(max_size))
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._listeners: List[Callable[[str], None]] = []
+        self._build_listeners: List[Callable[[str, float, bool], None]] = []
+        self.watched = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reloads = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, module_id: object) -> bool:
+        return module_id in self._entries
+
+    def ids(self) -> List[str]:
+        with self._lock:
+            return list(self._entries)
+
+    def _lookup(self, module_id: str, location: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(module_id)
+        max_age = None if self.watched else revalidate_interval()
+        if entry is None or not entry.is_current(location, max_age):
+            return None
+        with self._lock:
+            if self._entries.get(module_id) is entry:
+                self._entries.move_to_end(module_id)
+            self.hits += 1
+        return entry.instance
+
+    def token(self, module_id: str) -> Optional[str]:
+        """Return ``"<version>:<content hash>"`` of the current build of ``module_id``.
+
+        The token changes whenever the module is rebuilt from different
+        files, so it can key results computed by the module.  ``None`` when
+        the module is not cached or its entry is out of date.
+        """
+        man = get_module_index().get(module_id)
+        if man is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(module_id)
+        max_age = None if self.watched else revalidate_interval()
+        if entry is None or not entry.is_current(str(man["__manifest_dir__"]), max_age):
+            return None
+        return entry.token
+
+    def _store(self, module_id: str, entry: _CacheEntry) -> None:
+        with self._lock:
+            replaced = module_id in self._entries
+            self._entries[module_id] = entry
+            self._entries.move_to_end(module_id)
+            evicted = []
+            while len(self._entries) > self.max_size:
+                evicted.append(self._entries.popitem(last=False)[0])
+                self.evictions += 1
+            if replaced:
+                self.reloads += 1
+        if replaced:
+            # Files the new build no longer reads (a removed subsystem file,
+            # a moved entry point) would otherwise stay loaded for good.
+            MODULE_OBJECTS.release_owner(module_id, keep=entry.paths)
+            self._notify(module_id)
+        for mid in evicted:
+            MODULE_OBJECTS.release_owner(mid)
+            self._notify(mid)
+        if replaced or evicted:
+            MODULE_OBJECTS.log_memory(logging.DEBUG)
+
+    def _notify(self, module_id: str) -> None:
+        for listener in list(self._listeners):
+            listener(module_id)
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """Call ``listener(module_id)`` whenever a cached module is replaced or dropped."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def add_build_listener(self, listener: Callable[[str, float, bool], None]) -> None:
+        """Call ``listener(module_id, seconds, ok)`` after every module build."""
+        self._build_listeners.append(listener)
+
+    def remove_build_listener(self, listener: Callable[[str, float, bool], None]) -> None:
+        if listener in self._build_listeners:
+            self._build_listeners.remove(listener)
+
+    def _build(
+        self, module_id: str, build: Callable[[str], Optional[Tuple[Any, Dict[str, Any]]]]
+    ) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        start = time.perf_counter()
+        ok = False
+        try:
+            built = build(module_id)
+            ok = built is not None
+            return built
+        finally:
+            secs = time.perf_counter() - start
+            for listener in list(self._build_listeners):
+                listener(module_id, secs, ok)
+
+    def get_or_load(
+        self,
+        module_id: str,
+        build: Callable[[str], Optional[Tuple[Any, Dict[str, Any]]]],
+    ) -> Optional[Any]:
+        """Return the cached instance for ``module_id`` or build it once.
+
+        ``build`` returns ``(instance, manifest)`` or ``None`` when the module
+        cannot be found; missing modules are not cached.  Concurrent callers
+        asking for the same id wait for a single build.
+        """
+        man = get_module_index().get(module_id)
+        if man is None:
+            return None
+        location = str(man["__manifest_dir__"])
+        inst = self._lookup(module_id, location)
+        if inst is not None:
+            return inst
+        with self._lock:
+            build_lock = self._build_locks.setdefault(module_id, threading.Lock())
+        with build_lock:
+            inst = self._lookup(module_id, location)
+            if inst is not None:
+                return inst
+            with self._lock:
+                self.misses += 1
+            built = self._build(module_id, build)
+            if built is None:
+                return None
+            instance, manifest = built
+            entry = _new_entry(instance, manifest)
+            self._store(module_id, entry)
+            return instance
+
+    def reload(
+        self,
+        module_id: str,
+        build: Callable[[str], Optional[Tuple[Any, Dict[str, Any]]]],
+        force: bool = False,
+    ) -> Optional[Any]:
+        """Build a fresh instance of ``module_id`` and swap it in atomically.
+
+        Callers that already hold the previous instance keep using it; only
+        lookups made after the swap see the new one.  If the module can no
+        longer be built its entry is dropped.  Unchanged files are normally
+        reused from :data:`MODULE_OBJECTS`; ``force`` executes them again.
+        """
+        with self._lock:
+            build_lock = self._build_locks.setdefault(module_id, threading.Lock())
+        with build_lock:
+            if force:
+                MODULE_OBJECTS.release_owner(module_id, shared=True)
+            built = self._build(module_id, build)
+            if built is None:
+                self.invalidate(module_id)
+                return None
+            instance, manifest = built
+            entry = _new_entry(instance, manifest)
+            with self._lock:
+                if module_id not in self._entries:
+                    self.reloads += 1
+            self._store(module_id, entry)
+            return instance
+
+    def invalidate(self, module_id: Optional[str] = None) -> None:
+        """Drop one cached module, or all of them when ``module_id`` is None."""
+        with self._lock:
+            if module_id is None:
+                dropped = list(self._entries)
+                self._entries.clear()
+            else:
+                dropped = [module_id] if self._entries.pop(module_id, None) else []
+        for mid in dropped:
+            MODULE_OBJECTS.release_owner(mid)
+            self._notify(mid)
+
+
+def _new_entry(instance: Any, manifest: Dict[str, Any]) -> _CacheEntry:
+    return _CacheEntry(
+        instance,
+        str(manifest["__manifest_dir__"]),
+        _source_paths(manifest),
+        str(manifest.get("version") or ""),
+    )
+
+
+def _cache_size_from_env() -> int:
+    env_val = os.getenv("DNDCS_MODULE_CACHE_SIZE")
+    try:
+        return int(env_val) if env_val else _DEFAULT_CACHE_SIZE
+    except ValueError:
+        return _DEFAULT_CACHE_SIZE
+
+
+MODULE_CACHE = ModuleCache(_cache_size_from_env())
+
+
+def _build_module(module_id: str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+    # Re-read the manifest so edits since the index was built are honoured;
+    # modules receive their own copy because they may adjust it in place.
+    man = get_module_index().reload(module_id)
+    if man is None:
+        return None
+    man = dict(man)
+    with span(f"resolve entry point {module_id}"):
+        cls = _resolve_entry(man)
+    if not cls:
+        return None
+    with span(f"instantiate {cls.__name__}"):
+        return cls(man), man
+
+
+def load_module_by_manifest_id(module_id: str, use_cache: bool = True):
+    """Return the rules module instance for ``module_id`` or ``None``.
+
+    Instances are shared through :data:`MODULE_CACHE`; pass
+    ``use_cache=False`` to build a private instance.
+    """
+    if not use_cache:
+        built = _build_module(module_id)
+        return built[0] if built else None
+    return MODULE_CACHE.get_or_load(module_id, _build_module)
+
+
+def clear_module_cache(module_id: Optional[str] = None) -> None:
+    """Forget cached module instances so the next lookup rebuilds them."""
+    MODULE_CACHE.invalidate(module_id)
+
+
+def warmup_modules(
+    module_ids: Optional[List[str]] = None, max_workers: Optional[int] = None
+) -> Dict[str, Dict[str, float]]:
+    """Load modules into the cache and import all of their subsystems.
+
+    ``module_ids`` defaults to every discovered module.  ``max_workers`` is
+    forwarded to :meth:`ModuleBase.load_subsystems`.  Returns the per-file
+    import timings of each warmed module.
+    """
+    ids = module_ids if module_ids is not None else get_module_index().ids()
+    timings: Dict[str, Dict[str, float]] = {}
+    for module_id in ids:
+        mod = load_module_by_manifest_id(module_id)
+        if mod is not None and hasattr(mod, "load_subsystems"):
+            timings[module_id] = mod.load_subsystems(max_workers)
+    return timings
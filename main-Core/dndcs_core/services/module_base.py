@@ -1,36 +1,184 @@
 from __future__ import annotations
 from pathlib import Path
-import importlib.util
+import logging
+import os
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from types import ModuleType
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+from . import incremental
+from .module_objects import MODULE_OBJECTS
+from .profiling import bind
+
+log = logging.getLogger("dndcs.core.module_base")
+
+
+class SubsystemImportError(ImportError):
+    """Raised when a subsystem file fails to import on first access."""
+
+
+class LazySubsystems(Mapping):
+    """Read-only mapping of subsystem name to its imported ``.py`` files.
+
+    Only the directory listing happens up front; a section's files are
+    executed the first time that section is looked up.  Membership tests,
+    iteration and ``len()`` never import anything.  ``timings`` records how
+    long each imported file took, keyed by path.
+    """
+
+    def __init__(self, module_id: str, base: Path, sections: List[str]) -> None:
+        self._module_id = module_id
+        self._files: Dict[str, List[Path]] = {}
+        self._loaded: Dict[str, List[ModuleType]] = {}
+        self._lock = threading.RLock()
+        self.timings: Dict[str, float] = {}
+        for sect in sections:
+            sect_dir = base / sect
+            if not sect_dir.is_dir():
+                continue
+            files = sorted(py for py in sect_dir.glob("*.py") if py.name != "__init__.py")
+            if files:
+                self._files[sect] = files
+
+    def __getitem__(self, sect: str) -> List[ModuleType]:
+        loaded = self._loaded.get(sect)
+        if loaded is not None:
+            return loaded
+        if sect not in self._files:
+            raise KeyError(sect)
+        with self._lock:
+            loaded = self._loaded.get(sect)
+            if loaded is None:
+                loaded = [self._import(sect, py) for py in self._files[sect]]
+                self._loaded[sect] = loaded
+        return loaded
+
+    def __contains__(self, sect: object) -> bool:
+        return sect in self._files
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._files)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __repr__(self) -> str:
+        state = {s: ("loaded" if s in self._loaded else "pending") for s in self._files}
+        return f"LazySubsystems({self._module_id!r}, {state})"
+
+    def is_loaded(self, sect: str) -> bool:
+        return sect in self._loaded
+
+    def files(self, sect: str) -> List[Path]:
+        """Return the files that make up ``sect`` without importing them."""
+        return list(self._files.get(sect, []))
+
+    def load_all(self, max_workers: Optional[int] = None) -> Dict[str, float]:
+        """Import every pending section and return the per-file timings.
+
+        With ``max_workers`` above 1 the files of all pending sections are
+        imported concurrently on a bounded thread pool; each section still
+        lists its modules in sorted file order, so the result does not
+        depend on completion order.  Files of one module must therefore
+        not import each other through ``subsystems``.
+        """
+        with self._lock:
+            pending: List[Tuple[str, Path]] = [
+                (sect, py)
+                for sect, files in self._files.items()
+                if sect not in self._loaded
+                for py in files
+            ]
+            if not pending:
+                return dict(self.timings)
+            start = time.perf_counter()
+            if max_workers and max_workers > 1 and len(pending) > 1:
+                workers = min(max_workers, len(pending))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dndcs-load") as pool:
+                    run = bind(self._import)
+                    futures = [pool.submit(run, sect, py) for sect, py in pending]
+                    mods = [f.result() for f in futures]
+            else:
+                workers = 1
+                mods = [self._import(sect, py) for sect, py in pending]
+            merged: Dict[str, List[ModuleType]] = {}
+            for (sect, _py), mod in zip(pending, mods):
+                merged.setdefault(sect, []).append(mod)
+            self._loaded.update(merged)
+            log.info(
+                "Loaded %d subsystem file(s) for %s in %.1fms (workers=%d)",
+                len(pending),
+                self._module_id,
+                (time.perf_counter() - start) * 1000,
+                workers,
+            )
+        return dict(self.timings)
+
+    def _import(self, sect: str, py: Path) -> ModuleType:
+        start = time.perf_counter()
+        try:
+            mod = MODULE_OBJECTS.load(
+                py, f"dndcs_mod_{self._module_id}_{sect}_{py.stem}", owner=self._module_id
+            )
+        except Exception as exc:
+            raise SubsystemImportError(
+                f"Failed to import {sect} subsystem file {py} for module "
+                f"{self._module_id}: {type(exc).__name__}: {exc}"
+            ) from exc
+        elapsed = time.perf_counter() - start
+        self.timings[str(py)] = elapsed
+        log.debug("Imported %s in %.1fms", py, elapsed * 1000)
+        return mod
+
+
+def _load_workers_from_env() -> int:
+    env_val = os.getenv("DNDCS_SUBSYSTEM_WORKERS")
+    try:
+        return int(env_val) if env_val else 0
+    except ValueError:
+        return 0
+
 
 class ModuleBase:
     """Base class for rules modules supporting a structured layout.
 
     Subsystems such as ``items`` or ``spells`` can be placed in subdirectories
     next to the module's ``manifest.yaml``.  Each ``.py`` file inside those
-    folders is imported automatically and made available via ``subsystems``.
+    folders is made available via ``subsystems``; a folder is imported the
+    first time it is accessed, and import failures surface as
+    :class:`SubsystemImportError` at that point.
     """
 
     def __init__(self, manifest: Dict[str, Any]) -> None:
         self.manifest = manifest
-        self.subsystems: Dict[str, List[ModuleType]] = {}
         base = Path(manifest.get("__manifest_dir__", "."))
         sections: List[str] = list(manifest.get("subsystems", []) or [])
-        for sect in sections:
-            sect_dir = base / sect
-            if not sect_dir.is_dir():
-                continue
-            loaded: List[ModuleType] = []
-            for py in sect_dir.glob("*.py"):
-                if py.name == "__init__.py":
-                    continue
-                spec = importlib.util.spec_from_file_location(
-                    f"dndcs_mod_{manifest.get('id','mod')}_{sect}_{py.stem}", py
-                )
-                if spec and spec.loader:
-                    mod = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(mod)  # type: ignore[attr-defined]
-                    loaded.append(mod)
-            if loaded:
-                self.subsystems[sect] = loaded
+        self.subsystems = LazySubsystems(manifest.get("id", "mod"), base, sections)
+
+    def load_subsystems(self, max_workers: Optional[int] = None) -> Dict[str, float]:
+        """Import every declared subsystem now instead of on first access.
+
+        ``max_workers`` opts into parallel loading; it defaults to the
+        ``DNDCS_SUBSYSTEM_WORKERS`` environment variable (sequential when
+        unset).  Returns the per-file import timings in seconds.
+        """
+        if max_workers is None:
+            max_workers = _load_workers_from_env()
+        return self.subsystems.load_all(max_workers)
+
+    # Modules may describe ``derive`` as a :class:`~.incremental.DerivePlan`
+    # so that patched characters only rerun the affected stages.
+    derive_plan: Optional[incremental.DerivePlan] = None
+
+    def derive_state(self, payload: Dict[str, Any]) -> incremental.DeriveState:
+        """Derive a character payload, keeping what :meth:`derive_incremental` needs."""
+        return incremental.derive_state(self, payload)
+
+    def derive_incremental(
+        self, previous_state: incremental.DeriveState, patch: Any
+    ) -> incremental.DeriveState:
+        """Derive the character of ``previous_state`` with an RFC 6902 ``patch`` applied."""
+        return incremental.derive_incremental(self, previous_state, patch)
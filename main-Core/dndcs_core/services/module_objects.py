@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import logging
+import sys
+import threading
+from pathlib import Path
+from types import FunctionType, ModuleType
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .profiling import span
+
+log = logging.getLogger("dndcs.core.module_objects")
+
+# Objects that belong to the interpreter rather than to a module's data.
+_SKIP_TYPES = (ModuleType, FunctionType, type)
+
+
+def estimate_size(mod: ModuleType) -> int:
+    """Approximate the bytes held by the data globals of ``mod``.
+
+    Containers are walked recursively and shared objects are counted once.
+    Functions, classes and imported modules are ignored.
+    """
+    seen: Set[int] = set()
+    total = 0
+    stack: List[Any] = [
+        v for k, v in vars(mod).items() if not k.startswith("__") and not isinstance(v, _SKIP_TYPES)
+    ]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SKIP_TYPES):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj, 0)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return total
+
+
+class LoadedModule:
+    """A module object executed from a file and tracked by the registry."""
+
+    __slots__ = ("name", "path", "mtime_ns", "module", "size_bytes", "owners")
+
+    def __init__(self, name: str, path: str, mtime_ns: int, module: ModuleType, size_bytes: int) -> None:
+        self.name = name
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.module = module
+        self.size_bytes = size_bytes
+        self.owners: Set[str] = set()
+
+
+class ModuleObjectRegistry:
+    """Deduplicating registry of module objects executed from files.
+
+    A file is executed once per (resolved path, mtime); later requests for
+    the same unchanged file get the same module object back.  Each object is
+    registered in ``sys.modules`` under a name derived from its path and
+    remembers which rules modules (owners) use it so that it can be released
+    explicitly once nobody needs it.
+    """
+
+    def __init__(self) -> None:
+        self._records: Dict[str, LoadedModule] = {}
+        self._path_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.RLock()
+        self.loads = 0
+        self.reuses = 0
+
+    def load(self, path: Path, name: str, owner: Optional[str] = None) -> ModuleType:
+        """Return the module object for ``path``, executing it if needed.
+
+        ``name`` is used as the prefix of the ``sys.modules`` key.  Errors
+        raised while executing the file propagate and leave no trace in the
+        registry.
+        """
+        resolved = str(Path(path).resolve())
+        mtime = Path(resolved).stat().st_mtime_ns
+        with self._lock:
+            mod = self._reuse(resolved, mtime, owner)
+            if mod is not None:
+                return mod
+            path_lock = self._path_locks.setdefault(resolved, threading.Lock())
+        # Files are executed outside the registry lock so that independent
+        # files can load concurrently; the per-path lock deduplicates.
+        with path_lock:
+            with self._lock:
+                mod = self._reuse(resolved, mtime, owner)
+                if mod is not None:
+                    return mod
+            mod_name = f"{name}_{hashlib.sha1(resolved.encode('utf-8')).hexdigest()[:8]}"
+            spec = importlib.util.spec_from_file_location(mod_name, resolved)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot load module from {resolved}")
+            mod = importlib.util.module_from_spec(spec)
+            previous = sys.modules.get(mod_name)
+            sys.modules[mod_name] = mod
+            try:
+                with span(f"exec {resolved}"):
+                    spec.loader.exec_module(mod)  # type: ignore[attr-defined]
+            except BaseException:
+                if previous is not None:
+                    sys.modules[mod_name] = previous
+                else:
+                    sys.modules.pop(mod_name, None)
+                raise
+            new = LoadedModule(mod_name, resolved, mtime, mod, estimate_size(mod))
+            with self._lock:
+                old = self._records.get(resolved)
+                if old is not None:
+                    new.owners.update(old.owners)
+                if owner:
+                    new.owners.add(owner)
+                self._records[resolved] = new
+                self.loads += 1
+        log.info("Loaded %s (~%.1f KiB)", resolved, new.size_bytes / 1024)
+        return mod
+
+    def _reuse(self, resolved: str, mtime: int, owner: Optional[str]) -> Optional[ModuleType]:
+        rec = self._records.get(resolved)
+        if rec is None or rec.mtime_ns != mtime:
+            return None
+        if owner:
+            rec.owners.add(owner)
+        self.reuses += 1
+        return rec.module
+
+    def release(self, path: Path) -> bool:
+        """Forget the module object loaded from ``path``; return True if found."""
+        resolved = str(Path(path).resolve())
+        with self._lock:
+            rec = self._records.pop(resolved, None)
+            if rec is None:
+                return False
+            if sys.modules.get(rec.name) is rec.module:
+                del sys.modules[rec.name]
+        log.info("Released %s (~%.1f KiB)", resolved, rec.size_bytes / 1024)
+        return True
+
+    def release_owner(self, owner: str, shared: bool = False, keep: Iterable[Path] = ()) -> List[str]:
+        """Drop ``owner`` everywhere and release objects nobody else uses.
+
+        With ``shared`` the objects ``owner`` used are released even if other
+        owners still use them, so the next load of those files executes them
+        again; owners holding the old objects keep them.  Files in ``keep``
+        stay registered to ``owner``.
+        """
+        kept = {str(Path(p).resolve()) for p in keep}
+        with self._lock:
+            orphaned = []
+            for path, rec in self._records.items():
+                if owner in rec.owners and path not in kept:
+                    rec.owners.discard(owner)
+                    if shared or not rec.owners:
+                        orphaned.append(path)
+        for path in orphaned:
+            self.release(Path(path))
+        return orphaned
+
+    def records(self) -> List[LoadedModule]:
+        with self._lock:
+            return list(self._records.values())
+
+    def memory_by_owner(self) -> Dict[str, int]:
+        """Return the estimated bytes held per owner (shared objects count for each)."""
+        out: Dict[str, int] = {}
+        for rec in self.records():
+            for owner in rec.owners or {"<unowned>"}:
+                out[owner] = out.get(owner, 0) + rec.size_bytes
+        return out
+
+    def log_memory(self, level: int = logging.INFO) -> int:
+        """Log the per-file and per-owner memory estimates; return the total."""
+        records = sorted(self.records(), key=lambda r: -r.size_bytes)
+        total = sum(r.size_bytes for r in records)
+        for rec in records:
+            log.log(level, "module object %s: ~%.1f KiB owners=%s", rec.path, rec.size_bytes / 1024, sorted(rec.owners))
+        for owner, size in sorted(self.memory_by_owner().items()):
+            log.log(level, "rules module %s: ~%.1f KiB", owner, size / 1024)
+        log.log(level, "module objects total: %d file(s), ~%.1f KiB", len(records), total / 1024)
+        return total
+
+
+MODULE_OBJECTS = ModuleObjectRegistry()
@@ -0,0 +1,227 @@
+"""Hierarchical startup timing and allocation profiling.
+
+Code on the startup path wraps interesting steps in :func:`span`.  Spans
+cost next to nothing unless a :class:`StartupProfiler` is active, in which
+case they are recorded as a tree with wall time and, when ``tracemalloc``
+is tracing, the net memory allocated inside each step.
+
+This module deliberately imports only the standard library so that it can
+be loaded before anything it is meant to measure.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Span:
+    __slots__ = ("name", "start", "duration", "alloc", "children")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start = 0.0
+        self.duration = 0.0
+        self.alloc: Optional[int] = None
+        self.children: List["Span"] = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"name": self.name, "ms": round(self.duration * 1000, 3)}
+        if self.alloc is not None:
+            out["alloc_kib"] = round(self.alloc / 1024, 1)
+        if self.children:
+            out["children"] = [c.to_dict() for c in self.children]
+        return out
+
+
+class StartupProfiler:
+    """Collects a tree of :class:`Span` objects while active.
+
+    Each thread keeps its own stack of open spans.  A thread's spans hang
+    off the root unless it runs under :meth:`attach`, which is how work
+    handed to a pool nests under the step that started the pool (see
+    :func:`bind`).  Allocation figures of spans that overlap in time on
+    different threads include each other's allocations.
+    """
+
+    def __init__(self, trace_alloc: bool = True) -> None:
+        self.trace_alloc = trace_alloc
+        self.root = Span("total")
+        self._local = threading.local()
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = [self.root]
+        return stack
+
+    def current(self) -> Span:
+        """Return the innermost span open on the calling thread."""
+        return self._stack()[-1]
+
+    @contextmanager
+    def attach(self, parent: Span) -> Iterator[Span]:
+        """Nest the calling thread's spans under ``parent`` while active."""
+        stack = self._stack()
+        stack.append(parent)
+        try:
+            yield parent
+        finally:
+            stack.pop()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[Span]:
+        node = Span(name)
+        stack = self._stack()
+        stack[-1].children.append(node)
+        stack.append(node)
+        tracing = self.trace_alloc and tracemalloc.is_tracing()
+        before = tracemalloc.get_traced_memory()[0] if tracing else 0
+        node.start = time.perf_counter()
+        try:
+            yield node
+        finally:
+            node.duration = time.perf_counter() - node.start
+            if tracing:
+                node.alloc = tracemalloc.get_traced_memory()[0] - before
+            stack.pop()
+
+    def start(self) -> None:
+        global _ACTIVE
+        if self.trace_alloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.root.start = time.perf_counter()
+        _ACTIVE = self
+
+    def stop(self) -> None:
+        global _ACTIVE
+        self.root.duration = time.perf_counter() - self.root.start
+        if self.trace_alloc and tracemalloc.is_tracing():
+            self.root.alloc = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+        if _ACTIVE is self:
+            _ACTIVE = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.root.to_dict()
+
+
+_ACTIVE: Optional[StartupProfiler] = None
+
+
+@contextmanager
+def span(name: str) -> Iterator[Optional[Span]]:
+    """Record ``name`` as a step of the active profile, if any."""
+    prof = _ACTIVE
+    if prof is None:
+        yield None
+        return
+    with prof.span(name) as node:
+        yield node
+
+
+def bind(fn: Callable[..., T]) -> Callable[..., T]:
+    """Wrap ``fn`` so that spans it records nest under the span open now.
+
+    Use it for callables submitted to a thread pool; without an active
+    profile ``fn`` is returned unchanged.
+    """
+    prof = _ACTIVE
+    if prof is None:
+        return fn
+    parent = prof.current()
+
+    def _bound(*args: Any, **kwargs: Any) -> T:
+        with prof.attach(parent):
+            return fn(*args, **kwargs)
+
+    return _bound
+
+
+def render_text(tree: Dict[str, Any], min_ms: float = 0.0) -> str:
+    """Format a profile tree (as returned by ``to_dict``) as an indented table."""
+    rows: List[str] = []
+
+    def _walk(node: Dict[str, Any], depth: int) -> None:
+        if depth and node["ms"] < min_ms:
+            return
+        name = node["name"]
+        room = 78 - 2 * depth
+        if len(name) > room:
+            name = "..." + name[-(room - 3):]
+        label = "  " * depth + name
+        alloc = node.get("alloc_kib")
+        alloc_txt = f"{alloc:>12.1f} KiB" if alloc is not None else ""
+        rows.append(f"{label:<80}{node['ms']:>10.1f} ms{alloc_txt}")
+        for child in node.get("children", []):
+            _walk(child, depth + 1)
+
+    _walk(tree, 0)
+    return "\n".join(rows)
+
+
+TARGETS = ("cli", "ui", "module")
+
+
+def profile_startup(target: str, module_id: Optional[str] = None, trace_alloc: bool = True) -> Dict[str, Any]:
+    """Profile the cold start of ``target`` in the current process.
+
+    Meaningful numbers need a fresh interpreter; ``dndcs profile-startup``
+    runs this in a subprocess.  ``target`` is one of :data:`TARGETS`.
+    """
+    if target not in TARGETS:
+        raise ValueError(f"Unknown target {target!r}; expected one of {', '.join(TARGETS)}")
+    prof = StartupProfiler(trace_alloc=trace_alloc)
+    prof.start()
+    try:
+        with prof.span("import dndcs (sys.path setup)"):
+            import dndcs  # noqa: F401
+        if target == "cli":
+            with prof.span("import dndcs.cli (click, logging)"):
+                import dndcs.cli  # noqa: F401
+        with prof.span("import dndcs.core (pydantic models, services)"):
+            from dndcs.core import loader, models, registry  # noqa: F401
+            from dndcs_core.services.discovery import get_module_index
+        if target == "ui":
+            with prof.span("import fastapi, uvicorn"):
+                import fastapi  # noqa: F401
+                import uvicorn  # noqa: F401
+            with prof.span("import webui.server"):
+                from webui.server import create_app
+            with prof.span("create_app"):
+                create_app()
+        with prof.span("discovery"):
+            get_module_index()
+        if target in ("ui", "module"):
+            mid = module_id or registry.default_module_id()
+            with prof.span(f"load module {mid}"):
+                mod = loader.load_module_by_manifest_id(mid)
+            if mod is None:
+                raise LookupError(f"Module '{mid}' not found")
+            if hasattr(mod, "load_subsystems"):
+                with prof.span(f"load subsystems {mid}"):
+                    mod.load_subsystems()
+            # Lazily built lookup tables record their own spans.
+            for table in ("feats", "companions"):
+                getattr(mod, table, None)
+    finally:
+        prof.stop()
+    return {
+        "target": target,
+        "module": module_id,
+        "python": sys.version.split()[0],
+        "alloc_traced": trace_alloc,
+        "profile": prof.to_dict(),
+    }
+
+
+def _child_main(argv: List[str]) -> None:
+    target, module_id, alloc = argv[0], argv[1] or None, argv[2] == "1"
+    json.dump(profile_startup(target, module_id, alloc), sys.stdout)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+from .discovery import get_module_index, module_search_paths
+from .loader import MODULE_CACHE, ModuleCache, _build_module, iter_module_files
+
+log = logging.getLogger("dndcs.core.watcher")
+
+
+class FileWatcher:
+    """Minimal change-notification interface used by :class:`ModuleReloader`.
+
+    ``poll()`` returns the paths that were added, removed or modified since
+    the previous call.  Implementations may poll the filesystem or wrap an
+    OS notification API; the reloader only relies on this method.
+    """
+
+    def poll(self) -> Set[str]:  # pragma: no cover - interface
+        raise NotImplementedError
+
+
+class PollingWatcher(FileWatcher):
+    """Watch manifests and module files under the module search roots by mtime."""
+
+    def __init__(self, roots: Optional[Callable[[], List[Path]]] = None) -> None:
+        self._roots = roots or module_search_paths
+        self._state = self._snapshot()
+
+    def _snapshot(self) -> Dict[str, int]:
+        state: Dict[str, int] = {}
+        for root in self._roots():
+            if not root.is_dir():
+                continue
+            for mfile in root.glob("*/manifest.yaml"):
+                for path in iter_module_files(mfile.parent):
+                    try:
+                        state[str(path)] = path.stat().st_mtime_ns
+                    except OSError:
+                        continue
+        return state
+
+    def poll(self) -> Set[str]:
+        new = self._snapshot()
+        old, self._state = self._state, new
+        changed = {p for p, mtime in new.items() if old.get(p) != mtime}
+        changed.update(p for p in old if p not in new)
+        return changed
+
+
+class ModuleReloader:
+    """Rebuild cached modules whose files changed and swap them in.
+
+    Each rebuilt module replaces the cached instance atomically, so requests
+    that already obtained the previous instance finish against it.  A module
+    that fails to rebuild keeps serving its previous instance.
+    """
+
+    def __init__(
+        self,
+        watcher: Optional[FileWatcher] = None,
+        cache: ModuleCache = MODULE_CACHE,
+        interval: float = 1.0,
+    ) -> None:
+        self._watcher = watcher
+        self.cache = cache
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def watcher(self) -> FileWatcher:
+        # Created on first use so that building a reloader only to serve
+        # manual reloads does not snapshot every module file.
+        if self._watcher is None:
+            self._watcher = PollingWatcher()
+        return self._watcher
+
+    @property
+    def reload_count(self) -> int:
+        """Number of module instances swapped in by the cache so far."""
+        return self.cache.reloads
+
+    def _affected(self, changed: Set[str]) -> List[str]:
+        index = get_module_index()
+        ids = []
+        for module_id in self.cache.ids():
+            man = index.get(module_id)
+            if man is None:
+                ids.append(module_id)
+                continue
+            base = str(Path(man["__manifest_dir__"]))
+            if any(p == base or p.startswith(base + "/") or p.startswith(base + "\\") for p in changed):
+                ids.append(module_id)
+        return ids
+
+    def reload(self, module_id: Optional[str] = None, force: bool = False) -> List[str]:
+        """Rebuild ``module_id`` or every cached module; return rebuilt ids.
+
+        ``force`` re-executes every module file, changed or not.
+        """
+        ids = [module_id] if module_id else self.cache.ids()
+        done = []
+        for mid in ids:
+            try:
+                inst = self.cache.reload(mid, _build_module, force=force)
+            except Exception:
+                log.exception("Reload of module %s failed; keeping previous instance", mid)
+                continue
+            if inst is not None:
+                done.append(mid)
+        if done:
+            log.info("Reloaded modules: %s", ", ".join(done))
+        return done
+
+    def check(self) -> List[str]:
+        """Poll the watcher once and reload affected modules."""
+        changed = self.watcher.poll()
+        if not changed:
+            return []
+        done: List[str] = []
+        for mid in self._affected(changed):
+            done.extend(self.reload(mid))
+        return done
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                log.exception("Module watcher iteration failed")
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        # Take the baseline snapshot now so edits made right after start()
+        # are reported by the first poll.
+        self.watcher.poll()
+        self.cache.watched = True
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="dndcs-module-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.cache.watched = False
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 2)
+            self._thread = None
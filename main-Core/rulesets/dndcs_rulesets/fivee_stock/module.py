@@ -1,9 +1,14 @@
 from __future__ import annotations
-from typing import Dict, Any, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from math import floor
+from functools import cached_property
 from dndcs.core import models
+from dndcs.core.incremental import DerivePlan, Stage
 from dndcs.core.module_base import ModuleBase
+from dndcs_core.services.profiling import span
 from dndcs.modules.fivee_stock.classes import CLASSES
 
 # Item property fields recognised during character derivation:
@@ -130,215 +135,410 @@ def weapon_damage_bonus(weapon: Dict[str, Any], mods: Dict[str, int]) -> int:
     ability = weapon_ability(weapon, mods)
     return mods.get(ability, 0)
 
-def _compute_ac(char: models.Character, mods: Dict[str,int]) -> Dict[str, Any]:
-    dex = mods.get("DEX", 0)
-    best = 10 + dex
-    source = "unarmored"
-    shield = 0
-    wearing_armor = False
-    for it in (char.items or []):
-        p = getattr(it, "props", {}) or {}
-        # armor
-        if isinstance(p, dict) and "armor" in p:
-            wearing_armor = True
-            armor = p["armor"] or {}
-            base = int(armor.get("base", 10))
-            cat = armor.get("category", "light")
-            dex_cap = armor.get("dex_cap", None)
-            dex_part = dex if dex_cap is None else min(dex, int(dex_cap))
-            ac = base + (dex_part if cat in ("light","medium") else 0)
-            if ac > best:
-                best, source = ac, f"armor({cat})"
-        # shield
-        if isinstance(p, dict) and "shield_bonus" in p:
-            shield = max(shield, int(p["shield_bonus"]))
-        # mage armor (no armor worn)
-        if isinstance(p, dict) and (p.get("ac_base") == 13) and not wearing_armor:
-            ac = 13 + dex
-            if ac > best:
-                best, source = ac, "mage_armor"
-    return {"value": best + shield, "breakdown": {"base": best, "shield": shield}, "source": source}
+class Effect:
+    """One compiled effect of a feat or item; ``apply`` adds it to the totals."""
 
-def _wizard_block(char: models.Character, mods: Dict[str,int], level: int, pb: int) -> Optional[Dict[str, Any]]:
-    # enable if Spellbook item exists (name "Spellbook" or props.spellbook)
-    sb = None
-    for it in (char.items or []):
-        name = (it.name or "").lower()
-        props = getattr(it, "props", {}) or {}
-        if "spellbook" in props or name == "spellbook":
-            sb = props.get("spellbook", {})
-            break
-    if sb is None:
-        return None
+    __slots__ = ()
 
-    int_mod = mods.get("INT", 0)
-    slots = FULL_CASTER_SLOTS.get(level, [0]*9)
-    prepared_cap = max(1, level + int_mod)
+    def apply(self, t: "EffectTotals") -> None:
+        raise NotImplementedError
 
-    prepared = []
-    for L in range(1,10):
-        for s in sb.get("prepared", {}).get(str(L), []):
-            if s not in prepared:
-                prepared.append(s)
-    if len(prepared) > prepared_cap:
-        prepared = prepared[:prepared_cap]
 
-    return {
-        "class": "wizard",
-        "spellcasting_ability": "INT",
-        "spell_save_dc": 8 + pb + int_mod,
-        "spell_attack_mod": pb + int_mod,
-        "prepared_max": prepared_cap,
-        "prepared_spells": prepared,
-        "slots": slots,
-    }
+@dataclass(frozen=True, slots=True)
+class AbilityBonus(Effect):
+    ability: str
+    amount: int
 
+    def apply(self, t: "EffectTotals") -> None:
+        t.ability_bonuses[self.ability] = t.ability_bonuses.get(self.ability, 0) + self.amount
 
-def _cleric_block(char: models.Character, mods: Dict[str,int], level: int, pb: int) -> Dict[str, Any]:
-    wis_mod = mods.get("WIS", 0)
-    slots = FULL_CASTER_SLOTS.get(level, [0]*9)
-    cap = max(1, level + wis_mod)
-    prepared = (char.spellcasting.get("cleric", {}).get("prepared", []) if isinstance(char.spellcasting, dict) else [])[:cap]
-    return {
-        "class": "cleric",
-        "spellcasting_ability": "WIS",
-        "spell_save_dc": 8 + pb + wis_mod,
-        "spell_attack_mod": pb + wis_mod,
-        "prepared_max": cap,
-        "prepared_spells": prepared,
-        "slots": slots,
-    }
 
+@dataclass(frozen=True, slots=True)
+class SkillProficiency(Effect):
+    skill: str
 
-def _druid_block(char: models.Character, mods: Dict[str,int], level: int, pb: int) -> Dict[str, Any]:
-    wis_mod = mods.get("WIS", 0)
-    slots = FULL_CASTER_SLOTS.get(level, [0]*9)
-    cap = max(1, level + wis_mod)
-    prepared = (char.spellcasting.get("druid", {}).get("prepared", []) if isinstance(char.spellcasting, dict) else [])[:cap]
-    return {
-        "class": "druid",
-        "spellcasting_ability": "WIS",
-        "spell_save_dc": 8 + pb + wis_mod,
-        "spell_attack_mod": pb + wis_mod,
-        "prepared_max": cap,
-        "prepared_spells": prepared,
-        "slots": slots,
-    }
+    def apply(self, t: "EffectTotals") -> None:
+        t.skill_proficiencies.add(self.skill)
 
 
-def _bard_block(char: models.Character, mods: Dict[str,int], level: int, pb: int) -> Dict[str, Any]:
-    cha_mod = mods.get("CHA", 0)
-    slots = FULL_CASTER_SLOTS.get(level, [0]*9)
-    max_known = BARD_SPELLS_KNOWN.get(level, 0)
-    known = (char.spellcasting.get("bard", {}).get("known", []) if isinstance(char.spellcasting, dict) else [])[:max_known]
-    return {
-        "class": "bard",
-        "spellcasting_ability": "CHA",
-        "spell_save_dc": 8 + pb + cha_mod,
-        "spell_attack_mod": pb + cha_mod,
-        "known_max": max_known,
-        "known_spells": known,
-        "slots": slots,
-    }
+@dataclass(frozen=True, slots=True)
+class SaveProficiency(Effect):
+    ability: str
 
+    def apply(self, t: "EffectTotals") -> None:
+        t.save_proficiencies.add(self.ability)
 
-def _sorcerer_block(char: models.Character, mods: Dict[str,int], level: int, pb: int) -> Dict[str, Any]:
-    cha_mod = mods.get("CHA", 0)
-    slots = FULL_CASTER_SLOTS.get(level, [0]*9)
-    max_known = SORCERER_SPELLS_KNOWN.get(level, 0)
-    known = (char.spellcasting.get("sorcerer", {}).get("known", []) if isinstance(char.spellcasting, dict) else [])[:max_known]
-    return {
-        "class": "sorcerer",
-        "spellcasting_ability": "CHA",
-        "spell_save_dc": 8 + pb + cha_mod,
-        "spell_attack_mod": pb + cha_mod,
-        "known_max": max_known,
-        "known_spells": known,
-        "slots": slots,
-    }
 
+@dataclass(frozen=True, slots=True)
+class SaveBonus(Effect):
+    # an ability, or "all" for every save
+    key: str
+    amount: int
 
-def _paladin_block(char: models.Character, mods: Dict[str,int], level: int, pb: int) -> Dict[str, Any]:
-    cha_mod = mods.get("CHA", 0)
-    slots = HALF_CASTER_SLOTS.get(level, [0]*9)
-    cap = max(1, (level // 2) + cha_mod)
-    prepared = (char.spellcasting.get("paladin", {}).get("prepared", []) if isinstance(char.spellcasting, dict) else [])[:cap]
-    return {
-        "class": "paladin",
-        "spellcasting_ability": "CHA",
-        "spell_save_dc": 8 + pb + cha_mod,
-        "spell_attack_mod": pb + cha_mod,
-        "prepared_max": cap,
-        "prepared_spells": prepared,
-        "slots": slots,
-    }
+    def apply(self, t: "EffectTotals") -> None:
+        t.save_bonuses[self.key] = t.save_bonuses.get(self.key, 0) + self.amount
 
 
-def _ranger_block(char: models.Character, mods: Dict[str,int], level: int, pb: int) -> Dict[str, Any]:
-    wis_mod = mods.get("WIS", 0)
-    slots = HALF_CASTER_SLOTS.get(level, [0]*9)
-    cap = max(1, (level // 2) + wis_mod)
-    prepared = (char.spellcasting.get("ranger", {}).get("prepared", []) if isinstance(char.spellcasting, dict) else [])[:cap]
-    return {
-        "class": "ranger",
-        "spellcasting_ability": "WIS",
-        "spell_save_dc": 8 + pb + wis_mod,
-        "spell_attack_mod": pb + wis_mod,
-        "prepared_max": cap,
-        "prepared_spells": prepared,
-        "slots": slots,
-    }
+@dataclass(frozen=True, slots=True)
+class Armor(Effect):
+    base: int
+    category: str
+    dex_cap: Optional[int]
 
+    def apply(self, t: "EffectTotals") -> None:
+        t.wearing_armor = True
+        t.armor_class.append(self)
 
-def _warlock_block(char: models.Character, mods: Dict[str,int], level: int, pb: int) -> Dict[str, Any]:
-    cha_mod = mods.get("CHA", 0)
-    slots = PACT_MAGIC_SLOTS.get(level, [0]*9)
-    max_known = WARLOCK_SPELLS_KNOWN.get(level, 0)
-    known = (char.spellcasting.get("warlock", {}).get("known", []) if isinstance(char.spellcasting, dict) else [])[:max_known]
-    return {
-        "class": "warlock",
-        "spellcasting_ability": "CHA",
-        "spell_save_dc": 8 + pb + cha_mod,
-        "spell_attack_mod": pb + cha_mod,
-        "known_max": max_known,
-        "known_spells": known,
-        "slots": slots,
-    }
+    def armor_class(self, dex: int) -> Tuple[int, str]:
+        dex_part = dex if self.dex_cap is None else min(dex, self.dex_cap)
+        return self.base + (dex_part if self.category in ("light","medium") else 0), f"armor({self.category})"
+
+
+@dataclass(frozen=True, slots=True)
+class Shield(Effect):
+    bonus: int
+
+    def apply(self, t: "EffectTotals") -> None:
+        t.shield = max(t.shield, self.bonus)
+
+
+@dataclass(frozen=True, slots=True)
+class ACBase(Effect):
+    value: Any
+
+    def apply(self, t: "EffectTotals") -> None:
+        # mage armor (no armor worn)
+        if self.value == 13 and not t.wearing_armor:
+            t.armor_class.append(self)
+
+    def armor_class(self, dex: int) -> Tuple[int, str]:
+        return 13 + dex, "mage_armor"
+
+
+@dataclass(frozen=True, slots=True)
+class Spellbook(Effect):
+    book: Any
+
+    def apply(self, t: "EffectTotals") -> None:
+        # only the first spellbook counts
+        if not t.has_spellbook:
+            t.has_spellbook = True
+            t.spellbook = self.book
+
+
+@dataclass
+class EffectTotals:
+    """The effects of all feats or all items, applied in order."""
+
+    ability_bonuses: Dict[str, int] = field(default_factory=dict)
+    skill_proficiencies: set[str] = field(default_factory=set)
+    save_proficiencies: set[str] = field(default_factory=set)
+    save_bonuses: Dict[str, int] = field(default_factory=dict)
+    # armor and mage armor candidates in item order
+    armor_class: List[Any] = field(default_factory=list)
+    wearing_armor: bool = False
+    shield: int = 0
+    has_spellbook: bool = False
+    spellbook: Any = None
+
+    @classmethod
+    def of(cls, parts: Iterable[Tuple[Effect, ...]]) -> "EffectTotals":
+        t = cls()
+        for effects in parts:
+            for effect in effects:
+                effect.apply(t)
+        return t
+
+
+_NO_EFFECTS: Tuple[Effect, ...] = ()
+# Compiled effects keyed by the id() of the props they came from.  The props
+# are kept alongside, so a recycled id() is never mistaken for a hit, and
+# are treated as immutable once validated, as everywhere else in derive.
+_ITEM_EFFECTS: Dict[int, Tuple[Dict[str, Any], Tuple[Effect, ...]]] = {}
+_FEAT_EFFECTS: Dict[Tuple[int, int], Tuple[Mapping[str, Any], Mapping[str, Any], Tuple[Effect, ...]]] = {}
+_MAX_COMPILED = 4096
+_NAMED_SPELLBOOK: Tuple[Effect, ...] = (Spellbook({}),)
+_EMPTY_PROPS: Mapping[str, Any] = MappingProxyType({})
+_ITEM_PROPS = frozenset({
+    "armor", "shield_bonus", "ac_base", "ability_bonuses", "saving_throw_proficiencies",
+    "saving_throw_bonuses", "spellbook",
+})
+
+
+def _compile_feat(props: Mapping[str, Any]) -> Tuple[Effect, ...]:
+    effects: List[Effect] = []
+    for abil, bonus in (props.get("ability_bonuses") or {}).items():
+        effects.append(AbilityBonus(abil, int(bonus)))
+    for sk in props.get("skill_proficiencies", []) or []:
+        effects.append(SkillProficiency(sk))
+    for st in props.get("saving_throw_proficiencies", []) or []:
+        effects.append(SaveProficiency(st))
+    return tuple(effects)
+
+
+def feat_effects(data_props: Mapping[str, Any], own_props: Mapping[str, Any]) -> Tuple[Effect, ...]:
+    """Compile a feat's table props overridden by the character's own props."""
+    # a feat's table props live as long as the module; most characters add none
+    if not own_props:
+        if not data_props:
+            return _NO_EFFECTS
+        own_props = _EMPTY_PROPS
+    elif not data_props:
+        data_props = _EMPTY_PROPS
+    key = (id(data_props), id(own_props))
+    hit = _FEAT_EFFECTS.get(key)
+    if hit is not None and hit[0] is data_props and hit[1] is own_props:
+        return hit[2]
+    props = data_props
+    if own_props:
+        props = dict(data_props)
+        props.update(own_props)
+    effects = _compile_feat(props)
+    if len(_FEAT_EFFECTS) >= _MAX_COMPILED:
+        _FEAT_EFFECTS.clear()
+    _FEAT_EFFECTS[key] = (data_props, own_props, effects)
+    return effects
+
+
+def _compile_item(props: Dict[str, Any]) -> Tuple[Effect, ...]:
+    effects: List[Effect] = []
+    if "armor" in props:
+        armor = props["armor"] or {}
+        dex_cap = armor.get("dex_cap", None)
+        effects.append(Armor(
+            int(armor.get("base", 10)), armor.get("category", "light"), None if dex_cap is None else int(dex_cap)
+        ))
+    if "shield_bonus" in props:
+        effects.append(Shield(int(props["shield_bonus"])))
+    if "ac_base" in props:
+        effects.append(ACBase(props["ac_base"]))
+    for abil, bonus in (props.get("ability_bonuses") or {}).items():
+        effects.append(AbilityBonus(abil, int(bonus)))
+    for st in props.get("saving_throw_proficiencies", []) or []:
+        effects.append(SaveProficiency(st))
+    for key, val in (props.get("saving_throw_bonuses") or {}).items():
+        k = str(key).upper()
+        if k == "ALL":
+            effects.append(SaveBonus("all", int(val)))
+        elif k in ABILS:
+            effects.append(SaveBonus(k, int(val)))
+    if "spellbook" in props:
+        effects.append(Spellbook(props["spellbook"]))
+    return tuple(effects)
+
+
+def item_effects(item: models.Item, r: Optional[Dict[str, Any]] = None) -> Tuple[Effect, ...]:
+    """Compile an item's props into effects, reusing them while the props object lives.
+
+    Also the per-item function of the ``item_effects`` derive stage, which
+    passes the results so far as ``r``.
+    """
+    props = item.props
+    if not props or props.keys().isdisjoint(_ITEM_PROPS):
+        effects = _NO_EFFECTS
+    else:
+        hit = _ITEM_EFFECTS.get(id(props))
+        if hit is not None and hit[0] is props:
+            effects = hit[1]
+        else:
+            effects = _compile_item(props)
+            if len(_ITEM_EFFECTS) >= _MAX_COMPILED:
+                _ITEM_EFFECTS.clear()
+            _ITEM_EFFECTS[id(props)] = (props, effects)
+        if "spellbook" in props:
+            return effects
+    # an item named Spellbook is one even without props.spellbook
+    if item.name.lower() == "spellbook":
+        return effects + _NAMED_SPELLBOOK
+    return effects
+
+
+def _compute_ac(items: EffectTotals, mods: Dict[str,int]) -> Dict[str, Any]:
+    dex = mods.get("DEX", 0)
+    best = 10 + dex
+    source = "unarmored"
+    for effect in items.armor_class:
+        ac, kind = effect.armor_class(dex)
+        if ac > best:
+            best, source = ac, kind
+    shield = items.shield
+    return {"value": best + shield, "breakdown": {"base": best, "shield": shield}, "source": source}
 
 
-SPELL_BLOCKS = {
-    "bard": _bard_block,
-    "cleric": _cleric_block,
-    "druid": _druid_block,
-    "paladin": _paladin_block,
-    "ranger": _ranger_block,
-    "sorcerer": _sorcerer_block,
-    "warlock": _warlock_block,
-    "wizard": _wizard_block,
+# Slot progressions a caster descriptor can name
+SLOT_PROGRESSIONS: Dict[str, Dict[int, List[int]]] = {
+    "full": FULL_CASTER_SLOTS,
+    "half": HALF_CASTER_SLOTS,
+    "third": PCT_CASTER_SLOTS,
+    "pact": PACT_MAGIC_SLOTS,
 }
 
+_NO_SLOTS = [0]*9
+# memoized static blocks per caster; cleared when full
+_MAX_CACHED_BLOCKS = 4096
+
+
+@dataclass(frozen=True)
+class Caster:
+    """How one class casts spells.
+
+    Casters with a ``known`` table (spells known per level) list
+    ``known_spells``; the others prepare up to ``level // prepared_divisor``
+    plus their ability modifier.  ``spellbook`` casters prepare from a
+    spellbook item instead of ``char.spellcasting``.  ``pact`` slots are
+    reported as pact magic rather than added to the shared slots.
+    """
+
+    name: str
+    ability: str
+    slots: str = "full"
+    known: Optional[Mapping[int, int]] = None
+    prepared_divisor: int = 1
+    spellbook: bool = False
+    _blocks: Dict[Tuple[int, int, int], Tuple[Dict[str, Any], List[int]]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    @classmethod
+    def from_data(cls, name: str, data: Mapping[str, Any]) -> "Caster":
+        """Build a caster from a descriptor such as ``{"ability": "WIS", "slots": "half"}``."""
+        slots = str(data.get("slots", "full"))
+        if slots not in SLOT_PROGRESSIONS:
+            raise ValueError(f"Caster {name!r}: unknown slot progression {slots!r}")
+        known = data.get("known")
+        return cls(
+            name=str(name).lower(),
+            ability=str(data["ability"]).upper(),
+            slots=slots,
+            known=MappingProxyType({int(k): int(v) for k, v in known.items()}) if known is not None else None,
+            prepared_divisor=int(data.get("prepared_divisor", 1)),
+            spellbook=bool(data.get("spellbook", False)),
+        )
+
+    @property
+    def pact(self) -> bool:
+        return self.slots == "pact"
+
+    @property
+    def list_key(self) -> str:
+        return "prepared" if self.known is None else "known"
+
+    def static(self, level: int, mod: int, pb: int) -> Tuple[Dict[str, Any], List[int]]:
+        """The block fields that depend only on level, ability modifier and PB, and the slots."""
+        key = (level, mod, pb)
+        cached = self._blocks.get(key)
+        if cached is None:
+            if self.known is None:
+                cap = max(1, level // self.prepared_divisor + mod)
+            else:
+                cap = self.known.get(level, 0)
+            block = {
+                "class": self.name,
+                "spellcasting_ability": self.ability,
+                "spell_save_dc": 8 + pb + mod,
+                "spell_attack_mod": pb + mod,
+                f"{self.list_key}_max": cap,
+            }
+            if len(self._blocks) >= _MAX_CACHED_BLOCKS:
+                self._blocks.clear()
+            cached = self._blocks[key] = (block, SLOT_PROGRESSIONS[self.slots].get(level, _NO_SLOTS))
+        return cached
+
+    def spells(self, char: models.Character, cap: int, items: EffectTotals) -> Optional[List[str]]:
+        if not self.spellbook:
+            sc = char.spellcasting
+            return (sc.get(self.name, {}).get(self.list_key, []) if isinstance(sc, dict) else [])[:cap]
+        sb = items.spellbook
+        if sb is None:
+            return None
+        # first ``cap`` distinct spells, lowest spell level first
+        by_level = sb.get("prepared", {})
+        prepared: Dict[str, None] = {}
+        for L in range(1,10):
+            for s in by_level.get(str(L), []):
+                if len(prepared) >= cap:
+                    return list(prepared)
+                prepared.setdefault(s)
+        return list(prepared)
+
+    def block(
+        self, char: models.Character, mods: Dict[str, int], level: int, pb: int, items: EffectTotals
+    ) -> Optional[Tuple[Dict[str, Any], List[int]]]:
+        """Return the caster's output block for ``char`` and its slots (shared; do not modify)."""
+        static, slots = self.static(level, mods.get(self.ability, 0), pb)
+        spells = self.spells(char, static[f"{self.list_key}_max"], items)
+        if spells is None:
+            return None
+        block = dict(static)
+        block[f"{self.list_key}_spells"] = spells
+        return block, slots
+
+
+# Stock casters as data; homebrew adds more through a CASTERS mapping in a
+# "classes" subsystem module (see FiveEStockModule.casters)
+STOCK_CASTERS: Dict[str, Dict[str, Any]] = {
+    "bard": {"ability": "CHA", "slots": "full", "known": BARD_SPELLS_KNOWN},
+    "cleric": {"ability": "WIS", "slots": "full"},
+    "druid": {"ability": "WIS", "slots": "full"},
+    "paladin": {"ability": "CHA", "slots": "half", "prepared_divisor": 2},
+    "ranger": {"ability": "WIS", "slots": "half", "prepared_divisor": 2},
+    "sorcerer": {"ability": "CHA", "slots": "full", "known": SORCERER_SPELLS_KNOWN},
+    "warlock": {"ability": "CHA", "slots": "pact", "known": WARLOCK_SPELLS_KNOWN},
+    "wizard": {"ability": "INT", "slots": "full", "spellbook": True},
+}
 
-def _class_block(char: models.Character, mods: Dict[str, int]) -> Optional[Dict[str, Any]]:
-    cls = (char.class_ or "").lower()
-    data = CLASSES.get(cls)
-    if not data:
-        return None
-    level = int(char.level)
-    con_mod = mods.get("CON", 0)
+CASTERS: Mapping[str, Caster] = MappingProxyType(
+    {name: Caster.from_data(name, data) for name, data in STOCK_CASTERS.items()}
+)
+
+
+@dataclass(frozen=True)
+class ClassLevel:
+    """What a class grants at one level, independent of the character."""
+
+    features: Tuple[str, ...]
+    hit_point_base: int
+    # the CON modifier is added once per level, but at least once
+    con_levels: int
+    hit_dice: str
+    saving_throw_proficiencies: Mapping[str, bool]
+
+
+def _class_level(data: Dict[str, Any], level: int) -> ClassLevel:
     hd = int(data.get("hit_die", 0))
     avg = (hd // 2) + 1
-    hp = hd + con_mod
-    if level > 1:
-        hp += (level - 1) * (avg + con_mod)
     features: List[str] = []
     for L in range(1, level + 1):
         features.extend(data.get("features", {}).get(L, []))
-    st_prof = {a: (a in data.get("saving_throws", [])) for a in ABILS}
+    return ClassLevel(
+        features=tuple(features),
+        hit_point_base=hd + max(level - 1, 0) * avg,
+        con_levels=max(level, 1),
+        hit_dice=f"{level}d{hd}",
+        saving_throw_proficiencies=MappingProxyType({a: (a in data.get("saving_throws", [])) for a in ABILS}),
+    )
+
+
+# Class progression per (class, level) for levels 1..20, built once at import
+CLASS_LEVELS: Mapping[str, Mapping[int, ClassLevel]] = MappingProxyType({
+    cls: MappingProxyType({L: _class_level(data, L) for L in range(1, 21)})
+    for cls, data in CLASSES.items()
+    if data
+})
+
+
+def _class_block(char: models.Character, mods: Dict[str, int]) -> Optional[Dict[str, Any]]:
+    cls = (char.class_ or "").lower()
+    levels = CLASS_LEVELS.get(cls)
+    if levels is None:
+        return None
+    level = int(char.level)
+    row = levels.get(level) or _class_level(CLASSES[cls], level)
     return {
-        "hit_points": hp,
-        "hit_dice": f"{level}d{hd}",
-        "class_features": features,
-        "saving_throw_proficiencies": st_prof,
+        "hit_points": row.hit_point_base + row.con_levels * mods.get("CON", 0),
+        "hit_dice": row.hit_dice,
+        "class_features": list(row.features),
+        "saving_throw_proficiencies": row.saving_throw_proficiencies,
     }
 
 class FiveEStockModule(ModuleBase):
@@ -354,19 +554,39 @@ class FiveEStockModule(ModuleBase):
         # enabling companion templates.
         manifest.setdefault("subsystems", ["feats", "companions"])
         super().__init__(manifest)
-        # build quick lookup tables for feats
-        self.feats: Dict[str, Dict[str, Any]] = {}
-        for mod in self.subsystems.get("feats", []):
-            for ft in getattr(mod, "FEATS", []) or []:
-                name = str(ft.get("name", "")).lower()
-                if name:
-                    self.feats[name] = ft
-
-        # load companion templates if any are provided by subsystems
-        self.companions: Dict[str, Dict[str, Any]] = {}
-        for mod in self.subsystems.get("companions", []):
-            for name, data in getattr(mod, "COMPANIONS", {}).items():
-                self.companions[str(name).lower()] = data
+
+    @cached_property
+    def feats(self) -> Dict[str, Dict[str, Any]]:
+        # quick lookup table for feats, built on first use
+        feats: Dict[str, Dict[str, Any]] = {}
+        with span("fivee_stock: build feats table"):
+            for mod in self.subsystems.get("feats", []):
+                for ft in getattr(mod, "FEATS", []) or []:
+                    name = str(ft.get("name", "")).lower()
+                    if name:
+                        feats[name] = ft
+        return feats
+
+    @cached_property
+    def companions(self) -> Dict[str, Dict[str, Any]]:
+        # companion templates provided by subsystems, built on first use
+        companions: Dict[str, Dict[str, Any]] = {}
+        with span("fivee_stock: build companions table"):
+            for mod in self.subsystems.get("companions", []):
+                for name, data in getattr(mod, "COMPANIONS", {}).items():
+                    companions[str(name).lower()] = data
+        return companions
+
+    @cached_property
+    def casters(self) -> Mapping[str, Caster]:
+        # stock casters plus CASTERS descriptors from "classes" subsystems
+        casters: Dict[str, Caster] = dict(CASTERS)
+        with span("fivee_stock: build casters table"):
+            for mod in self.subsystems.get("classes", []):
+                for name, data in (getattr(mod, "CASTERS", {}) or {}).items():
+                    caster = Caster.from_data(name, data)
+                    casters[caster.name] = caster
+        return casters
 
     def id(self) -> str:
         return self.manifest.get("id", "fivee_stock")
@@ -410,80 +630,76 @@ class FiveEStockModule(ModuleBase):
                     issues.append(f"Feat {ft.name} requires one of: {choices}")
         return issues
 
+    @cached_property
+    def derive_plan(self) -> DerivePlan:
+        # ``derive`` in stages, so an edit reruns only what depends on it.
+        return DerivePlan(
+            [
+                Stage("feat_effects", self._feat_part, inputs=("feats",), each="feats", combine=_combine_effects),
+                Stage("item_effects", item_effects, inputs=("items",), each="items", combine=_combine_effects),
+                Stage("ability_mods", _ability_mods, inputs=("abilities",), needs=("feat_effects", "item_effects")),
+                Stage("proficiency_bonus", _proficiency_bonus, inputs=("level",)),
+                Stage("class_info", _class_info, inputs=("class", "level"), needs=("ability_mods",)),
+                Stage(
+                    "saves",
+                    _saves,
+                    inputs=("proficiencies",),
+                    needs=("class_info", "feat_effects", "item_effects", "ability_mods", "proficiency_bonus"),
+                ),
+                Stage("ac", _ac, needs=("item_effects", "ability_mods")),
+                Stage("skills", _skills, inputs=("skills",), needs=("feat_effects", "ability_mods", "proficiency_bonus")),
+                Stage(
+                    "spellcasting",
+                    self._spellcasting,
+                    inputs=("spellcasting", "class", "level"),
+                    needs=("item_effects", "ability_mods", "proficiency_bonus"),
+                ),
+                Stage(
+                    "companions",
+                    self._companion_block,
+                    inputs=("companions",),
+                    each="companions",
+                    combine=_combine_companions,
+                ),
+            ],
+            _assemble,
+        )
+
     def derive(self, char: models.Character):
-        scores = _get_scores(char)
-        # apply feat modifiers
-        skill_feat_profs: set[str] = set()
-        save_feat_profs: set[str] = set()
-        for ft in getattr(char, "feats", []) or []:
-            data = self.feats.get(str(ft.name).lower(), {})
-            props: Dict[str, Any] = {}
-            props.update(data.get("props", {}) or {})
-            props.update(getattr(ft, "props", {}) or {})
-            for abil, bonus in (props.get("ability_bonuses") or {}).items():
-                scores[abil] = scores.get(abil, 10) + int(bonus)
-            for sk in props.get("skill_proficiencies", []) or []:
-                skill_feat_profs.add(sk)
-            for st in props.get("saving_throw_proficiencies", []) or []:
-                save_feat_profs.add(st)
-
-        # apply item modifiers before computing ability mods
-        save_item_profs: set[str] = set()
-        save_item_bonuses: Dict[str, int] = {}
-        for it in getattr(char, "items", []) or []:
-            props = getattr(it, "props", {}) or {}
-            for abil, bonus in (props.get("ability_bonuses") or {}).items():
-                scores[abil] = scores.get(abil, 10) + int(bonus)
-            for st in props.get("saving_throw_proficiencies", []) or []:
-                save_item_profs.add(st)
-            for key, val in (props.get("saving_throw_bonuses") or {}).items():
-                k = str(key).upper()
-                if k == "ALL":
-                    save_item_bonuses["all"] = save_item_bonuses.get("all", 0) + int(val)
-                elif k in ABILS:
-                    save_item_bonuses[k] = save_item_bonuses.get(k, 0) + int(val)
-
-        amods = _mods(scores)
-        pb = proficiency_bonus(int(char.level))
-        class_info = _class_block(char, amods)
-        st_prof = class_info.get("saving_throw_proficiencies", {}) if class_info else {}
-        extra = getattr(getattr(char, "proficiencies", None), "saving_throws", {}) or {}
-        for k, v in extra.items():
-            if v:
-                st_prof[k] = True
-        for st in save_feat_profs:
-            st_prof[st] = True
-        for st in save_item_profs:
-            st_prof[st] = True
-        all_bonus = save_item_bonuses.get("all", 0)
-        saves = {
-            k: amods.get(k, 0)
-            + (pb if st_prof.get(k, False) else 0)
-            + all_bonus
-            + save_item_bonuses.get(k, 0)
-            for k in ABILS
-        }
-        ac = _compute_ac(char, amods)
-        # skill modifiers
-        skill_names = {sk.name for sk in getattr(char, "skills", [])}
-        skill_names.update(skill_feat_profs)
-        skill_map = {sk["name"]: sk["ability"] for sk in SKILLS}
-        skills_out = {
-            name: amods.get(ability, 0) + (pb if name in skill_names else 0)
-            for name, ability in skill_map.items()
-        }
-        out: Dict[str, Any] = {
-            "proficiency_bonus": pb,
-            "ability_mods": amods,
-            "saving_throws": saves,
-            "ac": ac,
-            "saving_throw_proficiencies": st_prof,
-            "skills": skills_out,
-        }
-        if save_item_bonuses:
-            out["saving_throw_bonuses"] = save_item_bonuses
-        if class_info:
-            out.update({k: v for k, v in class_info.items() if k != "saving_throw_proficiencies"})
+        plan = self.derive_plan
+        results, _parts = plan.run(char)
+        return plan.assemble(results)
+
+    def _feat_part(self, ft: models.Feat, r: Dict[str, Any]) -> Tuple[Effect, ...]:
+        data = self.feats.get(str(ft.name).lower(), {})
+        return feat_effects(data.get("props") or _EMPTY_PROPS, ft.props)
+
+    def _companion_block(self, comp: models.Companion, r: Dict[str, Any]) -> Dict[str, Any]:
+        # derive stats for one companion
+        key = (comp.template or comp.name).lower()
+        tpl = self.companions.get(key, {})
+        scores_c: Dict[str, int] = {}
+        for abil, val in (tpl.get("abilities") or {}).items():
+            scores_c[abil] = int(val)
+        for abil, obj in (comp.abilities or {}).items():
+            scores_c[abil] = int(getattr(obj, "score", obj))
+        cmods = _mods(scores_c)
+        cblock: Dict[str, Any] = {"name": comp.name}
+        if cmods:
+            cblock["ability_mods"] = cmods
+        for k in ("ac", "hit_points"):
+            if k in tpl:
+                cblock[k] = tpl[k]
+        bonuses: Dict[str, Any] = {}
+        bonuses.update(tpl.get("bonuses", {}) or {})
+        bonuses.update(getattr(comp, "bonuses", {}) or {})
+        if bonuses:
+            cblock["bonuses"] = bonuses
+        return cblock
+
+    def _spellcasting(self, char: models.Character, r: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        amods = r["ability_mods"]
+        pb = r["proficiency_bonus"]
         sc_data = getattr(char, "spellcasting", {}) or {}
         class_levels = sc_data.get("classes", {}) if isinstance(sc_data, dict) else {}
         if not class_levels and char.class_:
@@ -492,63 +708,134 @@ class FiveEStockModule(ModuleBase):
         blocks: List[Dict[str, Any]] = []
         slots = [0]*9
         pact_slots = [0]*9
+        casters = self.casters
         for cls, lvl in class_levels.items():
-            fn = SPELL_BLOCKS.get(str(cls).lower())
-            if not fn:
+            caster = casters.get(str(cls).lower())
+            if caster is None:
+                continue
+            out = caster.block(char, amods, int(lvl), pb, r["item_effects"])
+            if out is None:
                 continue
-            block = fn(char, amods, int(lvl), pb)
-            sl = block.pop("slots", [0]*9)
-            if str(cls).lower() == "warlock":
+            block, sl = out
+            if caster.pact:
                 pact_slots = [max(pact_slots[i], sl[i]) for i in range(9)]
             else:
-                for i in range(9):
-                    slots[i] += sl[i]
+                slots = [a + b for a, b in zip(slots, sl)]
             blocks.append(block)
 
-        if blocks:
-            sc_out: Dict[str, Any] = {
-                "classes": blocks,
-                "slots": {str(i+1): slots[i] for i in range(9)},
-            }
-            if any(pact_slots):
-                sc_out["pact_slots"] = {str(i+1): pact_slots[i] for i in range(9) if pact_slots[i]}
-            out["spellcasting"] = sc_out
-
-        # derive stats for any companions and aggregate their bonuses
-        comp_out: List[Dict[str, Any]] = []
-        help_bonus = False
-        shared_senses: List[str] = []
-        for comp in getattr(char, "companions", []) or []:
-            key = (comp.template or comp.name).lower()
-            tpl = self.companions.get(key, {})
-            scores_c: Dict[str, int] = {}
-            for abil, val in (tpl.get("abilities") or {}).items():
-                scores_c[abil] = int(val)
-            for abil, obj in (comp.abilities or {}).items():
-                scores_c[abil] = int(getattr(obj, "score", obj))
-            cmods = _mods(scores_c)
-            cblock: Dict[str, Any] = {"name": comp.name}
-            if cmods:
-                cblock["ability_mods"] = cmods
-            for k in ("ac", "hit_points"):
-                if k in tpl:
-                    cblock[k] = tpl[k]
-            bonuses: Dict[str, Any] = {}
-            bonuses.update(tpl.get("bonuses", {}) or {})
-            bonuses.update(getattr(comp, "bonuses", {}) or {})
-            if bonuses:
-                cblock["bonuses"] = bonuses
-                if bonuses.get("help_action"):
-                    help_bonus = True
-                if bonuses.get("shared_senses"):
-                    shared_senses.extend(bonuses.get("shared_senses", []))
-            comp_out.append(cblock)
-        if comp_out:
-            out["companions"] = comp_out
-        if help_bonus or shared_senses:
-            bon = out.setdefault("bonuses", {})
-            if help_bonus:
-                bon["help_action"] = True
-            if shared_senses:
-                bon["shared_senses"] = sorted(set(shared_senses))
-        return out
+        if not blocks:
+            return None
+        sc_out: Dict[str, Any] = {
+            "classes": blocks,
+            "slots": {str(i+1): slots[i] for i in range(9)},
+        }
+        if any(pact_slots):
+            sc_out["pact_slots"] = {str(i+1): pact_slots[i] for i in range(9) if pact_slots[i]}
+        return sc_out
+
+
+# Derive stages: each takes the character (or, for mapped stages, one
+# element) and the results of earlier stages.
+
+def _combine_effects(parts: List[Tuple[Effect, ...]], r: Dict[str, Any]) -> EffectTotals:
+    return EffectTotals.of(parts)
+
+
+def _combine_companions(blocks: List[Dict[str, Any]], r: Dict[str, Any]) -> Dict[str, Any]:
+    # aggregate the bonuses companions grant their owner
+    help_bonus = False
+    shared_senses: List[str] = []
+    for cblock in blocks:
+        bonuses = cblock.get("bonuses") or {}
+        if bonuses.get("help_action"):
+            help_bonus = True
+        if bonuses.get("shared_senses"):
+            shared_senses.extend(bonuses.get("shared_senses", []))
+    return {"blocks": blocks, "help_action": help_bonus, "shared_senses": shared_senses}
+
+
+def _ability_mods(char: models.Character, r: Dict[str, Any]) -> Dict[str, int]:
+    # feat, then item modifiers apply before computing ability mods
+    scores = _get_scores(char)
+    for source in ("feat_effects", "item_effects"):
+        for abil, bonus in r[source].ability_bonuses.items():
+            scores[abil] = scores.get(abil, 10) + bonus
+    return _mods(scores)
+
+
+def _proficiency_bonus(char: models.Character, r: Dict[str, Any]) -> int:
+    return proficiency_bonus(int(char.level))
+
+
+def _class_info(char: models.Character, r: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    return _class_block(char, r["ability_mods"])
+
+
+def _saves(char: models.Character, r: Dict[str, Any]) -> Dict[str, Any]:
+    amods = r["ability_mods"]
+    pb = r["proficiency_bonus"]
+    class_info = r["class_info"]
+    save_item_bonuses = r["item_effects"].save_bonuses
+    st_prof = dict(class_info.get("saving_throw_proficiencies", {})) if class_info else {}
+    extra = getattr(getattr(char, "proficiencies", None), "saving_throws", {}) or {}
+    for k, v in extra.items():
+        if v:
+            st_prof[k] = True
+    for st in r["feat_effects"].save_proficiencies:
+        st_prof[st] = True
+    for st in r["item_effects"].save_proficiencies:
+        st_prof[st] = True
+    all_bonus = save_item_bonuses.get("all", 0)
+    saves = {
+        k: amods.get(k, 0)
+        + (pb if st_prof.get(k, False) else 0)
+        + all_bonus
+        + save_item_bonuses.get(k, 0)
+        for k in ABILS
+    }
+    return {"saving_throws": saves, "proficiencies": st_prof}
+
+
+def _ac(char: models.Character, r: Dict[str, Any]) -> Dict[str, Any]:
+    return _compute_ac(r["item_effects"], r["ability_mods"])
+
+
+def _skills(char: models.Character, r: Dict[str, Any]) -> Dict[str, int]:
+    amods = r["ability_mods"]
+    pb = r["proficiency_bonus"]
+    skill_names = {sk.name for sk in getattr(char, "skills", [])}
+    skill_names.update(r["feat_effects"].skill_proficiencies)
+    return {
+        sk["name"]: amods.get(sk["ability"], 0) + (pb if sk["name"] in skill_names else 0)
+        for sk in SKILLS
+    }
+
+
+def _assemble(r: Dict[str, Any]) -> Dict[str, Any]:
+    saves = r["saves"]
+    out: Dict[str, Any] = {
+        "proficiency_bonus": r["proficiency_bonus"],
+        "ability_mods": r["ability_mods"],
+        "saving_throws": saves["saving_throws"],
+        "ac": r["ac"],
+        "saving_throw_proficiencies": saves["proficiencies"],
+        "skills": r["skills"],
+    }
+    save_item_bonuses = r["item_effects"].save_bonuses
+    if save_item_bonuses:
+        out["saving_throw_bonuses"] = save_item_bonuses
+    class_info = r["class_info"]
+    if class_info:
+        out.update({k: v for k, v in class_info.items() if k != "saving_throw_proficiencies"})
+    if r["spellcasting"] is not None:
+        out["spellcasting"] = r["spellcasting"]
+    companions = r["companions"]
+    if companions["blocks"]:
+        out["companions"] = companions["blocks"]
+    if companions["help_action"] or companions["shared_senses"]:
+        bon = out.setdefault("bonuses", {})
+        if companions["help_action"]:
+            bon["help_action"] = True
+        if companions["shared_senses"]:
+            bon["shared_senses"] = sorted(set(companions["shared_senses"]))
+    return out
@@ -0,0 +1,267 @@
+"""Columnar derivation of many fivee_stock characters at once.
+
+League reports derive tens of thousands of characters and only read a
+handful of numbers from each.  :meth:`Roster.pack` reads the inputs those
+numbers depend on into NumPy arrays, one row per character, and
+:meth:`Roster.derive` computes them for the whole roster in batched array
+operations::
+
+    roster = Roster.pack(module, characters)
+    out = roster.derive()
+    out.saving_throws[:, ABILS.index("DEX")]
+
+The results equal what ``module.derive`` reports for each character:
+ability modifiers, proficiency bonus, saving throws, skills, AC and the
+spell save DC of every caster class.  Everything else (class features,
+spell lists, companions) still needs the scalar derive.
+
+Requires the ``roster`` extra (``pip install -e .[roster]``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError("the fivee_stock roster engine needs NumPy: pip install -e .[roster]") from exc
+
+from dndcs.core import models
+from dndcs.modules.fivee_stock.classes import CLASSES
+from dndcs.modules.fivee_stock.module import (
+    ABILS,
+    SKILLS,
+    ACBase,
+    Armor,
+    EffectTotals,
+    feat_effects,
+    item_effects,
+)
+
+# classes with saving throw proficiencies, in class id order; unknown
+# classes get the id len(CLASS_IDS), a row of no proficiencies
+CLASS_IDS: Tuple[str, ...] = tuple(sorted(name for name, data in CLASSES.items() if data))
+CLASS_SAVES = np.array(
+    [[a in (CLASSES[name].get("saving_throws", []) or []) for a in ABILS] for name in CLASS_IDS]
+    + [[False] * len(ABILS)],
+    dtype=bool,
+)
+SKILL_NAMES: Tuple[str, ...] = tuple(sk["name"] for sk in SKILLS)
+SKILL_ABILITY = np.array([ABILS.index(sk["ability"]) for sk in SKILLS], dtype=np.intp)
+# dex cap of armor without one
+_NO_CAP = np.iinfo(np.int64).max // 2
+
+
+@dataclass
+class RosterResult:
+    """Derived columns, one row per character of the :class:`Roster`.
+
+    ``ability_mods`` only holds a value where ``has_ability`` is set; the
+    scalar derive leaves those abilities out.  ``spell_save_dc`` has a
+    column per name in ``casters`` and is only meaningful where ``casts``.
+    """
+
+    ability_mods: np.ndarray
+    has_ability: np.ndarray
+    proficiency_bonus: np.ndarray
+    saving_throws: np.ndarray
+    skills: np.ndarray
+    ac: np.ndarray
+    casters: Tuple[str, ...]
+    spell_save_dc: np.ndarray
+    casts: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.proficiency_bonus)
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """Character ``i`` in the shape of the matching ``derive`` fields."""
+        return {
+            "proficiency_bonus": int(self.proficiency_bonus[i]),
+            "ability_mods": {a: int(m) for a, m, has in zip(ABILS, self.ability_mods[i], self.has_ability[i]) if has},
+            "saving_throws": {a: int(v) for a, v in zip(ABILS, self.saving_throws[i])},
+            "skills": {name: int(v) for name, v in zip(SKILL_NAMES, self.skills[i])},
+            "ac": int(self.ac[i]),
+            "spell_save_dc": {
+                name: int(dc) for name, dc, cast in zip(self.casters, self.spell_save_dc[i], self.casts[i]) if cast
+            },
+        }
+
+
+@dataclass
+class Roster:
+    """Packed inputs of many characters; build with :meth:`pack`.
+
+    Armor is kept as flat candidate arrays (``armor_owner`` is the row
+    each piece belongs to) because characters carry any number of them.
+    """
+
+    scores: np.ndarray
+    has_ability: np.ndarray
+    level: np.ndarray
+    class_id: np.ndarray
+    save_proficiencies: np.ndarray
+    save_bonuses: np.ndarray
+    save_bonus_all: np.ndarray
+    skill_proficiencies: np.ndarray
+    armor_owner: np.ndarray
+    armor_base: np.ndarray
+    armor_dex: np.ndarray
+    armor_cap: np.ndarray
+    shield: np.ndarray
+    casters: Tuple[str, ...]
+    caster_ability: np.ndarray
+    casts: np.ndarray
+
+    @classmethod
+    def pack(cls, module: Any, chars: Sequence[models.Character]) -> "Roster":
+        """Read the inputs of ``chars`` through ``module``'s feat and caster tables."""
+        abil_index = {a: i for i, a in enumerate(ABILS)}
+        skill_index = {name: i for i, name in enumerate(SKILL_NAMES)}
+        class_index = {name: i for i, name in enumerate(CLASS_IDS)}
+        caster_table: Mapping[str, Any] = module.casters
+        casters = tuple(sorted(caster_table))
+        caster_index = {name: i for i, name in enumerate(casters)}
+        no_abilities = [False] * len(ABILS)
+
+        # one list per column, converted to arrays at the end
+        scores: List[List[int]] = []
+        has_ability: List[List[bool]] = []
+        level: List[int] = []
+        class_id: List[int] = []
+        save_prof: List[List[bool]] = []
+        save_bonuses: List[List[int]] = []
+        save_bonus_all: List[int] = []
+        skill_prof: List[List[bool]] = []
+        shield: List[int] = []
+        casts: List[List[bool]] = []
+        armor: List[Tuple[int, int, bool, int]] = []
+
+        feat_table = module.feats
+        for row, char in enumerate(chars):
+            feats = EffectTotals.of(
+                feat_effects(feat_table.get(str(ft.name).lower(), {}).get("props") or {}, ft.props)
+                for ft in char.feats
+            )
+            items = EffectTotals.of(item_effects(item) for item in char.items)
+
+            sc_row = [10] * len(ABILS)
+            has_row = list(no_abilities)
+            for abil, score in char.abilities.items():
+                i = abil_index.get(abil)
+                if i is not None and score:
+                    sc_row[i] = int(score.score)
+                    has_row[i] = True
+            for totals in (feats, items):
+                for abil, bonus in totals.ability_bonuses.items():
+                    i = abil_index.get(abil)
+                    if i is not None:
+                        sc_row[i] += bonus
+                        has_row[i] = True
+            scores.append(sc_row)
+            has_ability.append(has_row)
+
+            level.append(int(char.level))
+            class_id.append(class_index.get((char.class_ or "").lower(), len(CLASS_IDS)))
+
+            prof_row = list(no_abilities)
+            extra = getattr(getattr(char, "proficiencies", None), "saving_throws", {}) or {}
+            for abil in [k for k, v in extra.items() if v] + [*feats.save_proficiencies, *items.save_proficiencies]:
+                i = abil_index.get(abil)
+                if i is not None:
+                    prof_row[i] = True
+            save_prof.append(prof_row)
+            bonuses = items.save_bonuses
+            save_bonuses.append([bonuses.get(a, 0) for a in ABILS] if bonuses else [0] * len(ABILS))
+            save_bonus_all.append(bonuses.get("all", 0))
+
+            skill_row = [False] * len(SKILL_NAMES)
+            for name in [sk.name for sk in char.skills] + list(feats.skill_proficiencies):
+                i = skill_index.get(name)
+                if i is not None:
+                    skill_row[i] = True
+            skill_prof.append(skill_row)
+
+            for effect in items.armor_class:
+                if isinstance(effect, Armor):
+                    cap = _NO_CAP if effect.dex_cap is None else effect.dex_cap
+                    armor.append((row, effect.base, effect.category in ("light", "medium"), cap))
+                elif isinstance(effect, ACBase):
+                    armor.append((row, 13, True, _NO_CAP))
+            shield.append(items.shield)
+
+            cast_row = [False] * len(casters)
+            sc = char.spellcasting
+            class_levels = sc.get("classes", {}) if isinstance(sc, dict) else {}
+            if not class_levels and char.class_:
+                class_levels = {str(char.class_).lower(): int(char.level)}
+            for name in class_levels:
+                caster = caster_table.get(str(name).lower())
+                # spellbook casters without a spellbook get no block
+                if caster is not None and not (caster.spellbook and items.spellbook is None):
+                    cast_row[caster_index[caster.name]] = True
+            casts.append(cast_row)
+
+        n = len(chars)
+        owner, base, dex, cap = (list(col) for col in zip(*armor)) if armor else ([], [], [], [])
+        return cls(
+            scores=np.array(scores, dtype=np.int64).reshape(n, len(ABILS)),
+            has_ability=np.array(has_ability, dtype=bool).reshape(n, len(ABILS)),
+            level=np.array(level, dtype=np.int64),
+            class_id=np.array(class_id, dtype=np.intp),
+            save_proficiencies=np.array(save_prof, dtype=bool).reshape(n, len(ABILS)),
+            save_bonuses=np.array(save_bonuses, dtype=np.int64).reshape(n, len(ABILS)),
+            save_bonus_all=np.array(save_bonus_all, dtype=np.int64),
+            skill_proficiencies=np.array(skill_prof, dtype=bool).reshape(n, len(SKILL_NAMES)),
+            armor_owner=np.array(owner, dtype=np.intp),
+            armor_base=np.array(base, dtype=np.int64),
+            armor_dex=np.array(dex, dtype=bool),
+            armor_cap=np.array(cap, dtype=np.int64),
+            shield=np.array(shield, dtype=np.int64),
+            casters=casters,
+            # abilities outside ABILS read the zero column after the six
+            caster_ability=np.array(
+                [abil_index.get(caster_table[name].ability, len(ABILS)) for name in casters], dtype=np.intp
+            ),
+            casts=np.array(casts, dtype=bool).reshape(n, len(casters)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.level)
+
+    def derive(self) -> RosterResult:
+        """Compute the derived columns for every character."""
+        mods = (self.scores - 10) // 2
+        # an ability the character lacks counts as +0, as in the scalar derive
+        mods_or_zero = np.where(self.has_ability, mods, 0)
+        pb = 2 + (self.level - 1) // 4
+
+        save_prof = self.save_proficiencies | CLASS_SAVES[self.class_id]
+        saves = mods_or_zero + pb[:, None] * save_prof + self.save_bonus_all[:, None] + self.save_bonuses
+
+        skills = mods_or_zero[:, SKILL_ABILITY] + pb[:, None] * self.skill_proficiencies
+
+        dex = mods_or_zero[:, ABILS.index("DEX")]
+        best = 10 + dex
+        if len(self.armor_owner):
+            owner_dex = dex[self.armor_owner]
+            candidate = self.armor_base + np.where(self.armor_dex, np.minimum(owner_dex, self.armor_cap), 0)
+            np.maximum.at(best, self.armor_owner, candidate)
+        ac = best + self.shield
+
+        padded = np.concatenate([mods_or_zero, np.zeros((len(self), 1), dtype=mods_or_zero.dtype)], axis=1)
+        spell_save_dc = 8 + pb[:, None] + padded[:, self.caster_ability]
+
+        return RosterResult(
+            ability_mods=mods,
+            has_ability=self.has_ability.copy(),
+            proficiency_bonus=pb,
+            saving_throws=saves,
+            skills=skills,
+            ac=ac,
+            casters=self.casters,
+            spell_save_dc=spell_save_dc,
+            casts=self.casts.copy(),
+        )
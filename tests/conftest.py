@@ -1,3 +1,7 @@
+import json
+import os
+from pathlib import Path
+
 import pytest
 from dndcs.core import models
 
@@ -56,3 +60,47 @@ def character(class_name, level, ability_scores):
         abilities=ability_scores(),
         items=items,
     )
+
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+@pytest.fixture
+def wizard_payload():
+    """The level 17 wizard in ``tests/data`` as a fresh request payload."""
+    return json.loads((DATA_DIR / "wizard_l17.json").read_text())
+
+
+def _write_module(root, mod_id="cachedmod", body="    pass\n", bump=0):
+    mod_dir = root / mod_id
+    mod_dir.mkdir(exist_ok=True)
+    (mod_dir / "manifest.yaml").write_text(f"id: {mod_id}\nentry_point: module.py:MyModule\n")
+    src = mod_dir / "module.py"
+    src.write_text(
+        "from dndcs.core.module_base import ModuleBase\n"
+        "class MyModule(ModuleBase):\n" + body
+    )
+    if bump:
+        # Move the mtime on by whole seconds so coarse filesystems notice.
+        st = src.stat()
+        os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + bump * 1_000_000_000))
+    return mod_dir
+
+
+@pytest.fixture
+def write_module():
+    """``write_module(root, mod_id, body, bump)`` creates a minimal rules module."""
+    return _write_module
+
+
+def _write_manifest(root, folder, mod_id=None, extra=""):
+    mod_dir = root / folder
+    mod_dir.mkdir(parents=True)
+    (mod_dir / "manifest.yaml").write_text(f"id: {mod_id or folder}\nname: {folder}\n{extra}")
+    return mod_dir
+
+
+@pytest.fixture
+def write_manifest():
+    """``write_manifest(root, folder, mod_id, extra)`` creates a bare manifest."""
+    return _write_manifest
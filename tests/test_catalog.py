@@ -0,0 +1,35 @@
+from dndcs_core.services.catalog import Catalog, CatalogMapping, write_catalog
+from dndcs.modules.fivee_stock.spells import example as spells
+
+
+def test_catalog_round_trip_and_lazy_decode(tmp_path):
+    records = [
+        {"name": "Alpha", "tags": ["x", "y"], "body": "é" * 50},
+        {"name": "Beta", "tags": ["y"], "body": "b"},
+        {"name": "Gamma", "tags": [], "body": "c"},
+    ]
+    path = tmp_path / "data.jsonl"
+    assert write_catalog(path, records, ["name", "tags", "pos"], extra=[{"pos": i} for i in range(3)]) == 3
+    cat = Catalog(path)
+    assert len(cat) == 3
+    assert cat.value(1, "name") == "Beta"
+    assert cat.value(2, "pos") == 2
+    by_tag = cat.group("tags")
+    assert sorted(by_tag) == ["x", "y"]
+    assert cat.decoded() == 0
+    names = CatalogMapping(cat, cat.lookup("name", str.lower))
+    assert names["gamma"] == records[2]
+    assert cat.decoded() == 1
+    assert list(cat.view(by_tag["y"])) == records[:2]
+    assert list(cat.view()) == records
+
+
+def test_spell_catalog_views():
+    wish = spells.get_spell("WISH")
+    assert wish["level"] == 9
+    assert spells.SPELLS_BY_NAME["wish"] is wish
+    assert "wizard" in spells.SPELLS_BY_CLASS
+    assert spells.search(cls="nope") == []
+    fire = spells.search(name="fire", cls="wizard")
+    assert fire and all("fire" in s["name"].lower() and "wizard" in s["classes"] for s in fire)
+    assert len(spells.SPELLS) == len(list(spells.SPELLS))
@@ -1,3 +1,6 @@
+import pytest
+
+from dndcs.core import models
 from dndcs.modules.fivee_stock.module import FiveEStockModule
 from dndcs.modules.fivee_stock.classes.basic import CLASSES
 
@@ -12,3 +15,23 @@ def test_class_features_progression(character, class_name, level):
             expected.extend(names)
     for feat in expected:
         assert feat in feats
+
+
+def test_progression_tables_are_precomputed_and_read_only():
+    from dndcs.modules.fivee_stock.module import CLASS_LEVELS
+
+    assert set(CLASS_LEVELS) == set(CLASSES)
+    row = CLASS_LEVELS["fighter"][5]
+    assert row.hit_point_base == 10 + 4 * 6 and row.con_levels == 5 and row.hit_dice == "5d10"
+    with pytest.raises(TypeError):
+        row.saving_throw_proficiencies["DEX"] = True
+    with pytest.raises(TypeError):
+        CLASS_LEVELS["fighter"][21] = row
+
+
+def test_levels_outside_the_tables_still_derive(ability_scores):
+    mod = FiveEStockModule({"id": "fivee_stock"})
+    char = models.Character(name="Old", level=25, module="fivee_stock", class_="barbarian", abilities=ability_scores(CON=14))
+    out = mod.derive(char)
+    assert out["hit_dice"] == "25d12" and out["hit_points"] == 12 + 24 * 7 + 25 * 2
+    assert "Primal Path" in out["class_features"]
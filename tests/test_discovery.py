@@ -1,5 +1,3 @@
-from pathlib import Path
-
 from dndcs.core import discovery
 
 
@@ -20,3 +18,27 @@ def test_module_search_paths_dedup(monkeypatch, tmp_path):
     paths = discovery.module_search_paths(extra=[tmp_path])
     resolved = [p.resolve() for p in paths]
     assert resolved.count(tmp_path.resolve()) == 1
+
+
+def test_module_index_lookups_and_shadowing(tmp_path, write_manifest):
+    first, second = tmp_path / "a", tmp_path / "b"
+    winner = write_manifest(first, "mymod", "mymod", "icon: assets/icon.png\n")
+    (winner / "assets").mkdir()
+    loser = write_manifest(second, "mymod_copy", "mymod")
+    write_manifest(second, "other", "other")
+    index = discovery.ModuleIndex([first, second])
+    assert index.ids() == ["mymod", "other"]
+    assert index.get("mymod")["__manifest_dir__"] == str(winner)
+    assert index.shadowed == {"mymod": [str(loser)]}
+    assert index.asset_root("mymod") == winner / "assets"
+    assert index.asset_root("other") is None
+    listing = {m["id"]: m for m in index.listing()}
+    assert listing["mymod"]["icon"] == "/mods/mymod/assets/icon.png"
+
+
+def test_module_index_staleness(tmp_path, write_manifest):
+    index = discovery.ModuleIndex([tmp_path])
+    assert not index.is_stale([tmp_path])
+    write_manifest(tmp_path, "late", "late")
+    assert index.is_stale([tmp_path])
+    assert "late" in discovery.ModuleIndex([tmp_path])
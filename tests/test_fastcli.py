@@ -0,0 +1,76 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from dndcs.cli import main as cli_main
+
+REPO = Path(__file__).resolve().parents[1]
+
+# Generous bound for the in-process cost of a fast-path lookup on a cold
+# interpreter; the import chain itself is ~10ms on a laptop.
+COLD_START_TARGET_S = 0.25
+
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+try:
+    from dndcs.fastcli import main
+    main(sys.argv[1:])
+except SystemExit as exc:
+    if exc.code:
+        raise
+finally:
+    elapsed = time.perf_counter() - start
+    heavy = [m for m in ("click", "pydantic", "yaml", "fastapi", "uvicorn", "dndcs.logger") if m in sys.modules]
+    sys.stderr.write("\\n" + json.dumps({"elapsed": elapsed, "heavy": heavy}) + "\\n")
+"""
+
+
+def _run_fast(tmp_path, *args):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(REPO)] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else []))
+    proc = subprocess.run(
+        [sys.executable, "-c", _CHILD, *args], cwd=tmp_path, env=env, capture_output=True, text=True
+    )
+    assert proc.returncode == 0, proc.stderr
+    *err, report = proc.stderr.rstrip("\n").split("\n")
+    return proc.stdout, "\n".join(err).strip(), json.loads(report)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["spells", "find", "fireball"],
+        ["spells", "for-class", "Wizard"],
+        ["spells", "search", "--name", "fire", "--class=wizard"],
+    ],
+)
+def test_fast_path_matches_click_and_stays_light(tmp_path, monkeypatch, args):
+    out, err, report = _run_fast(tmp_path, *args)
+    assert report["heavy"] == []
+    assert report["elapsed"] < COLD_START_TARGET_S
+    assert not (tmp_path / "logs").exists()
+
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(cli_main, args)
+    assert result.exit_code == 0
+    assert out == result.output
+    assert not (tmp_path / "logs").exists()
+
+
+def test_fast_path_reports_missing_spell(tmp_path):
+    out, err, report = _run_fast(tmp_path, "spells", "find", "No Such Spell")
+    assert out == ""
+    assert err == "Spell not found"
+    assert report["heavy"] == []
+
+
+def test_other_commands_fall_back_to_click(tmp_path):
+    out, _err, report = _run_fast(tmp_path, "spells", "--help")
+    assert "Spell search helpers." in out
+    assert "click" in report["heavy"]
@@ -0,0 +1,85 @@
+import pytest
+
+from dndcs.core import loader, models
+from dndcs.core.incremental import DerivePlan, Stage, derive_incremental, derive_state
+from dndcs.core.jsonpatch import PatchConflict, apply_patch
+
+
+@pytest.fixture
+def module():
+    return loader.load_module_by_manifest_id("fivee_stock")
+
+
+@pytest.fixture
+def character(wizard_payload):
+    return dict(
+        wizard_payload,
+        items=wizard_payload["items"]
+        + [
+            {"name": "Belt", "props": {"ability_bonuses": {"STR": 2}}},
+            {"name": "Cloak", "props": {"saving_throw_bonuses": {"all": 1}}},
+            {"name": "Rope", "quantity": 1},
+        ],
+        feats=[{"name": "Keen Mind"}],
+        companions=[{"name": "Hoot", "template": "owl"}, {"name": "Rex", "template": "wolf"}],
+    )
+
+
+@pytest.mark.parametrize(
+    "patch, rerun",
+    [
+        ([{"op": "replace", "path": "/notes", "value": "x"}], []),
+        ([{"op": "replace", "path": "/abilities/DEX/score", "value": 18}], None),
+        ([{"op": "replace", "path": "/level", "value": 3}], None),
+        ([{"op": "replace", "path": "/items/5/quantity", "value": 2}], ["item_effects"]),
+        ([{"op": "remove", "path": "/items/3"}], None),
+        ([{"op": "replace", "path": "/items/3/props/ability_bonuses/STR", "value": 4}], None),
+        ([{"op": "replace", "path": "/companions/1/name", "value": "Max"}], ["companions"]),
+        ([{"op": "add", "path": "/companions/-", "value": {"name": "Tiny", "template": "cat"}}], ["companions"]),
+        ([{"op": "add", "path": "/feats/-", "value": {"name": "Actor"}}], None),
+        ([{"op": "add", "path": "/class", "value": "cleric"}], None),
+    ],
+)
+def test_incremental_matches_full_derive(module, character, patch, rerun):
+    state = module.derive_state(character)
+    patched = module.derive_incremental(state, patch)
+    edited, _ = apply_patch(character, patch)
+    assert patched.output == module.derive(models.Character.model_validate(edited))
+    assert patched.payload == edited
+    if rerun is not None:
+        assert patched.rerun == rerun
+
+
+def test_unchanged_stage_results_stop_propagating(module, character):
+    state = module.derive_state(character)
+    # The belt takes STR 8 to 10; at 11 the modifier is still 0.
+    patch = [{"op": "replace", "path": "/items/3/props/ability_bonuses/STR", "value": 3}]
+    bumped = module.derive_incremental(state, patch)
+    assert bumped.rerun == ["item_effects", "ability_mods", "saves", "ac", "spellcasting"]
+    assert bumped.results["class_info"] is state.results["class_info"]
+
+
+def test_invalid_edits_raise(module, character):
+    state = module.derive_state(character)
+    with pytest.raises(PatchConflict):
+        module.derive_incremental(state, [{"op": "remove", "path": "/nonexistent"}])
+    with pytest.raises(ValueError, match="name: field required"):
+        module.derive_incremental(state, [{"op": "remove", "path": "/name"}])
+    with pytest.raises(ValueError):
+        module.derive_incremental(state, [{"op": "replace", "path": "/items/0", "value": {"quantity": 1}}])
+
+
+def test_modules_without_a_plan_rerun_derive(character):
+    class Plain:
+        def derive(self, char):
+            return {"level": char.level}
+
+    state = derive_state(Plain(), character)
+    assert derive_incremental(Plain(), state, [{"op": "replace", "path": "/level", "value": 2}]).output == {"level": 2}
+
+
+def test_plan_checks_stage_order():
+    with pytest.raises(ValueError, match="must come before"):
+        DerivePlan([Stage("b", lambda c, r: 1, needs=("a",)), Stage("a", lambda c, r: 1)], dict)
+    with pytest.raises(ValueError, match="maps over"):
+        DerivePlan([Stage("a", lambda e, r: 1, each="items")], dict)
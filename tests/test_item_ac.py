@@ -38,3 +38,34 @@ def test_mage_armor_ac(ability_scores):
     ac = mod.derive(char)["ac"]
     assert ac["value"] == 16
     assert ac["source"] == "mage_armor"
+
+
+def test_mage_armor_only_counts_before_armor(ability_scores):
+    mod = FiveEStockModule({"id": "fivee_stock"})
+    mage_armor = models.Item(name="Mage Armor", props={"ac_base": 13})
+    leather = models.Item(name="Leather", props={"armor": {"base": 11, "category": "light"}})
+
+    def ac(items):
+        char = models.Character(
+            name="Sorcerer",
+            level=3,
+            module="fivee_stock",
+            class_="sorcerer",
+            abilities=ability_scores(DEX=16),
+            items=items,
+        )
+        return mod.derive(char)["ac"]
+
+    assert ac([mage_armor, leather])["source"] == "mage_armor"
+    assert ac([leather, mage_armor])["value"] == 14
+
+
+def test_item_effects_are_compiled_once_per_props():
+    from dndcs.modules.fivee_stock.module import AbilityBonus, Shield, Spellbook, item_effects
+
+    item = models.Item(name="Shield +1", props={"shield_bonus": 3, "ability_bonuses": {"STR": 1}, "weight": 6})
+    effects = item_effects(item)
+    assert effects == (Shield(3), AbilityBonus("STR", 1))
+    assert item_effects(item) is effects
+    assert item_effects(models.Item(name="Rope", props={"weight": 10})) == ()
+    assert item_effects(models.Item(name="spellbook")) == (Spellbook({}),)
@@ -0,0 +1,76 @@
+import copy
+
+import pytest
+
+from dndcs.core.jsonpatch import InvalidPatch, PatchConflict, apply_patch, parse_pointer
+
+
+DOC = {"name": "A", "items": [{"name": "x", "props": {}}, {"name": "y"}], "abilities": {"STR": {"score": 10}}}
+
+
+def test_operations_follow_rfc_6902():
+    before = copy.deepcopy(DOC)
+    doc, changes = apply_patch(
+        DOC,
+        [
+            {"op": "test", "path": "/name", "value": "A"},
+            {"op": "replace", "path": "/abilities/STR/score", "value": 12},
+            {"op": "add", "path": "/items/-", "value": {"name": "z"}},
+            {"op": "copy", "from": "/items/0/name", "path": "/notes"},
+            {"op": "move", "from": "/notes", "path": "/title"},
+            {"op": "remove", "path": "/items/1"},
+        ],
+    )
+    assert doc["abilities"]["STR"]["score"] == 12
+    assert [i["name"] for i in doc["items"]] == ["x", "z"]
+    assert doc["title"] == "x" and "notes" not in doc
+    assert changes == {"abilities": {"STR"}, "items": None, "notes": None, "title": None}
+    # The input is untouched and unpatched branches are shared.
+    assert DOC == before
+    assert doc["items"][0] is DOC["items"][0]
+
+
+def test_element_changes_are_reported_by_key():
+    _, changes = apply_patch(DOC, [{"op": "replace", "path": "/items/1/name", "value": "w"}])
+    assert changes == {"items": {"1"}}
+    _, changes = apply_patch(DOC, [{"op": "replace", "path": "/items/1", "value": {"name": "w"}}])
+    assert changes == {"items": {"1"}}
+    _, changes = apply_patch(DOC, [{"op": "replace", "path": "", "value": {}}])
+    assert changes is None
+
+
+def test_pointer_escapes():
+    assert parse_pointer("/a~1b/c~0d") == ["a/b", "c~d"]
+    assert parse_pointer("") == []
+
+
+@pytest.mark.parametrize(
+    "patch",
+    [
+        {"op": "replace"},
+        [{"op": "frobnicate", "path": "/name"}],
+        [{"op": "add", "path": "/name"}],
+        [{"op": "add", "path": "name", "value": 1}],
+    ],
+)
+def test_malformed_patches(patch):
+    with pytest.raises(InvalidPatch):
+        apply_patch(DOC, patch)
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        {"op": "test", "path": "/name", "value": "B"},
+        {"op": "replace", "path": "/missing", "value": 1},
+        {"op": "remove", "path": "/items/5"},
+        {"op": "add", "path": "/items/01", "value": 1},
+        {"op": "move", "from": "/items", "path": "/items/0"},
+        {"op": "add", "path": "/name/x", "value": 1},
+    ],
+)
+def test_conflicting_operations(op):
+    before = copy.deepcopy(DOC)
+    with pytest.raises(PatchConflict):
+        apply_patch(DOC, [{"op": "replace", "path": "/name", "value": "Z"}, op])
+    assert DOC == before
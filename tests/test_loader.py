@@ -1,5 +1,10 @@
+import os
+from pathlib import Path
+
 from dndcs.core import loader
 from dndcs.core.module_base import ModuleBase
+from dndcs_core.services.loader import _build_module
+from dndcs_core.services.module_objects import MODULE_OBJECTS
 
 
 def test_load_module_by_manifest_id(tmp_path, monkeypatch):
@@ -16,3 +21,80 @@ def test_load_module_by_manifest_id(tmp_path, monkeypatch):
     assert mod is not None
     assert isinstance(mod, ModuleBase)
     assert mod.manifest["id"] == "mymod"
+
+
+def test_load_module_by_manifest_id_is_cached(tmp_path, monkeypatch, write_module):
+    write_module(tmp_path)
+    monkeypatch.setenv("DNDCS_MODULE_PATH", str(tmp_path))
+    first = loader.load_module_by_manifest_id("cachedmod")
+    assert loader.load_module_by_manifest_id("cachedmod") is first
+    assert loader.load_module_by_manifest_id("cachedmod", use_cache=False) is not first
+
+
+def test_module_builds_are_reported_to_listeners(tmp_path, monkeypatch, write_module):
+    write_module(tmp_path)
+    monkeypatch.setenv("DNDCS_MODULE_PATH", str(tmp_path))
+    seen = []
+    listener = lambda module_id, secs, ok: seen.append((module_id, ok))  # noqa: E731
+    loader.MODULE_CACHE.add_build_listener(listener)
+    try:
+        loader.load_module_by_manifest_id("cachedmod")
+        loader.load_module_by_manifest_id("cachedmod")
+        loader.MODULE_CACHE.reload("cachedmod", _build_module)
+    finally:
+        loader.MODULE_CACHE.remove_build_listener(listener)
+    assert seen == [("cachedmod", True), ("cachedmod", True)]
+
+
+def test_module_cache_invalidates_on_source_change(tmp_path, monkeypatch, write_module):
+    mod_dir = write_module(tmp_path)
+    monkeypatch.setenv("DNDCS_MODULE_PATH", str(tmp_path))
+    monkeypatch.setenv("DNDCS_REVALIDATE_INTERVAL", "0")
+    first = loader.load_module_by_manifest_id("cachedmod")
+    src = mod_dir / "module.py"
+    src.write_text(src.read_text() + "    VERSION = 2\n")
+    st = src.stat()
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = loader.load_module_by_manifest_id("cachedmod")
+    assert second is not first
+    assert second.VERSION == 2
+
+
+def test_module_cache_hit_skips_stat_within_interval(tmp_path, monkeypatch, write_module):
+    write_module(tmp_path)
+    monkeypatch.setenv("DNDCS_MODULE_PATH", str(tmp_path))
+    monkeypatch.setenv("DNDCS_REVALIDATE_INTERVAL", "60")
+    first = loader.load_module_by_manifest_id("cachedmod")
+
+    def _no_stat(self, *args, **kwargs):
+        raise AssertionError(f"stat({self}) on a cache hit")
+
+    monkeypatch.setattr(Path, "stat", _no_stat)
+    assert loader.load_module_by_manifest_id("cachedmod") is first
+
+
+def test_module_cache_replace_releases_unused_files(tmp_path, monkeypatch, write_module):
+    mod_dir = write_module(tmp_path)
+    (mod_dir / "helper.py").write_text("X = 1\n")
+    monkeypatch.setenv("DNDCS_MODULE_PATH", str(tmp_path))
+    cache = loader.ModuleCache()
+    cache.get_or_load("cachedmod", _build_module)
+    helper = str((mod_dir / "helper.py").resolve())
+    MODULE_OBJECTS.load(mod_dir / "helper.py", "dndcs_mod_helper", owner="cachedmod")
+    (mod_dir / "helper.py").unlink()
+    cache.reload("cachedmod", _build_module)
+    paths = {r.path for r in MODULE_OBJECTS.records()}
+    assert helper not in paths
+    assert str((mod_dir / "module.py").resolve()) in paths
+
+
+def test_module_cache_lru_eviction(tmp_path, monkeypatch, write_module):
+    write_module(tmp_path, "mod_a")
+    write_module(tmp_path, "mod_b")
+    monkeypatch.setenv("DNDCS_MODULE_PATH", str(tmp_path))
+    cache = loader.ModuleCache(max_size=1)
+    a = cache.get_or_load("mod_a", _build_module)
+    cache.get_or_load("mod_b", _build_module)
+    assert "mod_a" not in cache
+    assert cache.evictions == 1
+    assert cache.get_or_load("mod_a", _build_module) is not a
@@ -0,0 +1,62 @@
+import logging
+import os
+import queue
+import time
+
+from dndcs.logger import DroppingQueueHandler, RotatingLogHandler
+
+
+def _record(level, msg):
+    return logging.LogRecord("dndcs.test", level, __file__, 1, msg, None, None)
+
+
+def test_full_queue_drops_instead_of_blocking():
+    q = queue.Queue(2)
+    handler = DroppingQueueHandler(q)
+    for i in range(3):
+        handler.handle(_record(logging.INFO, f"info {i}"))
+    assert handler.dropped == {"INFO": 1}
+    # An error pushes out the oldest queued record instead of itself.
+    handler.handle(_record(logging.ERROR, "boom"))
+    assert handler.dropped == {"INFO": 2}
+    assert [q.get_nowait().getMessage() for _ in range(2)] == ["info 1", "boom"]
+
+
+def test_full_queue_keeps_the_stop_sentinel():
+    q = queue.Queue(1)
+    q.put_nowait(None)
+    handler = DroppingQueueHandler(q)
+    handler.handle(_record(logging.ERROR, "boom"))
+    assert handler.dropped == {"ERROR": 1}
+    assert q.get_nowait() is None
+
+
+def test_rotates_by_size_and_age(tmp_path):
+    path = tmp_path / "app.log"
+    handler = RotatingLogHandler(path, max_bytes=200, backups=2, interval=0)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    for i in range(10):
+        handler.handle(_record(logging.INFO, "x" * 50))
+    assert (tmp_path / "app.log.1").exists() and (tmp_path / "app.log.2").exists()
+    assert not (tmp_path / "app.log.3").exists()
+    handler.close()
+
+    timed = RotatingLogHandler(tmp_path / "timed.log", max_bytes=0, backups=1, interval=60)
+    timed.handle(_record(logging.INFO, "first"))
+    timed._opened = time.time() - 61
+    timed.handle(_record(logging.INFO, "second"))
+    timed.close()
+    assert (tmp_path / "timed.log.1").read_text() == "first\n"
+    assert (tmp_path / "timed.log").read_text() == "second\n"
+
+
+def test_reopens_a_file_rotated_by_another_process(tmp_path):
+    path = tmp_path / "app.log"
+    handler = RotatingLogHandler(path, max_bytes=10_000, backups=1, interval=0)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler.handle(_record(logging.INFO, "before"))
+    os.rename(path, tmp_path / "app.log.1")
+    handler.handle(_record(logging.INFO, "after"))
+    handler.close()
+    assert path.read_text() == "after\n"
+    assert (tmp_path / "app.log.1").read_text() == "before\n"
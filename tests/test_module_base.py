@@ -0,0 +1,53 @@
+import pytest
+
+from dndcs.core.module_base import ModuleBase
+from dndcs_core.services.module_base import SubsystemImportError
+from dndcs.modules.fivee_stock.module import FiveEStockModule
+
+
+def _module(tmp_path, files):
+    for rel, text in files.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return ModuleBase(
+        {"id": "lazy", "__manifest_dir__": str(tmp_path), "subsystems": ["feats", "spells", "missing"]}
+    )
+
+
+def test_subsystems_import_on_first_access(tmp_path):
+    mod = _module(
+        tmp_path,
+        {"feats/a.py": "FEATS = ['a']\n", "spells/b.py": "raise RuntimeError('boom')\n"},
+    )
+    assert set(mod.subsystems) == {"feats", "spells"}
+    assert "missing" not in mod.subsystems
+    assert not mod.subsystems.is_loaded("feats")
+    assert mod.subsystems["feats"][0].FEATS == ["a"]
+    assert mod.subsystems.is_loaded("feats")
+    assert not mod.subsystems.is_loaded("spells")
+    assert mod.subsystems.get("missing", []) == []
+
+
+def test_subsystem_errors_surface_on_access(tmp_path):
+    mod = _module(tmp_path, {"spells/b.py": "raise RuntimeError('boom')\n"})
+    with pytest.raises(SubsystemImportError, match=r"spells subsystem file .*b\.py.*boom"):
+        mod.subsystems.get("spells", [])
+
+
+def test_fivee_tables_built_lazily():
+    mod = FiveEStockModule({"id": "fivee_stock"})
+    assert not mod.subsystems.is_loaded("feats")
+    assert "actor" in mod.feats
+    assert mod.subsystems.is_loaded("feats")
+    assert not mod.subsystems.is_loaded("companions")
+
+
+def test_parallel_load_is_deterministic(tmp_path):
+    files = {f"spells/s{i:02d}.py": f"ORDER = {i}\n" for i in range(12)}
+    files["feats/f.py"] = "FEATS = []\n"
+    mod = _module(tmp_path, files)
+    timings = mod.load_subsystems(max_workers=4)
+    assert [m.ORDER for m in mod.subsystems["spells"]] == list(range(12))
+    assert len(timings) == 13
+    assert all(t >= 0 for t in timings.values())
@@ -0,0 +1,57 @@
+import logging
+import os
+import sys
+
+from dndcs_core.services.module_objects import ModuleObjectRegistry
+
+
+def _bump(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_registry_deduplicates_by_path_and_mtime(tmp_path):
+    src = tmp_path / "data.py"
+    src.write_text("DATA = [{'name': 'x' * 100} for _ in range(50)]\n")
+    reg = ModuleObjectRegistry()
+    first = reg.load(src, "dndcs_mod_test", owner="a")
+    assert reg.load(src, "dndcs_mod_test", owner="b") is first
+    assert sys.modules[first.__name__] is first
+    assert reg.loads == 1 and reg.reuses == 1
+    _bump(src)
+    second = reg.load(src, "dndcs_mod_test", owner="a")
+    assert second is not first
+    assert sys.modules[second.__name__] is second
+    (rec,) = reg.records()
+    assert rec.owners == {"a", "b"}
+    assert rec.size_bytes > 5000
+
+
+def test_release_apis(tmp_path, caplog):
+    shared, private = tmp_path / "shared.py", tmp_path / "private.py"
+    shared.write_text("X = 1\n")
+    private.write_text("Y = 2\n")
+    reg = ModuleObjectRegistry()
+    mod = reg.load(shared, "dndcs_mod_shared", owner="a")
+    reg.load(shared, "dndcs_mod_shared", owner="b")
+    reg.load(private, "dndcs_mod_private", owner="a")
+    assert set(reg.memory_by_owner()) == {"a", "b"}
+    assert reg.release_owner("a") == [str(private.resolve())]
+    assert [r.path for r in reg.records()] == [str(shared.resolve())]
+    with caplog.at_level(logging.INFO, logger="dndcs.core.module_objects"):
+        assert reg.log_memory() > 0
+    assert "module objects total: 1 file(s)" in caplog.text
+    assert reg.release(shared)
+    assert mod.__name__ not in sys.modules
+    assert not reg.release(shared)
+
+
+def test_release_owner_keeps_listed_files(tmp_path):
+    kept, dropped = tmp_path / "kept.py", tmp_path / "dropped.py"
+    kept.write_text("X = 1\n")
+    dropped.write_text("Y = 2\n")
+    reg = ModuleObjectRegistry()
+    reg.load(kept, "dndcs_mod_kept", owner="a")
+    reg.load(dropped, "dndcs_mod_dropped", owner="a")
+    assert reg.release_owner("a", keep=[kept]) == [str(dropped.resolve())]
+    assert [r.owners for r in reg.records()] == [{"a"}]
@@ -0,0 +1,52 @@
+import json
+
+from click.testing import CliRunner
+
+from dndcs.cli import main
+from dndcs.core import discovery
+
+
+def test_lockfile_round_trip(tmp_path, monkeypatch, write_manifest):
+    root = tmp_path / "mods"
+    root.mkdir()
+    write_manifest(root, "mymod")
+    lock = tmp_path / "modules.lock"
+    data = discovery.write_lockfile(lock, roots=[root])
+    assert [m["manifest"]["id"] for m in data["modules"]] == ["mymod"]
+    assert len(data["modules"][0]["sha256"]) == 64
+
+    def _no_scan(*args, **kwargs):
+        raise AssertionError("lockfile should avoid scanning")
+
+    monkeypatch.setattr(discovery.ModuleIndex, "_scan", _no_scan)
+    index = discovery.ModuleIndex.from_lockfile(lock, roots=[root])
+    assert index is not None
+    assert index.get("mymod")["__manifest_dir__"] == str(root / "mymod")
+
+
+def test_lockfile_stale_after_root_change(tmp_path, write_manifest):
+    root = tmp_path / "mods"
+    root.mkdir()
+    write_manifest(root, "mymod")
+    lock = tmp_path / "modules.lock"
+    discovery.write_lockfile(lock, roots=[root])
+    assert discovery.read_lockfile(lock, roots=[root]) is not None
+    assert discovery.read_lockfile(lock, roots=[tmp_path]) is None
+    write_manifest(root, "late")
+    assert discovery.read_lockfile(lock, roots=[root]) is None
+
+
+def test_modules_lock_command(tmp_path, monkeypatch, write_manifest):
+    root = tmp_path / "mods"
+    root.mkdir()
+    write_manifest(root, "mymod")
+    lock = tmp_path / "modules.lock"
+    monkeypatch.setenv("DNDCS_MODULE_PATH", str(root))
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    result = runner.invoke(main, ["modules", "lock", "-o", str(lock)])
+    assert result.exit_code == 0, result.output
+    ids = [m["manifest"]["id"] for m in json.loads(lock.read_text())["modules"]]
+    assert "mymod" in ids
+    result = runner.invoke(main, ["modules", "lock", "--check", "-o", str(lock)])
+    assert result.exit_code == 0, result.output
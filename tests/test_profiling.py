@@ -0,0 +1,67 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from click.testing import CliRunner
+
+from dndcs.cli import main
+from dndcs_core.services import profiling
+
+
+def test_spans_nest_only_while_active():
+    with profiling.span("ignored") as node:
+        assert node is None
+    prof = profiling.StartupProfiler(trace_alloc=True)
+    prof.start()
+    try:
+        with profiling.span("outer"):
+            with profiling.span("inner"):
+                data = [0] * 10000
+    finally:
+        prof.stop()
+    tree = prof.to_dict()
+    (outer,) = tree["children"]
+    assert outer["name"] == "outer"
+    assert outer["children"][0]["name"] == "inner"
+    assert outer["children"][0]["alloc_kib"] > 50
+    text = profiling.render_text(tree)
+    assert "    inner" in text
+    del data
+
+
+def test_pool_spans_nest_under_the_submitting_span():
+    prof = profiling.StartupProfiler(trace_alloc=False)
+    prof.start()
+
+    def _work(name):
+        with profiling.span(name):
+            with profiling.span(f"{name} inner"):
+                pass
+
+    try:
+        with profiling.span("pool"):
+            run = profiling.bind(_work)
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(run, [f"job{i}" for i in range(8)]))
+        with profiling.span("after"):
+            pass
+    finally:
+        prof.stop()
+    pool_node, after = prof.to_dict()["children"]
+    assert after["name"] == "after" and "children" not in after
+    assert sorted(c["name"] for c in pool_node["children"]) == [f"job{i}" for i in range(8)]
+    for job in pool_node["children"]:
+        assert [c["name"] for c in job["children"]] == [job["name"] + " inner"]
+
+
+def test_profile_startup_command_json(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(
+        main, ["profile-startup", "--target", "module", "--format", "json", "--no-alloc"]
+    )
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    names = [c["name"] for c in data["profile"]["children"]]
+    assert "discovery" in names
+    assert "load module fivee_stock" in names
+    load = next(c for c in data["profile"]["children"] if c["name"] == "load subsystems fivee_stock")
+    assert any("spells" in c["name"] for c in load["children"])
@@ -0,0 +1,89 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dndcs.core import models  # noqa: E402
+from dndcs.modules.fivee_stock.module import FiveEStockModule  # noqa: E402
+from dndcs.modules.fivee_stock.roster import Roster  # noqa: E402
+
+
+def _scalar(out):
+    blocks = (out.get("spellcasting") or {}).get("classes", [])
+    return {
+        "proficiency_bonus": out["proficiency_bonus"],
+        "ability_mods": out["ability_mods"],
+        "saving_throws": out["saving_throws"],
+        "skills": out["skills"],
+        "ac": out["ac"]["value"],
+        "spell_save_dc": {b["class"]: b["spell_save_dc"] for b in blocks},
+    }
+
+
+def _assert_matches_derive(mod, chars):
+    result = Roster.pack(mod, chars).derive()
+    assert len(result) == len(chars)
+    for i, char in enumerate(chars):
+        assert result.row(i) == _scalar(mod.derive(char)), char.name
+
+
+def test_roster_matches_derive_for_class_matrix(character):
+    _assert_matches_derive(FiveEStockModule({"id": "fivee_stock"}), [character])
+
+
+def test_roster_matches_derive_with_items_feats_and_multiclass(ability_scores):
+    mod = FiveEStockModule({"id": "fivee_stock"})
+    leather = models.Item(name="Leather", props={"armor": {"base": 11, "category": "light"}})
+    half_plate = models.Item(name="Half Plate", props={"armor": {"base": 15, "category": "medium", "dex_cap": 2}})
+    mage_armor = models.Item(name="Mage Armor", props={"ac_base": 13})
+    chars = [
+        models.Character(
+            name="Armored",
+            level=7,
+            module="fivee_stock",
+            class_="fighter",
+            abilities=ability_scores(DEX=18),
+            items=[half_plate, models.Item(name="Shield", props={"shield_bonus": 2}), mage_armor],
+            feats=[models.Feat(name="Resilient", props={"saving_throw_proficiencies": ["WIS"]})],
+        ),
+        models.Character(
+            name="Mage Armor First",
+            level=3,
+            module="fivee_stock",
+            class_="sorcerer",
+            abilities=ability_scores(DEX=16, CHA=17),
+            items=[mage_armor, leather],
+            skills=[models.Skill(name="Stealth", ability="DEX")],
+        ),
+        models.Character(
+            name="Multiclass",
+            level=12,
+            module="fivee_stock",
+            class_="paladin",
+            abilities={"STR": models.AbilityScore(name="STR", score=14)},
+            items=[
+                models.Item(name="Belt", props={"ability_bonuses": {"CON": 2}}),
+                models.Item(name="Cloak", props={"saving_throw_bonuses": {"all": 1, "dex": 2}}),
+            ],
+            feats=[models.Feat(name="Skilled", props={"skill_proficiencies": ["Arcana"]})],
+            spellcasting={"classes": {"paladin": 6, "Warlock": 4, "wizard": 2}},
+        ),
+    ]
+    _assert_matches_derive(mod, chars)
+
+
+def test_roster_columns(ability_scores):
+    mod = FiveEStockModule({"id": "fivee_stock"})
+    chars = [
+        models.Character(
+            name="Cleric", level=9, module="fivee_stock", class_="cleric", abilities=ability_scores(WIS=18)
+        ),
+        models.Character(
+            name="Bookless", level=5, module="fivee_stock", class_="wizard", abilities=ability_scores(INT=16)
+        ),
+    ]
+    result = Roster.pack(mod, chars).derive()
+    assert result.proficiency_bonus.tolist() == [4, 3]
+    cleric, wizard = result.casters.index("cleric"), result.casters.index("wizard")
+    assert result.spell_save_dc[0, cleric] == 16
+    # a wizard without a spellbook gets no spellcasting block, so no DC
+    assert result.casts[:, wizard].tolist() == [False, False]
@@ -55,3 +55,36 @@ def test_warlock_pact_slots():
     assert sc["pact_slots"]["3"] == 2
     war = sc["classes"][0]
     assert war["known_max"] == 6  # from WARLOCK_SPELLS_KNOWN
+
+
+def test_homebrew_casters_register_as_data(tmp_path):
+    (tmp_path / "classes").mkdir()
+    (tmp_path / "classes" / "homebrew.py").write_text(
+        'CASTERS = {"Artificer": {"ability": "int", "slots": "half", "prepared_divisor": 2}}\n'
+    )
+    mod = FiveEStockModule({"id": "fivee_stock", "__manifest_dir__": tmp_path, "subsystems": ["classes"]})
+    char = models.Character(
+        name="Tinker", level=5, module="fivee_stock", class_="fighter",
+        abilities=_abilities(INT=16),
+        spellcasting={"classes": {"artificer": 5}, "artificer": {"prepared": ["cure wounds", "grease"]}},
+    )
+    art = mod.derive(char)["spellcasting"]["classes"][0]
+    assert art["class"] == "artificer" and art["spellcasting_ability"] == "INT"
+    assert art["prepared_max"] == 5 // 2 + 3
+    assert art["prepared_spells"] == ["cure wounds", "grease"]
+    assert "wizard" in mod.casters
+
+
+def test_caster_static_parts_are_memoized():
+    from dndcs.modules.fivee_stock.module import CASTERS
+
+    cleric = CASTERS["cleric"]
+    first, slots = cleric.static(5, 3, 3)
+    assert cleric.static(5, 3, 3)[0] is first
+    assert first["prepared_max"] == 8 and first["spell_save_dc"] == 14 and slots[2] == 2
+
+
+def test_wizard_without_a_spellbook_has_no_spellcasting():
+    mod = FiveEStockModule({"id": "fivee_stock"})
+    char = models.Character(name="Lost", level=3, module="fivee_stock", class_="wizard", abilities=_abilities(INT=16))
+    assert "spellcasting" not in mod.derive(char)
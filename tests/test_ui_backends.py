@@ -0,0 +1,61 @@
+import asyncio
+import json
+import os
+import signal
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from dndcs.ui.server import create_app
+from webui.backends import ProcessBackend, execute
+
+
+@pytest.fixture(scope="module")
+def backend():
+    be = ProcessBackend(processes=2, batch_size=4)
+    be.start()
+    yield be
+    be.shutdown()
+
+
+def test_process_backend_matches_in_process_results(backend, wizard_payload):
+    payload = wizard_payload
+
+    async def _main():
+        return await backend.execute_many("derive", [payload] * 6 + [{"bad": 1}])
+
+    results = asyncio.run(_main())
+    expected = execute("derive", payload)
+    assert results[:6] == [expected] * 6
+    assert isinstance(results[6], HTTPException) and results[6].status_code == 400
+    stats = backend.stats()
+    assert stats["items"] >= 7
+    # Seven requests from one tick over two workers go out as two batches.
+    assert stats["batches"] <= 3
+    assert stats["execution"]["derive"]["count"] >= 7
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGKILL"), reason="needs POSIX signals")
+def test_process_backend_restarts_crashed_workers(backend, wizard_payload):
+    payload = wizard_payload
+    for pid in list(backend.executor._processes):
+        os.kill(pid, signal.SIGKILL)
+
+    async def _main():
+        return await backend.execute("validate", payload)
+
+    assert json.loads(asyncio.run(_main())) == json.loads(execute("validate", payload))
+    assert backend.restarts == 1
+
+
+def test_app_with_process_backend(wizard_payload):
+    app = create_app(derive_backend="process", derive_processes=1)
+    with TestClient(app) as client:
+        payload = wizard_payload
+        resp = client.post("/api/derive", json=payload)
+        assert resp.status_code == 200
+        assert resp.json()["spellcasting"]["slots"]["9"] == 1
+        missing = dict(payload, module="no_such_module")
+        assert client.post("/api/derive", json=missing).status_code == 404
+        assert client.get("/api/stats").json()["backend"]["name"] == "process"
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import time
+
+from fastapi.testclient import TestClient
+
+from dndcs.ui.server import create_app
+from webui.batch import BatchItemError, iter_items, stream_results
+
+
+def _parse(body: bytes, chunk: int, content_type: str = "", max_item_bytes: int = 1 << 20):
+    async def _chunks():
+        for i in range(0, len(body), chunk):
+            yield body[i : i + chunk]
+
+    async def _collect():
+        return [item async for item in iter_items(_chunks(), content_type, max_item_bytes)]
+
+    return asyncio.run(_collect())
+
+
+def test_json_array_parses_across_chunk_boundaries():
+    values = [{"a": 1, "s": "café ]"}, 123, [1, 2], "x"]
+    body = json.dumps(values).encode("utf-8")
+    for chunk in (1, 2, 7, len(body)):
+        assert _parse(body, chunk) == values
+
+
+def test_ndjson_reports_bad_lines_and_oversized_items():
+    body = b'{"a": 1}\nnot json\n\n{"b": ' + b" " * 100 + b"2}\n[3]"
+    items = _parse(body, 5, "application/x-ndjson", max_item_bytes=64)
+    assert items[0] == {"a": 1}
+    assert isinstance(items[1], BatchItemError)
+    assert isinstance(items[2], BatchItemError) and "exceeds" in str(items[2])
+    assert items[3:] == [[3]]
+
+
+def test_json_array_handles_escapes_split_across_chunks():
+    values = [{"q": 'say "]" \\ and }'}, "\\", {"n": [1, {"m": "{"}]}, -1.5e3, True, None]
+    body = json.dumps(values).encode("utf-8")
+    for chunk in (1, 3, len(body)):
+        assert _parse(body, chunk) == values
+
+
+def test_ndjson_limits_lines_that_arrive_in_one_chunk():
+    body = b'{"a": "' + b"x" * 100 + b'"}\n{"b": 2}\n'
+    items = _parse(body, len(body), "application/x-ndjson", max_item_bytes=64)
+    assert isinstance(items[0], BatchItemError) and "exceeds" in str(items[0])
+    assert items[1:] == [{"b": 2}]
+
+
+def test_truncated_array_ends_with_error():
+    items = _parse(b'[{"a": 1}, {"b"', 4)
+    assert items[0] == {"a": 1}
+    assert isinstance(items[-1], BatchItemError)
+
+
+def test_stream_results_bounds_in_flight_items():
+    in_flight = []
+    peak = []
+
+    async def _items():
+        for i in range(20):
+            yield i
+
+    async def _run(index, item):
+        in_flight.append(index)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.001 * (item % 3))
+        in_flight.remove(index)
+        return b"%d\n" % index
+
+    async def _collect(order):
+        return [line async for line in stream_results(_items(), _run, order=order, window=4)]
+
+    assert asyncio.run(_collect("input")) == [b"%d\n" % i for i in range(20)]
+    assert max(peak) <= 4
+    assert sorted(asyncio.run(_collect("completion"))) == sorted(b"%d\n" % i for i in range(20))
+
+
+def test_batch_endpoint_streams_ndjson_with_per_item_errors(wizard_payload):
+    char = wizard_payload
+    app = create_app()
+    with TestClient(app) as client:
+        single = client.post("/api/derive", json=char).json()
+        resp = client.post("/api/derive/batch", json=[char, {"bad": 1}, dict(char, module="nope"), char])
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(l) for l in resp.text.splitlines()]
+        assert [l["index"] for l in lines] == [0, 1, 2, 3]
+        assert lines[0] == {"index": 0, "ok": True, "result": single}
+        assert (lines[1]["ok"], lines[1]["status"]) == (False, 400)
+        assert (lines[2]["ok"], lines[2]["status"]) == (False, 404)
+        assert lines[3]["result"] == single
+
+        body = "\n".join(json.dumps(c) for c in [char, char]) + "\n"
+        resp = client.post(
+            "/api/derive/batch?order=completion",
+            content=body,
+            headers={"content-type": "application/x-ndjson"},
+        )
+        assert sorted(json.loads(l)["index"] for l in resp.text.splitlines()) == [0, 1]
+        assert client.post("/api/derive/batch?order=random", json=[]).status_code == 400
+
+
+def test_batch_endpoint_reads_chunked_body_through_real_server(wizard_payload):
+    import http.client
+    import threading
+
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(create_app(), host="127.0.0.1", port=0, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    try:
+        deadline = time.monotonic() + 10
+        while not server.started and time.monotonic() < deadline:
+            time.sleep(0.02)
+        port = server.servers[0].sockets[0].getsockname()[1]
+
+        char = wizard_payload
+
+        def _chunks():
+            for _ in range(40):
+                yield (json.dumps(char) + "\n").encode("utf-8")
+
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        conn.request(
+            "POST",
+            "/api/derive/batch",
+            body=_chunks(),
+            headers={"content-type": "application/x-ndjson"},
+            encode_chunked=True,
+        )
+        resp = conn.getresponse()
+        lines = [json.loads(l) for l in resp.read().splitlines()]
+        conn.close()
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+    assert resp.status == 200
+    assert [l["index"] for l in lines] == list(range(40))
+    assert all(l["ok"] for l in lines)
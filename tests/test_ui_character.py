@@ -1,18 +1,11 @@
-import json
-from pathlib import Path
 from fastapi.testclient import TestClient
 from dndcs.ui.server import create_app
 
 
-def _load_test_character() -> dict:
-    path = Path(__file__).parent / "data" / "wizard_l17.json"
-    return json.loads(path.read_text())
-
-
-def test_ui_can_derive_level17_wizard():
+def test_ui_can_derive_level17_wizard(wizard_payload):
     app = create_app()
     client = TestClient(app)
-    payload = _load_test_character()
+    payload = wizard_payload
     resp = client.post("/api/derive", json=payload)
     assert resp.status_code == 200
     data = resp.json()
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from dndcs.ui.server import create_app
+from webui.coalesce import SingleFlight
+
+
+def test_concurrent_coroutines_share_one_call():
+    flights = SingleFlight()
+    calls = []
+
+    async def _work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return b"result"
+
+    async def _main():
+        return await asyncio.gather(*(flights.run("derive", "k", _work) for _ in range(10)))
+
+    assert asyncio.run(_main()) == [b"result"] * 10
+    assert calls == [1]
+    assert flights.stats()["derive"] == {"executed": 1, "coalesced": 9}
+    assert flights.in_flight() == 0
+
+
+def test_threads_share_one_call_and_its_exception():
+    flights = SingleFlight()
+    barrier = threading.Barrier(6)
+    calls = []
+    errors = []
+
+    def _work():
+        calls.append(1)
+        time.sleep(0.2)
+        raise LookupError("missing")
+
+    def _worker():
+        barrier.wait()
+        try:
+            flights.do("spells", ("m", "fire"), _work)
+        except LookupError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_worker) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert calls == [1] and len(errors) == 6
+    assert flights.stats()["spells"]["coalesced"] == 5
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_call():
+    flights = SingleFlight()
+
+    async def _work():
+        await asyncio.sleep(0.05)
+        return 42
+
+    async def _main():
+        first = asyncio.ensure_future(flights.run("derive", "k", _work))
+        second = asyncio.ensure_future(flights.run("derive", "k", _work))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(_main()) == 42
+
+
+def test_derive_burst_is_coalesced(monkeypatch, wizard_payload):
+    monkeypatch.setenv("DNDCS_DERIVE_CACHE_SIZE", "0")
+    app = create_app()
+    backend = app.state.derive_backend
+    real_execute = backend.execute
+
+    async def _slow_execute(op, payload, modules=None):
+        await asyncio.sleep(0.1)
+        return await real_execute(op, payload, modules)
+
+    monkeypatch.setattr(backend, "execute", _slow_execute)
+
+    async def _main():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(
+                *(client.post("/api/derive", json=wizard_payload) for _ in range(8))
+            )
+            stats = (await client.get("/api/stats")).json()
+        return responses, stats
+
+    responses, stats = asyncio.run(_main())
+    assert {r.status_code for r in responses} == {200}
+    assert len({r.content for r in responses}) == 1
+    assert stats["coalescing"]["derive"] == {"executed": 1, "coalesced": 7}
+    assert stats["derive_cache"]["entries"] == 0
@@ -0,0 +1,62 @@
+import gzip
+import json
+
+from fastapi.testclient import TestClient
+
+from dndcs.ui.server import create_app
+from webui.compression import negotiate
+
+
+def test_negotiate_honours_quality_and_availability():
+    assert negotiate("gzip, deflate", ["gzip"]) == "gzip"
+    assert negotiate("br;q=1.0, gzip;q=0.5", ["br", "gzip"]) == "br"
+    assert negotiate("br;q=0.2, gzip", ["br", "gzip"]) == "gzip"
+    assert negotiate("br", ["gzip"]) is None
+    assert negotiate("gzip;q=0", ["gzip"]) is None
+    assert negotiate("*", ["zstd", "gzip"]) == "zstd"
+    assert negotiate("", ["gzip"]) is None
+
+
+def test_spell_catalog_is_compressed_once_per_encoding():
+    client = TestClient(create_app())
+    gz = {"Accept-Encoding": "gzip"}
+    first = client.get("/api/spells", headers=gz)
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["etag"].endswith('-gzip"')
+    assert "accept-encoding" in first.headers["vary"].lower()
+    assert len(first.json()["spells"]) > 300
+    second = client.get("/api/spells", headers=gz)
+    assert second.content == first.content
+    plain = client.get("/api/spells", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert json.loads(plain.content) == first.json()
+
+    not_modified = client.get("/api/spells", headers=dict(gz, **{"If-None-Match": first.headers["etag"]}))
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == first.headers["etag"]
+
+    stats = client.get("/api/stats", headers={"Accept-Encoding": "identity"}).json()["compression"]["gzip"]
+    assert stats["responses"] >= 2 and stats["cache_hits"] >= 1
+    assert stats["bytes_out"] * 2 < stats["bytes_in"]
+    assert stats["cpu_ms"] > 0
+
+
+def test_small_and_streamed_responses_pass_through(wizard_payload):
+    client = TestClient(create_app())
+    ping = client.get("/api/ping", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in ping.headers
+    body = "\n".join(json.dumps(wizard_payload) for _ in range(3)) + "\n"
+    resp = client.post(
+        "/api/derive/batch",
+        content=body,
+        headers={"Accept-Encoding": "gzip", "content-type": "application/x-ndjson"},
+    )
+    assert "content-encoding" not in resp.headers
+    assert [json.loads(line)["ok"] for line in resp.text.splitlines()] == [True] * 3
+
+
+def test_compressed_body_is_valid_gzip():
+    client = TestClient(create_app())
+    with client.stream("GET", "/api/spells", headers={"Accept-Encoding": "gzip"}) as resp:
+        raw = b"".join(resp.iter_raw())
+    assert json.loads(gzip.decompress(raw))["spells"]
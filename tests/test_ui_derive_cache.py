@@ -0,0 +1,86 @@
+from fastapi.testclient import TestClient
+
+from dndcs.core import loader
+from dndcs.ui.server import create_app
+from webui.derive_cache import DeriveCache, canonical_hash
+
+
+def test_canonical_hash_ignores_key_order():
+    assert canonical_hash({"a": 1, "b": [1, 2]}) == canonical_hash({"b": [1, 2], "a": 1})
+    assert canonical_hash({"a": 1}) != canonical_hash({"a": 2})
+
+
+def test_lru_is_bounded_by_entries_and_bytes():
+    cache = DeriveCache(max_entries=2, max_bytes=10)
+    cache.put("a", "m", b"1234")
+    cache.put("b", "m", b"1234")
+    assert cache.get("a") == b"1234"
+    cache.put("c", "m", b"1234")
+    assert cache.get("b") is None and len(cache) == 2
+    cache.put("d", "other", b"12345678")
+    assert len(cache) == 1 and cache.bytes == 8
+    cache.put("huge", "m", b"x" * 11)
+    assert cache.get("huge") is None
+    assert cache.invalidate("other") == 1 and cache.bytes == 0
+    stats = cache.stats()
+    assert stats["evictions"] == 3 and stats["hits"] == 1 and stats["invalidations"] == 1
+
+
+def test_derive_endpoint_serves_repeats_from_cache(wizard_payload):
+    app = create_app()
+    with TestClient(app) as client:
+        first = client.post("/api/derive", json=wizard_payload)
+        reordered = dict(reversed(list(wizard_payload.items())))
+        second = client.post("/api/derive", json=reordered)
+        assert first.status_code == second.status_code == 200
+        assert first.content == second.content
+        stats = client.get("/api/stats").json()
+    assert stats["derive_cache"]["hits"] == 1
+    assert stats["derive_cache"]["misses"] == 1
+    assert stats["backend"]["name"] == "thread"
+    assert stats["dispatcher"]["execution"]["derive"]["count"] == 1
+
+
+def test_module_reload_invalidates_cached_results(wizard_payload):
+    app = create_app()
+    with TestClient(app) as client:
+        assert client.post("/api/derive", json=wizard_payload).status_code == 200
+        token = loader.MODULE_CACHE.token("fivee_stock")
+        assert token is not None and len(app.state.derive_cache) == 1
+        resp = client.post("/api/modules/reload", params={"module": "fivee_stock"})
+        assert resp.json()["reloaded"] == ["fivee_stock"]
+        assert len(app.state.derive_cache) == 0
+        assert client.post("/api/derive", json=wizard_payload).status_code == 200
+        assert app.state.derive_cache.stats()["misses"] == 2
+
+
+def test_derive_patch_revalidates_against_a_previous_result(wizard_payload):
+    app = create_app()
+    with TestClient(app) as client:
+        base = client.post("/api/derive", json=wizard_payload)
+        patch = [{"op": "replace", "path": "/abilities/INT/score", "value": 18}]
+        headers = {"If-Match": base.headers["etag"], "Content-Type": "application/json-patch+json"}
+        resp = client.post("/api/derive/patch", json=patch, headers=headers)
+        assert resp.status_code == 200
+        edited = dict(wizard_payload, abilities=dict(wizard_payload["abilities"], INT={"name": "INT", "score": 18}))
+        full = client.post("/api/derive", json=edited)
+        assert resp.json() == full.json() and resp.headers["etag"] == full.headers["etag"]
+        # The result is itself a base for the next patch.
+        chained = client.post(
+            "/api/derive/patch",
+            json=[{"op": "replace", "path": "/level", "value": 5}],
+            headers={"If-Match": resp.headers["etag"]},
+        )
+        assert chained.json()["proficiency_bonus"] == 3
+
+        conflict = client.post("/api/derive/patch", json=[{"op": "remove", "path": "/nope"}], headers=headers)
+        assert conflict.status_code == 409
+        bad = client.post("/api/derive/patch", json={"op": "remove"}, headers=headers)
+        assert bad.status_code == 400
+        invalid = client.post(
+            "/api/derive/patch", json=[{"op": "replace", "path": "/level", "value": "high"}], headers=headers
+        )
+        assert invalid.status_code == 400
+        assert client.post("/api/derive/patch", json=patch).status_code == 412
+        assert client.post("/api/derive/patch", json=patch, headers={"If-Match": '"unknown"'}).status_code == 412
+        assert client.get("/api/stats").json()["derive_states"]["hits"] >= 1
@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+from fastapi.testclient import TestClient
+
+from dndcs.ui.server import create_app
+from webui.dispatch import Dispatcher
+
+
+def test_dispatcher_separates_queue_wait_from_execution():
+    dispatcher = Dispatcher(max_workers=1)
+
+    async def _main():
+        return await asyncio.gather(
+            dispatcher.run(time.sleep, 0.1, label="slow"),
+            dispatcher.run(time.sleep, 0.1, label="slow"),
+        )
+
+    try:
+        asyncio.run(_main())
+    finally:
+        dispatcher.shutdown()
+    stats = dispatcher.stats()
+    assert stats["execution"]["slow"]["count"] == 2
+    assert stats["execution"]["slow"]["mean_ms"] >= 90
+    # With one worker the second call queued behind the first.
+    assert stats["queue_wait"]["slow"]["max_ms"] >= 90
+    assert stats["queued"] == 0 and stats["in_flight"] == 0
+
+
+def test_event_loop_stays_responsive_during_blocking_work():
+    dispatcher = Dispatcher(max_workers=2)
+
+    async def _main():
+        task = asyncio.ensure_future(dispatcher.run(time.sleep, 0.2))
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        ticked = time.perf_counter() - start
+        await task
+        return ticked
+
+    try:
+        assert asyncio.run(_main()) < 0.1
+    finally:
+        dispatcher.shutdown()
+
+
+def test_derive_and_validate_are_dispatched(wizard_payload):
+    app = create_app(dispatch_threads=2)
+    with TestClient(app) as client:
+        payload = wizard_payload
+        assert client.post("/api/derive", json=payload).status_code == 200
+        assert client.post("/api/validate", json=payload).status_code == 200
+        assert client.post("/api/derive", json={"bad": 1}).status_code == 400
+        missing = dict(payload, module="no_such_module")
+        assert client.post("/api/derive", json=missing).status_code == 404
+        body = client.get("/api/stats").json()
+    stats = body["dispatcher"]
+    assert body["module_objects"]["bytes_by_owner"]["fivee_stock"] > 0
+    assert stats["max_workers"] == 2
+    assert stats["execution"]["derive"]["count"] == 3
+    assert stats["execution"]["validate"]["count"] == 1
+    assert "derive" in stats["queue_wait"]
@@ -0,0 +1,41 @@
+from fastapi.testclient import TestClient
+
+from dndcs.ui.server import create_app
+from webui.etag import make_etag, matches
+
+
+def test_if_none_match_parsing():
+    tag = make_etag("x")
+    assert matches(tag, tag)
+    assert matches(f'"other", W/{tag}', tag)
+    assert matches("*", tag)
+    assert not matches(None, tag) and not matches('"other"', tag)
+
+
+def test_spells_and_modules_revalidate_with_304():
+    client = TestClient(create_app())
+    for url, params in (("/api/spells", {"cls": "wizard"}), ("/api/modules", None)):
+        first = client.get(url, params=params)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        again = client.get(url, params=params, headers={"If-None-Match": etag})
+        assert again.status_code == 304 and again.content == b""
+        assert again.headers["etag"] == etag
+    other = client.get("/api/spells", params={"cls": "cleric"})
+    assert other.headers["etag"] != client.get("/api/spells", params={"cls": "wizard"}).headers["etag"]
+
+
+def test_derive_etag_follows_the_character(wizard_payload):
+    app = create_app()
+    with TestClient(app) as client:
+        first = client.post("/api/derive", json=wizard_payload)
+        etag = first.headers["etag"]
+        again = client.post("/api/derive", json=wizard_payload, headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        changed = dict(wizard_payload, level=wizard_payload["level"] - 1)
+        resp = client.post("/api/derive", json=changed, headers={"If-None-Match": etag})
+        assert resp.status_code == 200 and resp.headers["etag"] != etag
+        stats = client.get("/api/stats").json()
+    # The 304 was answered without deriving or even consulting the cache.
+    assert stats["dispatcher"]["execution"]["derive"]["count"] == 2
+    assert stats["derive_cache"]["hits"] == 0
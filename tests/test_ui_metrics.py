@@ -0,0 +1,64 @@
+import threading
+
+from fastapi.testclient import TestClient
+
+from dndcs.core import loader
+from dndcs.ui.server import create_app
+from webui.metrics import Registry
+
+
+def _samples(text):
+    out = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, _, value = line.rpartition(" ")
+            out[name] = float(value)
+    return out
+
+
+def test_counters_sum_per_thread_shards():
+    reg = Registry(prefix="t_")
+    hits = reg.counter("hits_total", "Hits", ("kind",))
+    latency = reg.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+
+    def _work():
+        for _ in range(1000):
+            hits.inc("a")
+        latency.observe(0.5)
+
+    threads = [threading.Thread(target=_work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    samples = _samples(reg.render())
+    assert samples['t_hits_total{kind="a"}'] == 4000
+    assert samples['t_latency_seconds_bucket{le="0.1"}'] == 0
+    assert samples['t_latency_seconds_bucket{le="1"}'] == 4
+    assert samples['t_latency_seconds_bucket{le="+Inf"}'] == 4
+    assert samples["t_latency_seconds_sum"] == 2.0
+    assert "# TYPE t_latency_seconds histogram" in reg.render()
+
+
+def test_metrics_endpoint_reports_routes_modules_and_derives(wizard_payload):
+    loader.clear_module_cache()
+    with TestClient(create_app()) as client:
+        client.post("/api/derive", json=wizard_payload)
+        client.post("/api/derive", json=wizard_payload)
+        client.get("/api/spells", params={"cls": "wizard"})
+        client.get("/api/nope")
+        resp = client.get("/metrics")
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = _samples(resp.text)
+    route = 'route="/api/derive",method="POST",status="200"'
+    assert samples[f"dndcs_http_request_duration_seconds_count{{{route}}}"] == 2
+    assert samples['dndcs_http_request_size_bytes_sum{route="/api/derive"}'] > 0
+    assert samples['dndcs_http_response_size_bytes_count{route="/api/spells"}'] == 1
+    assert 'dndcs_http_request_duration_seconds_count{route="unmatched",method="GET",status="404"}' in samples
+    assert samples["dndcs_http_requests_in_flight"] == 1  # the scrape itself
+    # The second derive was a cache hit: one derive, one module build.
+    assert samples['dndcs_derive_seconds_count{module="fivee_stock"}'] == 1
+    assert samples['dndcs_module_loads_total{module="fivee_stock",result="ok"}'] == 1
+    assert samples['dndcs_module_load_seconds_count{module="fivee_stock"}'] == 1
+    assert samples["dndcs_derive_cache_hits_total"] == 1
+    assert samples['dndcs_dispatch_exec_total{label="derive"}'] == 1
@@ -0,0 +1,79 @@
+import gc
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import pytest
+
+from webui import prefork
+from webui.prefork import preload, process_memory
+
+_SERVE = "from webui.server import serve; serve(port={port}, open_browser=False, workers=2)"
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_preload_reports_steps():
+    timings = preload(["fivee_stock"])
+    assert set(timings) == {"discovery", "module fivee_stock"}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_process_memory_reads_proc():
+    mem = process_memory(os.getpid())
+    assert mem["rss"] > 0 and "pss" in mem
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_prefork_workers_share_one_socket(tmp_path):
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", _SERVE.format(port=port)],
+        cwd=tmp_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    try:
+        pids = []
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline and len(pids) < 10:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/stats", timeout=2) as resp:
+                    pids.append(json.load(resp)["process"]["pid"])
+            except OSError:
+                time.sleep(0.1)
+        assert pids and proc.pid not in pids
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        out, _ = proc.communicate(timeout=30)
+    assert proc.returncode == 0, out
+    (log_file,) = (tmp_path / "logs").glob("*.log")
+    text = log_file.read_text()
+    assert "prefork: 2 worker(s) started" in text
+    assert "prefork: gc.freeze" in text
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_prefork_gives_up_when_workers_keep_failing(monkeypatch):
+    monkeypatch.setattr(prefork, "RESPAWN_DELAY", 0.01)
+    monkeypatch.setattr(prefork, "MAX_STARTUP_FAILURES", 3)
+
+    def _crash(sock):
+        raise RuntimeError("boom")
+
+    start = time.monotonic()
+    try:
+        assert prefork.serve_prefork(_crash, "127.0.0.1", 0, 2, []) == 1
+    finally:
+        gc.unfreeze()
+    assert time.monotonic() - start < 10
@@ -0,0 +1,57 @@
+from fastapi.testclient import TestClient
+
+from dndcs.core import loader
+from dndcs.ui.server import create_app
+from dndcs_core.services.watcher import ModuleReloader, PollingWatcher
+
+
+def test_reloader_swaps_changed_module(tmp_path, monkeypatch, write_module):
+    monkeypatch.setenv("DNDCS_MODULE_PATH", str(tmp_path))
+    write_module(tmp_path, "hotmod", "    VERSION = 1\n", bump=1)
+    old = loader.load_module_by_manifest_id("hotmod")
+    reloader = ModuleReloader(PollingWatcher(lambda: [tmp_path]))
+    assert reloader.check() == []
+    before = reloader.reload_count
+    write_module(tmp_path, "hotmod", "    VERSION = 2\n", bump=2)
+    assert reloader.check() == ["hotmod"]
+    assert reloader.reload_count == before + 1
+    new = loader.load_module_by_manifest_id("hotmod")
+    assert new is not old
+    assert (old.VERSION, new.VERSION) == (1, 2)
+
+
+def test_reload_endpoint(tmp_path, monkeypatch, write_module):
+    monkeypatch.setenv("DNDCS_MODULE_PATH", str(tmp_path))
+    write_module(tmp_path, "hotmod", "    VERSION = 1\n", bump=1)
+    client = TestClient(create_app())
+    first = loader.load_module_by_manifest_id("hotmod")
+    resp = client.post("/api/modules/reload", params={"module": "hotmod"})
+    assert resp.status_code == 200
+    assert resp.json()["reloaded"] == ["hotmod"]
+    assert loader.load_module_by_manifest_id("hotmod") is not first
+    assert client.post("/api/modules/reload", params={"module": "nope"}).status_code == 404
+
+
+def test_forced_reload_reexecutes_unchanged_files(tmp_path, monkeypatch, write_module):
+    monkeypatch.setenv("DNDCS_MODULE_PATH", str(tmp_path))
+    write_module(tmp_path, "hotmod", "    VERSION = 1\n", bump=1)
+    first = loader.load_module_by_manifest_id("hotmod")
+    reloader = ModuleReloader(PollingWatcher(lambda: [tmp_path]))
+    assert reloader.reload("hotmod") == ["hotmod"]
+    reused = loader.load_module_by_manifest_id("hotmod")
+    assert type(reused) is type(first)
+    assert reloader.reload("hotmod", force=True) == ["hotmod"]
+    assert type(loader.load_module_by_manifest_id("hotmod")) is not type(first)
+
+
+def test_source_paths_skip_assets(tmp_path, write_module):
+    write_module(tmp_path, "hotmod", "    VERSION = 1\n", bump=1)
+    mod_dir = tmp_path / "hotmod"
+    (mod_dir / "spells").mkdir()
+    (mod_dir / "spells" / "core.py").write_text("")
+    (mod_dir / "spells" / "spells.jsonl").write_text("")
+    (mod_dir / "spells" / "icon.png").write_bytes(b"")
+    (mod_dir / "assets").mkdir()
+    (mod_dir / "assets" / "portrait.png").write_bytes(b"")
+    files = {p.relative_to(mod_dir).as_posix() for p in loader.iter_module_files(mod_dir, ["spells"])}
+    assert files == {"manifest.yaml", "module.py", "spells/core.py", "spells/spells.jsonl"}
@@ -0,0 +1,364 @@
+"""Pluggable backends that execute character operations for the web UI.
+
+``thread`` runs operations in-process on the dispatcher's thread pool.
+``process`` runs them in a pool of worker processes that preload the rules
+modules, so derivation scales across cores instead of sharing one GIL.
+Both return the JSON response body as bytes; failures surface as
+:class:`~fastapi.HTTPException` in the caller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from fastapi import HTTPException
+
+from dndcs.core import discovery, loader, models, registry
+from dndcs.logger import get_logger
+from webui.dispatch import Dispatcher, DispatchStats
+
+log = get_logger("ui.backends")
+
+BACKENDS = ("thread", "process")
+
+# (status, body or error detail, execution seconds)
+Outcome = Tuple[int, Union[bytes, str], float]
+
+
+def encode(data: Any) -> bytes:
+    """Serialise ``data`` exactly like :class:`fastapi.responses.JSONResponse`."""
+    return json.dumps(
+        data, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def load_module(module_id: str, modules: Optional[Dict[str, Any]] = None):
+    """Resolve ``module_id``; ``modules`` memoizes lookups within one batch."""
+    mod = modules.get(module_id) if modules is not None else None
+    if mod is None:
+        mod = loader.load_module_by_manifest_id(module_id)
+        if mod is None:
+            raise HTTPException(status_code=404, detail=f"Module '{module_id}' not found")
+        if modules is not None:
+            modules[module_id] = mod
+    return mod
+
+
+def parse_character(payload: Any) -> models.Character:
+    try:
+        return models.Character.model_validate(payload)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid character: {e}")
+
+
+def _log_discovered() -> None:
+    # Listing the index is only worth doing when someone reads it.
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("discovered modules: %s", discovery.get_module_index().ids())
+
+
+def new_character(data: Dict[str, Any], modules: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    module_id = data.get("module_id") or registry.default_module_id()
+
+    log.info("new_character: requested=%s", module_id)
+    _log_discovered()
+
+    mod = load_module(module_id, modules)
+
+    abilities = {k: models.AbilityScore(name=k, score=v) for k, v in mod.template_abilities().items()}
+    skills = [models.Skill(name=s["name"], ability=s["ability"]) for s in mod.template_skills()]
+
+    char = models.Character(
+        name=data.get("name", "New Hero"),
+        level=int(data.get("level", 1)),
+        module=module_id,
+        abilities=abilities,
+        skills=skills,
+        items=[],
+        feats=[],
+    )
+    return char.model_dump(by_alias=True, exclude_none=True)
+
+
+def derive(payload: Any, modules: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    char = parse_character(payload)
+
+    log.info("derive: requested module=%s", char.module)
+    _log_discovered()
+
+    mod = load_module(char.module, modules)
+    d = mod.derive(char)
+    return d.model_dump() if hasattr(d, "model_dump") else dict(d)
+
+
+def validate(payload: Any, modules: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    char = parse_character(payload)
+    mod = load_module(char.module, modules)
+    return {"issues": list(mod.validate(char))}
+
+
+OPERATIONS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "new_character": new_character,
+    "derive": derive,
+    "validate": validate,
+}
+
+
+def execute(op: str, payload: Any, modules: Optional[Dict[str, Any]] = None) -> bytes:
+    """Run operation ``op`` on a decoded request payload; return the body."""
+    return encode(OPERATIONS[op](payload, modules))
+
+
+def _raise_for(outcome: Outcome) -> bytes:
+    status, body, _secs = outcome
+    if status != 200:
+        raise HTTPException(status_code=status, detail=body)
+    return body  # type: ignore[return-value]
+
+
+class DeriveBackend:
+    """Interface used by the request handlers."""
+
+    name = "base"
+
+    async def execute(
+        self, op: str, payload: Any, modules: Optional[Dict[str, Any]] = None
+    ) -> bytes:  # pragma: no cover - interface
+        """Run ``op``; ``modules`` may carry modules resolved earlier in a batch."""
+        raise NotImplementedError
+
+    async def execute_many(self, op: str, payloads: Sequence[Any]) -> List[Union[bytes, HTTPException]]:
+        """Run ``op`` for each payload; failures are returned, not raised."""
+        results = await asyncio.gather(
+            *(self.execute(op, p) for p in payloads), return_exceptions=True
+        )
+        out: List[Union[bytes, HTTPException]] = []
+        for res in results:
+            if isinstance(res, BaseException) and not isinstance(res, HTTPException):
+                log.error("%s failed: %s: %s", op, type(res).__name__, res)
+                res = HTTPException(status_code=500, detail=f"{type(res).__name__}: {res}")
+            out.append(res)
+        return out
+
+    def start(self) -> None:
+        """Prepare workers ahead of the first request, if the backend has any."""
+
+    def stats(self) -> Dict[str, Any]:
+        return {"name": self.name}
+
+    def shutdown(self) -> None:
+        pass
+
+
+class ThreadBackend(DeriveBackend):
+    """Run operations in this process on the dispatcher's thread pool."""
+
+    name = "thread"
+
+    def __init__(self, dispatcher: Dispatcher) -> None:
+        self.dispatcher = dispatcher
+
+    async def execute(self, op: str, payload: Any, modules: Optional[Dict[str, Any]] = None) -> bytes:
+        return await self.dispatcher.run(execute, op, payload, modules, label=op)
+
+
+def _worker_init(module_ids: List[str]) -> None:
+    import dndcs  # noqa: F401  - sets up sys.path for main-Core
+
+    for module_id in module_ids:
+        mod = loader.load_module_by_manifest_id(module_id)
+        if mod is None:
+            continue
+        if hasattr(mod, "load_subsystems"):
+            mod.load_subsystems()
+        for table in ("feats", "companions"):
+            getattr(mod, table, None)
+
+
+def _run_batch(items: List[Tuple[str, bytes]]) -> List[Outcome]:
+    out: List[Outcome] = []
+    for op, raw in items:
+        start = time.perf_counter()
+        body: Union[bytes, str]
+        try:
+            status, body = 200, execute(op, json.loads(raw))
+        except HTTPException as exc:
+            status, body = exc.status_code, str(exc.detail)
+        except Exception as exc:
+            log.exception("%s failed in worker", op)
+            status, body = 500, f"{type(exc).__name__}: {exc}"
+        out.append((status, body, time.perf_counter() - start))
+    return out
+
+
+class _Item:
+    __slots__ = ("op", "raw", "future", "loop", "submitted")
+
+    def __init__(self, op: str, raw: bytes, future: asyncio.Future, loop: asyncio.AbstractEventLoop) -> None:
+        self.op = op
+        self.raw = raw
+        self.future = future
+        self.loop = loop
+        self.submitted = time.perf_counter()
+
+
+def _settle(fut: asyncio.Future, outcome: Outcome) -> None:
+    if not fut.done():
+        fut.set_result(outcome)
+
+
+class ProcessBackend(DeriveBackend):
+    """Run operations in worker processes that preload the rules modules.
+
+    Requests that arrive in the same event-loop iteration are shipped to a
+    worker together, up to ``batch_size`` per task, with payloads sent as
+    compact JSON bytes.  When a worker dies the pool is replaced and the
+    affected batch is retried once.
+    """
+
+    name = "process"
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        batch_size: int = 16,
+        preload: Optional[List[str]] = None,
+        mp_context: str = "spawn",
+    ) -> None:
+        self.processes = processes or multiprocessing.cpu_count()
+        self.batch_size = max(1, batch_size)
+        self.preload = preload if preload is not None else [registry.default_module_id()]
+        self._ctx = multiprocessing.get_context(mp_context)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending: List[_Item] = []
+        self._flush_scheduled = False
+        self.timings = DispatchStats()
+        self.batches = 0
+        self.items = 0
+        self.restarts = 0
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=self._ctx,
+                    initializer=_worker_init,
+                    initargs=(self.preload,),
+                )
+            return self._executor
+
+    def start(self) -> None:
+        """Spawn the workers now instead of on the first request."""
+        self.executor.submit(_run_batch, []).result()
+
+    async def execute(self, op: str, payload: Any, modules: Optional[Dict[str, Any]] = None) -> bytes:
+        # Workers keep their preloaded modules resident, so ``modules`` is
+        # not needed (and could not be shared) here.
+        loop = asyncio.get_running_loop()
+        item = _Item(op, encode(payload), loop.create_future(), loop)
+        batch: Optional[List[_Item]] = None
+        with self._lock:
+            self._pending.append(item)
+            if len(self._pending) >= self.batch_size:
+                batch, self._pending = self._pending, []
+            elif not self._flush_scheduled:
+                self._flush_scheduled = True
+                loop.call_soon(self._flush)
+        if batch:
+            self._submit(batch)
+        return _raise_for(await item.future)
+
+    def _flush(self) -> None:
+        with self._lock:
+            self._flush_scheduled = False
+            pending, self._pending = self._pending, []
+        # Spread what arrived across the workers rather than filling one
+        # batch while the others sit idle.
+        size = min(self.batch_size, -(-len(pending) // self.processes)) or 1
+        for i in range(0, len(pending), size):
+            self._submit(pending[i : i + size])
+
+    def _submit(self, batch: List[_Item], attempt: int = 0) -> None:
+        executor = self.executor
+        try:
+            fut = executor.submit(_run_batch, [(i.op, i.raw) for i in batch])
+        except BrokenProcessPool as exc:
+            self._on_broken(executor, batch, attempt, exc)
+            return
+        with self._lock:
+            self.batches += 1
+        fut.add_done_callback(lambda f: self._complete(executor, batch, attempt, f))
+
+    def _complete(self, executor: ProcessPoolExecutor, batch: List[_Item], attempt: int, fut: Future) -> None:
+        try:
+            outcomes = fut.result()
+        except BrokenProcessPool as exc:
+            self._on_broken(executor, batch, attempt, exc)
+            return
+        except Exception as exc:
+            log.error("Derive batch failed: %s: %s", type(exc).__name__, exc)
+            outcomes = [(500, f"{type(exc).__name__}: {exc}", 0.0)] * len(batch)
+        done = time.perf_counter()
+        with self._lock:
+            self.items += len(batch)
+        for item, outcome in zip(batch, outcomes):
+            ran = outcome[2]
+            self.timings.record(item.op, max(0.0, done - item.submitted - ran), ran)
+            item.loop.call_soon_threadsafe(_settle, item.future, outcome)
+
+    def _on_broken(self, executor: ProcessPoolExecutor, batch: List[_Item], attempt: int, exc: Exception) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+                self.restarts += 1
+                log.warning("Derive worker pool broke (%s); restarting", exc)
+        executor.shutdown(wait=False)
+        if attempt == 0:
+            self._submit(batch, attempt=1)
+            return
+        for item in batch:
+            item.loop.call_soon_threadsafe(_settle, item.future, (500, "Derive worker crashed", 0.0))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = {
+                "name": self.name,
+                "processes": self.processes,
+                "batch_size": self.batch_size,
+                "batches": self.batches,
+                "items": self.items,
+                "restarts": self.restarts,
+            }
+        out.update(self.timings.to_dict())
+        return out
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def make_backend(
+    name: str,
+    dispatcher: Dispatcher,
+    processes: Optional[int] = None,
+    batch_size: int = 16,
+    mp_context: str = "spawn",
+) -> DeriveBackend:
+    if name == "thread":
+        return ThreadBackend(dispatcher)
+    if name == "process":
+        return ProcessBackend(processes=processes, batch_size=batch_size, mp_context=mp_context)
+    raise ValueError(f"Unknown derive backend {name!r}; expected one of {', '.join(BACKENDS)}")
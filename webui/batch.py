@@ -0,0 +1,342 @@
+"""Incremental parsing and streamed results for batch endpoints.
+
+Request bodies are read chunk by chunk and split into items as they
+arrive, either from a JSON array or from NDJSON (one JSON value per line).
+At most ``window`` items are in flight at once and no single item may
+exceed ``max_item_bytes``, so memory stays bounded however large the
+upload is.  Results are written back as NDJSON, one line per item.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
+
+from starlette.requests import ClientDisconnect
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+BATCH_WINDOW = 32
+MAX_ITEM_BYTES = 4 * 1024 * 1024
+ORDERS = ("input", "completion")
+
+_WS = b" \t\r\n"
+
+
+class BatchItemError:
+    """Placeholder for an item that could not be parsed."""
+
+    __slots__ = ("message",)
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+
+    def __str__(self) -> str:
+        return self.message
+
+
+Item = Union[Any, BatchItemError]
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """Stream NDJSON lines without ever calling ``receive`` itself.
+
+    :class:`~starlette.responses.StreamingResponse` listens for client
+    disconnects by reading ``receive`` next to the body, which swallows
+    request body chunks the batch reader has not consumed yet.  Here the
+    request body reader is the only consumer of ``receive`` and notices a
+    disconnect as :class:`~starlette.requests.ClientDisconnect`.
+    """
+
+    media_type = "application/x-ndjson"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except (OSError, ClientDisconnect):
+            return
+        if self.background is not None:
+            await self.background()
+
+
+def result_line(index: int, body: bytes) -> bytes:
+    """NDJSON line for a successful item; ``body`` is already-encoded JSON."""
+    return b'{"index":%d,"ok":true,"result":' % index + body + b"}\n"
+
+
+def error_line(index: int, status: int, detail: Any) -> bytes:
+    data = {"index": index, "ok": False, "status": status, "error": str(detail)}
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+async def iter_ndjson(chunks: AsyncIterable[bytes], max_item_bytes: int = MAX_ITEM_BYTES) -> AsyncIterator[Item]:
+    """Yield one decoded value per non-blank line; bad lines become errors."""
+    buf = bytearray()
+    scan = 0  # everything before this offset is known to hold no newline
+    skipping = False  # discarding the rest of an oversized line
+    async for chunk in chunks:
+        buf += chunk
+        while True:
+            nl = buf.find(b"\n", scan)
+            if nl < 0:
+                scan = len(buf)
+                break
+            if skipping:
+                skipping = False
+            else:
+                item = _line_item(buf, nl, max_item_bytes)
+                if item is not None:
+                    yield item
+            del buf[: nl + 1]
+            scan = 0
+        if len(buf) > max_item_bytes and not skipping:
+            yield BatchItemError(f"Item exceeds {max_item_bytes} bytes")
+            skipping = True
+        if skipping:
+            buf.clear()
+            scan = 0
+    if not skipping:
+        item = _line_item(buf, len(buf), max_item_bytes)
+        if item is not None:
+            yield item
+
+
+def _line_item(buf: bytearray, end: int, max_item_bytes: int) -> Optional[Item]:
+    if end > max_item_bytes:
+        return BatchItemError(f"Item exceeds {max_item_bytes} bytes")
+    line = bytes(buf[:end])
+    if not line.strip():
+        return None
+    try:
+        return json.loads(line)
+    except ValueError as exc:
+        return BatchItemError(f"Invalid JSON: {exc}")
+
+
+# Characters that matter while scanning for the end of a JSON value.
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb"[,\]\s]")
+
+
+class _ValueScanner:
+    """Find where one JSON value ends in a growing buffer without decoding it.
+
+    Scanning resumes where the previous call stopped, so each byte of the
+    input is looked at once however it is split into chunks.
+    """
+
+    __slots__ = ("start", "resume", "depth", "in_string", "scalar")
+
+    def reset(self, start: int) -> None:
+        self.start = start
+        self.resume = start
+        self.depth = 0
+        self.in_string = False
+        self.scalar = False
+
+    def end(self, buf: bytearray, eof: bool) -> int:
+        """Return the offset just past the value, or -1 if it is incomplete."""
+        i = self.resume
+        if i == self.start:
+            first = buf[i : i + 1]
+            if first in (b"{", b"["):
+                self.depth = 1
+            elif first == b'"':
+                self.in_string = True
+            else:
+                self.scalar = True
+            i += 1
+        while True:
+            if self.scalar:
+                m = _SCALAR_END.search(buf, i)
+                if m is None:
+                    i = len(buf)
+                    break
+                return m.start()
+            if self.in_string:
+                m = _STRING_SPECIAL.search(buf, i)
+                if m is None:
+                    i = len(buf)
+                    break
+                if buf[m.start()] == 0x5C:  # backslash escapes the next byte
+                    if m.start() + 1 >= len(buf):
+                        i = m.start()
+                        break
+                    i = m.start() + 2
+                    continue
+                self.in_string = False
+                i = m.end()
+                if self.depth == 0:
+                    return i
+                continue
+            m = _STRUCTURAL.search(buf, i)
+            if m is None:
+                i = len(buf)
+                break
+            ch = buf[m.start()]
+            i = m.end()
+            if ch == 0x22:  # '"'
+                self.in_string = True
+            elif ch in (0x7B, 0x5B):  # '{' '['
+                self.depth += 1
+            else:
+                self.depth -= 1
+                if self.depth == 0:
+                    return i
+        self.resume = i
+        if eof and self.scalar:
+            return len(buf)
+        return -1
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes], max_item_bytes: int = MAX_ITEM_BYTES) -> AsyncIterator[Item]:
+    """Yield the elements of a top-level JSON array as they become complete.
+
+    Each element is decoded once, after the scanner has seen its closing
+    delimiter.  A syntax error cannot be recovered from inside an array,
+    so it is reported as a final :class:`BatchItemError`.
+    """
+    buf = bytearray()
+    pos = 0
+    state = "start"  # start -> first -> (value -> sep)* -> done
+    scanner = _ValueScanner()
+    scanning = False
+    stream = chunks.__aiter__()
+    eof = False
+
+    while True:
+        need_more = False
+        if not scanning:
+            while pos < len(buf) and buf[pos] in _WS:
+                pos += 1
+        if pos >= len(buf):
+            if eof:
+                if state != "done":
+                    yield BatchItemError("Unexpected end of JSON array")
+                return
+            need_more = True
+        elif scanning or state == "value" or (state == "first" and buf[pos] != 0x5D):
+            if not scanning:
+                scanner.reset(pos)
+                scanning = True
+            end = scanner.end(buf, eof)
+            if end < 0:
+                if eof:
+                    yield BatchItemError("Unexpected end of JSON array")
+                    return
+                need_more = True
+            else:
+                scanning = False
+                try:
+                    value = json.loads(bytes(buf[pos:end]))
+                except ValueError as exc:
+                    yield BatchItemError(f"Invalid JSON: {exc}")
+                    return
+                del buf[:end]
+                pos = 0
+                state = "sep"
+                yield value
+        else:
+            ch = buf[pos]
+            if state == "start":
+                if ch != 0x5B:
+                    yield BatchItemError("Expected a JSON array")
+                    return
+                state = "first"
+            elif ch == 0x5D and state in ("first", "sep"):
+                state = "done"
+            elif state == "sep":
+                if ch != 0x2C:
+                    yield BatchItemError("Expected ',' or ']' between array items")
+                    return
+                state = "value"
+            else:
+                yield BatchItemError("Unexpected data after JSON array")
+                return
+            pos += 1
+        if need_more:
+            if len(buf) - pos > max_item_bytes:
+                yield BatchItemError(f"Item exceeds {max_item_bytes} bytes")
+                return
+            try:
+                buf += await stream.__anext__()
+            except StopAsyncIteration:
+                eof = True
+
+
+def iter_items(chunks: AsyncIterable[bytes], content_type: str = "", max_item_bytes: int = MAX_ITEM_BYTES) -> AsyncIterator[Item]:
+    """Parse ``chunks`` as NDJSON or as a JSON array.
+
+    NDJSON is used when the content type says so; otherwise the body is
+    sniffed: a leading ``[`` means a JSON array.
+    """
+    if "ndjson" in content_type:
+        return iter_ndjson(chunks, max_item_bytes)
+    return _sniff(chunks, max_item_bytes)
+
+
+async def _sniff(chunks: AsyncIterable[bytes], max_item_bytes: int) -> AsyncIterator[Item]:
+    stream = chunks.__aiter__()
+    head: List[bytes] = []
+    first = b""
+    async for chunk in stream:
+        head.append(chunk)
+        first = chunk.lstrip()[:1]
+        if first:
+            break
+
+    async def _replay() -> AsyncIterator[bytes]:
+        for chunk in head:
+            yield chunk
+        async for chunk in stream:
+            yield chunk
+
+    parser = iter_json_array if first == b"[" else iter_ndjson
+    async for item in parser(_replay(), max_item_bytes):
+        yield item
+
+
+async def stream_results(
+    items: AsyncIterable[Item],
+    run: Callable[[int, Item], Awaitable[bytes]],
+    order: str = "input",
+    window: int = BATCH_WINDOW,
+) -> AsyncIterator[bytes]:
+    """Run ``run(index, item)`` with at most ``window`` items in flight.
+
+    ``order="input"`` yields results in the order items arrived;
+    ``"completion"`` yields each as soon as it finishes.  ``run`` is
+    expected to turn failures into error lines itself.
+    """
+    if order not in ORDERS:
+        raise ValueError(f"order must be one of {', '.join(ORDERS)}")
+    pending: Dict[int, asyncio.Future] = {}
+    stream = items.__aiter__()
+    exhausted = False
+    received = 0
+    emitted = 0
+    try:
+        while True:
+            while not exhausted and len(pending) < window:
+                try:
+                    item = await stream.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending[received] = asyncio.ensure_future(run(received, item))
+                received += 1
+            if not pending:
+                return
+            if order == "input":
+                yield await pending.pop(emitted)
+                emitted += 1
+            else:
+                done, _ = await asyncio.wait(pending.values(), return_when=asyncio.FIRST_COMPLETED)
+                for index in [i for i, f in pending.items() if f in done]:
+                    yield pending.pop(index).result()
+    finally:
+        for fut in pending.values():
+            fut.cancel()
@@ -0,0 +1,95 @@
+"""Single-flight coalescing of identical concurrent work.
+
+While a computation for a key is running, further requests for the same
+key wait for it and share its result (or exception) instead of doing the
+work again.  Nothing is remembered once the computation finishes; caching
+is the caller's business.  Keys only coalesce within one process, but
+across the event loop and any number of threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Run at most one computation per key at a time.
+
+    :meth:`run` serves coroutines on an event loop and :meth:`do` serves
+    blocking callables on worker threads; both share one table of in-flight
+    keys, so an async request and a threaded one for the same key coalesce
+    too.  ``label`` only groups the counters reported by :meth:`stats`.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Tuple[str, Hashable], Future] = {}
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+    def _join(self, label: str, key: Hashable) -> Tuple[Future, bool]:
+        with self._lock:
+            counts = self._counts.setdefault(label, {"executed": 0, "coalesced": 0})
+            fut = self._calls.get((label, key))
+            if fut is not None:
+                counts["coalesced"] += 1
+                return fut, False
+            fut = Future()
+            self._calls[(label, key)] = fut
+            counts["executed"] += 1
+            return fut, True
+
+    def _finish(self, label: str, key: Hashable) -> None:
+        with self._lock:
+            self._calls.pop((label, key), None)
+
+    def do(self, label: str, key: Hashable, fn: Callable[[], T]) -> T:
+        """Return ``fn()``, or the result of the identical call already running."""
+        fut, leader = self._join(label, key)
+        if not leader:
+            return fut.result()
+        try:
+            result = fn()
+        except BaseException as exc:
+            self._finish(label, key)
+            fut.set_exception(exc)
+            raise
+        self._finish(label, key)
+        fut.set_result(result)
+        return result
+
+    async def run(self, label: str, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()``, or the result of the identical call already running.
+
+        The computation runs as its own task, so a caller that is cancelled
+        (say, by a client disconnect) does not cancel it for the others.
+        """
+        fut, leader = self._join(label, key)
+        if leader:
+            task = asyncio.ensure_future(fn())
+
+            def _done(t: "asyncio.Future[T]") -> None:
+                self._finish(label, key)
+                if t.cancelled():
+                    fut.cancel()
+                elif t.exception() is not None:
+                    fut.set_exception(t.exception())  # type: ignore[arg-type]
+                else:
+                    fut.set_result(t.result())
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(asyncio.wrap_future(fut))
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = {"in_flight": len(self._calls)}
+            out.update({label: dict(counts) for label, counts in sorted(self._counts.items())})
+            return out
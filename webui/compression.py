@@ -0,0 +1,252 @@
+"""Negotiated compression of API responses.
+
+gzip is always available; brotli (``brotli`` or ``brotlicffi``) and zstd
+(``zstandard``) are offered when the package is importable.  Only complete
+JSON/text bodies of at least ``minimum_size`` bytes are compressed;
+streamed responses such as the NDJSON batch endpoint pass through.
+
+Responses that carry a strong ETag are the same bytes every time the tag
+is the same (the spell catalog, the module listing, cached derive
+results), so their compressed form is kept per encoding in a bounded LRU
+and compressed once at a high level.  Everything else is compressed at a
+fast level.  Compressed responses get the encoding appended to their
+ETag, as a strong tag must differ between representations.
+"""
+
+from __future__ import annotations
+
+import gzip
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+MIN_SIZE = 1024
+CACHE_BYTES = 16 * 1024 * 1024
+
+_COMPRESSIBLE = ("application/json", "text/")
+
+# encoding -> (compress(body, level), fast level, level for cached bodies)
+Codec = Tuple[Callable[[bytes, int], bytes], int, int]
+
+
+def _gzip(body: bytes, level: int) -> bytes:
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def _load_codecs() -> Dict[str, Codec]:
+    codecs: Dict[str, Codec] = {}
+    try:
+        import brotli  # type: ignore[import-not-found]
+    except ImportError:
+        try:
+            import brotlicffi as brotli  # type: ignore[import-not-found,no-redef]
+        except ImportError:
+            brotli = None
+    if brotli is not None:
+        codecs["br"] = (lambda body, level: brotli.compress(body, quality=level), 4, 11)
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError:
+        pass
+    else:
+        codecs["zstd"] = (lambda body, level: zstandard.ZstdCompressor(level=level).compress(body), 3, 19)
+    codecs["gzip"] = (_gzip, 4, 9)
+    return codecs
+
+
+# In order of preference when the client accepts several equally.
+CODECS = _load_codecs()
+ENCODINGS: List[str] = list(CODECS)
+
+
+def negotiate(accept_encoding: str, available: Optional[List[str]] = None) -> Optional[str]:
+    """Pick the best encoding from an ``Accept-Encoding`` header, or None."""
+    offers = available if available is not None else ENCODINGS
+    quality: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        quality[name.strip()] = q
+    best: Optional[str] = None
+    best_q = 0.0
+    for enc in offers:
+        q = quality.get(enc, quality.get("*", 0.0))
+        if q > best_q:
+            best, best_q = enc, q
+    return best
+
+
+def tagged(etag: str, encoding: str) -> str:
+    """Return ``etag`` with ``encoding`` appended inside the quotes."""
+    return f'{etag[:-1]}-{encoding}"'
+
+
+class CompressionStats:
+    """Per-encoding counters: bytes in and out, CPU time and cache hits."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict[str, float]] = {}
+
+    def record(self, encoding: str, size_in: int, size_out: int, cpu: float, cached: bool) -> None:
+        with self._lock:
+            row = self._data.setdefault(
+                encoding,
+                {"responses": 0, "cache_hits": 0, "bytes_in": 0, "bytes_out": 0, "cpu_seconds": 0.0},
+            )
+            row["responses"] += 1
+            row["bytes_in"] += size_in
+            row["bytes_out"] += size_out
+            if cached:
+                row["cache_hits"] += 1
+            else:
+                row["cpu_seconds"] += cpu
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = {}
+            for enc, row in sorted(self._data.items()):
+                saved = row["bytes_in"] - row["bytes_out"]
+                cpu_ms = row["cpu_seconds"] * 1000
+                out[enc] = {
+                    "responses": int(row["responses"]),
+                    "cache_hits": int(row["cache_hits"]),
+                    "bytes_in": int(row["bytes_in"]),
+                    "bytes_out": int(row["bytes_out"]),
+                    "bytes_saved": int(saved),
+                    "ratio": round(row["bytes_out"] / row["bytes_in"], 3) if row["bytes_in"] else 0.0,
+                    "cpu_ms": round(cpu_ms, 3),
+                    "kib_saved_per_cpu_ms": round(saved / 1024 / cpu_ms, 1) if cpu_ms else None,
+                }
+            return out
+
+
+class CompressedCache:
+    """LRU of compressed bodies keyed by (ETag, encoding), bounded in bytes."""
+
+    def __init__(self, max_bytes: int = CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple[str, str]) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: Tuple[str, str], body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= len(old)
+            self._entries[key] = body
+            self.bytes += len(body)
+            while self.bytes > self.max_bytes:
+                _key, dropped = self._entries.popitem(last=False)
+                self.bytes -= len(dropped)
+
+
+class CompressionMiddleware:
+    """Pure ASGI middleware compressing complete responses under ``prefix``."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        stats: Optional[CompressionStats] = None,
+        cache: Optional[CompressedCache] = None,
+        minimum_size: int = MIN_SIZE,
+        prefix: str = "/api/",
+    ) -> None:
+        self.app = app
+        self.stats = stats if stats is not None else CompressionStats()
+        self.cache = cache if cache is not None else CompressedCache()
+        self.minimum_size = minimum_size
+        self.prefix = prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.prefix):
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        encoding = negotiate(request_headers.get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        if_none_match = request_headers.get("if-none-match", "")
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def _send(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            assert start is not None
+            passthrough = True
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            if start["status"] == 304:
+                etag = headers.get("etag")
+                if etag and tagged(etag, encoding) in if_none_match:
+                    headers["etag"] = tagged(etag, encoding)
+                headers.add_vary_header("Accept-Encoding")
+            elif self._eligible(start["status"], headers, body, message.get("more_body", False)):
+                body = self._compress(encoding, headers, body)
+                message = {"type": "http.response.body", "body": body}
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, _send)
+
+    def _eligible(self, status: int, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        return (
+            status == 200
+            and not more_body
+            and len(body) >= self.minimum_size
+            and "content-encoding" not in headers
+            and headers.get("content-type", "").startswith(_COMPRESSIBLE)
+        )
+
+    def _compress(self, encoding: str, headers: MutableHeaders, body: bytes) -> bytes:
+        compress, fast, best = CODECS[encoding]
+        etag = headers.get("etag")
+        key = (etag, encoding) if etag and not etag.startswith("W/") else None
+        out = self.cache.get(key) if key else None
+        cached = out is not None
+        cpu = 0.0
+        if out is None:
+            started = time.thread_time()
+            out = compress(body, best if key else fast)
+            cpu = time.thread_time() - started
+            if key:
+                self.cache.put(key, out)
+        self.stats.record(encoding, len(body), len(out), cpu, cached)
+        headers["content-encoding"] = encoding
+        headers["content-length"] = str(len(out))
+        headers.add_vary_header("Accept-Encoding")
+        if etag:
+            headers["etag"] = tagged(etag, encoding)
+        return out
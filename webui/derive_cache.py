@@ -0,0 +1,216 @@
+"""Content-addressed cache of derive responses.
+
+A result is keyed by a hash of the canonical JSON of the character plus
+the token of the module build that derived it (id, version and a hash of
+its source files), so an unchanged character derived by an unchanged
+module is answered with the stored response bytes without touching the
+module or the JSON encoder.  Entries are evicted least recently used
+first once either the entry or the byte budget is exceeded, and all
+entries of a module are dropped when the module cache replaces or evicts
+it.
+
+:class:`DeriveStates` keeps, per derive ETag, what ``/api/derive/patch``
+needs to derive an edited character incrementally.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
+
+from dndcs.core import loader
+from dndcs.core.incremental import DeriveState
+from dndcs.logger import get_logger
+
+log = get_logger("ui.derive_cache")
+
+_DEFAULT_MAX_ENTRIES = 1024
+_DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+_DEFAULT_MAX_STATES = 256
+
+
+def canonical_hash(payload: Any) -> str:
+    """Hash ``payload`` independently of key order and whitespace."""
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class DeriveCache:
+    """Thread-safe LRU of encoded derive responses bounded by count and bytes.
+
+    ``max_entries=0`` disables caching.  Keys come from :meth:`key`; an
+    entry's size is the length of its response body.
+    """
+
+    def __init__(self, max_entries: int = _DEFAULT_MAX_ENTRIES, max_bytes: int = _DEFAULT_MAX_BYTES) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self.max_bytes = max(0, int(max_bytes))
+        self._entries: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(payload: Any, module_id: str, token: str) -> str:
+        return f"{module_id}:{token}:{canonical_hash(payload)}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, module_id: str, body: bytes) -> None:
+        if not self.enabled or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= len(old[1])
+            self._entries[key] = (module_id, body)
+            self.bytes += len(body)
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _key, (_mid, dropped) = self._entries.popitem(last=False)
+                self.bytes -= len(dropped)
+                self.evictions += 1
+
+    def invalidate(self, module_id: Optional[str] = None) -> int:
+        """Drop the entries derived by ``module_id`` (all when None); return how many."""
+        with self._lock:
+            if module_id is None:
+                keys = list(self._entries)
+            else:
+                keys = [k for k, (mid, _body) in self._entries.items() if mid == module_id]
+            for k in keys:
+                self.bytes -= len(self._entries.pop(k)[1])
+            self.invalidations += len(keys)
+        if keys:
+            log.info("Dropped %d cached derive result(s) for %s", len(keys), module_id or "all modules")
+        return len(keys)
+
+    def attach(self, cache: loader.ModuleCache = loader.MODULE_CACHE) -> None:
+        """Invalidate entries whenever ``cache`` replaces or drops a module."""
+        cache.add_listener(self.invalidate)
+
+    def detach(self, cache: loader.ModuleCache = loader.MODULE_CACHE) -> None:
+        cache.remove_listener(self.invalidate)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+class DeriveStates:
+    """Thread-safe LRU of derive bases for incremental derivation, keyed by ETag.
+
+    A base is either the character payload a full derive was computed
+    from (cheap to record on every ``/api/derive``) or the
+    :class:`~dndcs.core.incremental.DeriveState` left by a previous patch.
+    """
+
+    def __init__(self, max_entries: int = _DEFAULT_MAX_STATES) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self._entries: "OrderedDict[str, Tuple[str, Union[Dict[str, Any], DeriveState]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, etag: str) -> Optional[Tuple[str, Union[Dict[str, Any], DeriveState]]]:
+        with self._lock:
+            entry = self._entries.get(etag)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(etag)
+            self.hits += 1
+            return entry
+
+    def put(self, etag: str, module_id: str, base: Union[Dict[str, Any], DeriveState]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            old = self._entries.get(etag)
+            if old is not None and isinstance(old[1], DeriveState) and not isinstance(base, DeriveState):
+                # Keep the richer base for the same character.
+                self._entries.move_to_end(etag)
+                return
+            self._entries[etag] = (module_id, base)
+            self._entries.move_to_end(etag)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, module_id: Optional[str] = None) -> None:
+        with self._lock:
+            if module_id is None:
+                self._entries.clear()
+                return
+            for k in [k for k, (mid, _base) in self._entries.items() if mid == module_id]:
+                del self._entries[k]
+
+    def attach(self, cache: loader.ModuleCache = loader.MODULE_CACHE) -> None:
+        cache.add_listener(self.invalidate)
+
+    def detach(self, cache: loader.ModuleCache = loader.MODULE_CACHE) -> None:
+        cache.remove_listener(self.invalidate)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def _int_from_env(name: str, default: int) -> int:
+    env_val = os.getenv(name)
+    try:
+        return int(env_val) if env_val else default
+    except ValueError:
+        return default
+
+
+def derive_cache_from_env() -> DeriveCache:
+    """Build a cache sized by ``DNDCS_DERIVE_CACHE_SIZE`` and ``DNDCS_DERIVE_CACHE_BYTES``."""
+    return DeriveCache(
+        _int_from_env("DNDCS_DERIVE_CACHE_SIZE", _DEFAULT_MAX_ENTRIES),
+        _int_from_env("DNDCS_DERIVE_CACHE_BYTES", _DEFAULT_MAX_BYTES),
+    )
+
+
+def derive_states_from_env() -> DeriveStates:
+    """Build the incremental-derive base store sized by ``DNDCS_DERIVE_STATES``."""
+    return DeriveStates(_int_from_env("DNDCS_DERIVE_STATES", _DEFAULT_MAX_STATES))
@@ -0,0 +1,145 @@
+"""Run blocking request work off the event loop.
+
+Handlers ``await dispatcher.run(fn, ...)`` instead of calling module
+loading, validation or derivation inline, so one slow request does not
+stall other connections.  The dispatcher records how long each call
+waited for a free worker separately from how long it ran.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from dndcs.logger import get_logger
+
+log = get_logger("ui.dispatch")
+
+T = TypeVar("T")
+
+
+class _Timing:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, secs: float) -> None:
+        self.count += 1
+        self.total += secs
+        if secs > self.max:
+            self.max = secs
+
+    def to_dict(self) -> Dict[str, float]:
+        mean = self.total / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(mean * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class DispatchStats:
+    """Thread-safe per-label queue wait and execution timings."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._wait: Dict[str, _Timing] = {}
+        self._exec: Dict[str, _Timing] = {}
+
+    def record(self, label: str, wait: float, run: float) -> None:
+        with self._lock:
+            self._wait.setdefault(label, _Timing()).add(wait)
+            self._exec.setdefault(label, _Timing()).add(run)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queue_wait": {k: v.to_dict() for k, v in sorted(self._wait.items())},
+                "execution": {k: v.to_dict() for k, v in sorted(self._exec.items())},
+            }
+
+
+class Dispatcher:
+    """Executes blocking callables on a bounded executor.
+
+    ``max_workers`` sizes the thread pool (``None`` uses the
+    :class:`~concurrent.futures.ThreadPoolExecutor` default).  Timings are
+    kept per label so ``/api/stats`` can show where time goes.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, executor: Optional[Executor] = None) -> None:
+        self.max_workers = max_workers
+        self._executor = executor
+        self._lock = threading.Lock()
+        self.timings = DispatchStats()
+        self.in_flight = 0
+        self.queued = 0
+
+    @property
+    def executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="dndcs-ui"
+                )
+            return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any, label: Optional[str] = None, **kwargs: Any) -> T:
+        """Run ``fn(*args, **kwargs)`` on the executor and await the result."""
+        name = label if label else str(getattr(fn, "__name__", "call"))
+        submitted = time.perf_counter()
+        # [started, abandoned]; guarded by self._lock so the queued count is
+        # decremented exactly once even if the caller is cancelled.
+        state = [False, False]
+        with self._lock:
+            self.queued += 1
+
+        def _call() -> T:
+            start = time.perf_counter()
+            with self._lock:
+                state[0] = True
+                if not state[1]:
+                    self.queued -= 1
+                self.in_flight += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                with self._lock:
+                    self.in_flight -= 1
+                self.timings.record(name, start - submitted, end - start)
+                log.debug(
+                    "%s: waited %.1fms, ran %.1fms", name, (start - submitted) * 1000, (end - start) * 1000
+                )
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.executor, _call)
+        finally:
+            with self._lock:
+                if not state[0] and not state[1]:
+                    state[1] = True
+                    self.queued -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = {
+                "max_workers": self.max_workers,
+                "in_flight": self.in_flight,
+                "queued": self.queued,
+            }
+        out.update(self.timings.to_dict())
+        return out
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
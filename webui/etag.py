@@ -0,0 +1,65 @@
+"""Strong ETags and ``If-None-Match`` handling for the JSON API.
+
+Tags are computed from what determines a response (the module build token
+and the request inputs) rather than from the response itself, so a match
+is answered with ``304 Not Modified`` before any work is done.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Clients must revalidate, but may keep the body and send its tag back.
+CACHE_CONTROL = "no-cache"
+
+# Compressed representations carry the encoding inside the tag (see
+# webui.compression); they still validate the uncompressed response.
+_ENCODING_SUFFIXES = ("-gzip", "-br", "-zstd")
+
+
+def make_etag(*parts: Any) -> str:
+    """Return a quoted strong entity tag for ``parts``."""
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12)
+    return f'"{digest.hexdigest()}"'
+
+
+def matches(header: Optional[str], etag: str) -> bool:
+    """Whether an ``If-None-Match`` header value matches ``etag``.
+
+    Uses the weak comparison RFC 9110 prescribes for ``If-None-Match``;
+    a tag with a content-encoding suffix matches its unencoded form.
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    bare = etag[2:] if etag.startswith("W/") else etag
+    return any(bare_etag(candidate) == bare for candidate in header.split(","))
+
+
+def bare_etag(tag: str) -> str:
+    """Return ``tag`` without a weak prefix or a content-encoding suffix."""
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    for suffix in _ENCODING_SUFFIXES:
+        if tag.endswith(suffix + '"'):
+            return tag[: -len(suffix) - 1] + '"'
+    return tag
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if ``request`` already holds ``etag``."""
+    if matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+    return None
+
+
+def json_response(body: bytes, etag: Optional[str] = None) -> Response:
+    """Wrap encoded JSON ``body``, tagged with ``etag`` when given."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL} if etag else None
+    return Response(body, media_type="application/json", headers=headers)
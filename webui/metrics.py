@@ -0,0 +1,259 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+Counters, gauges and histograms keep one shard per thread: recording a
+value touches only the calling thread's dict, without a lock, and a
+scrape sums the shards.  Values that other components already track
+(dispatcher timings, cache counters, ...) are exported through collectors
+that are called at scrape time instead of being recorded twice.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+Labels = Tuple[str, ...]
+# (name suffix, label values, value); the suffix is "" for plain samples.
+Sample = Tuple[str, Dict[str, str], float]
+
+
+class _Shards:
+    """Per-thread dicts of label values -> state, summed on read."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._all: List[Dict[Labels, Any]] = []
+        self._lock = threading.Lock()
+
+    def mine(self) -> Dict[Labels, Any]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._all.append(shard)
+        return shard
+
+    def snapshot(self) -> List[Dict[Labels, Any]]:
+        with self._lock:
+            shards = list(self._all)
+        # dict.copy() is atomic under the GIL, so a writer adding a key
+        # concurrently cannot break the iteration below.
+        return [s.copy() for s in shards]
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._shards = _Shards()
+
+    def _labels(self, labels: Labels) -> Dict[str, str]:
+        return dict(zip(self.labelnames, labels))
+
+    def samples(self) -> List[Sample]:  # pragma: no cover - interface
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        shard = self._shards.mine()
+        shard[labels] = shard.get(labels, 0.0) + amount
+
+    def values(self) -> Dict[Labels, float]:
+        out: Dict[Labels, float] = {}
+        for shard in self._shards.snapshot():
+            for labels, value in shard.items():
+                out[labels] = out.get(labels, 0.0) + value
+        return out
+
+    def samples(self) -> List[Sample]:
+        return [("", self._labels(k), v) for k, v in sorted(self.values().items())]
+
+
+class Gauge(Counter):
+    """A counter that may go down; per-thread shards still sum correctly."""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str) -> None:
+        shard = self._shards.mine()
+        state = shard.get(labels)
+        if state is None:
+            # One slot per bucket plus +Inf, then sum and count.
+            state = shard[labels] = [0.0] * (len(self.buckets) + 3)
+        state[bisect.bisect_left(self.buckets, value)] += 1
+        state[-2] += value
+        state[-1] += 1
+
+    def values(self) -> Dict[Labels, List[float]]:
+        out: Dict[Labels, List[float]] = {}
+        for shard in self._shards.snapshot():
+            for labels, state in shard.items():
+                total = out.setdefault(labels, [0.0] * len(state))
+                for i, v in enumerate(state):
+                    total[i] += v
+        return out
+
+    def samples(self) -> List[Sample]:
+        out: List[Sample] = []
+        for labels, state in sorted(self.values().items()):
+            base = self._labels(labels)
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (math.inf,), state):
+                cumulative += count
+                out.append(("_bucket", dict(base, le=_format_value(bound)), cumulative))
+            out.append(("_sum", base, state[-2]))
+            out.append(("_count", base, state[-1]))
+        return out
+
+
+class Family:
+    """Samples produced by a collector at scrape time."""
+
+    def __init__(self, name: str, kind: str, help: str, samples: Iterable[Sample] = ()) -> None:
+        self.name = name
+        self.kind = kind
+        self.help = help
+        self._samples = list(samples)
+
+    def add(self, value: float, **labels: Any) -> "Family":
+        self._samples.append(("", {k: str(v) for k, v in labels.items()}, float(value)))
+        return self
+
+    def samples(self) -> List[Sample]:
+        return self._samples
+
+
+Collector = Callable[[], Iterable[Family]]
+
+
+class Registry:
+    def __init__(self, prefix: str = "dndcs_") -> None:
+        self.prefix = prefix
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Collector] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: Metric) -> Any:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(self.prefix + name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(self.prefix + name, help, labelnames))
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(self.prefix + name, help, labelnames, buckets))
+
+    def family(self, name: str, kind: str, help: str) -> Family:
+        """Start a collector family named with this registry's prefix."""
+        return Family(self.prefix + name, kind, help)
+
+    def add_collector(self, collector: Collector) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            metrics: List[Any] = list(self._metrics.values())
+        for collector in self._collectors:
+            metrics.extend(collector())
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if value != value:
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class HTTPMetrics:
+    """Request metrics recorded by the request middleware."""
+
+    def __init__(self, registry: Registry) -> None:
+        self.duration = registry.histogram(
+            "http_request_duration_seconds", "HTTP request latency", ("route", "method", "status")
+        )
+        self.request_size = registry.histogram(
+            "http_request_size_bytes", "HTTP request body size", ("route",), SIZE_BUCKETS
+        )
+        self.response_size = registry.histogram(
+            "http_response_size_bytes", "HTTP response body size as sent", ("route",), SIZE_BUCKETS
+        )
+        self.in_flight = registry.gauge("http_requests_in_flight", "HTTP requests being served")
+
+
+def route_label(scope: Mapping[str, Any]) -> str:
+    """Return the route template that served ``scope`` (bounded cardinality)."""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path:
+        return str(path)
+    return "static" if scope.get("type") == "http" and not scope["path"].startswith("/api/") else "unmatched"
+
+
+def timing_families(registry: Registry, name: str, help: str, data: Dict[str, Dict[str, float]], label: str) -> List[Family]:
+    """Turn ``_Timing.to_dict()`` style rows into ``_seconds_total``/``_total`` families."""
+    secs = registry.family(f"{name}_seconds_total", "counter", f"{help} (seconds)")
+    count = registry.family(f"{name}_total", "counter", f"{help} (calls)")
+    for key, row in sorted(data.items()):
+        secs.add(row["total_ms"] / 1000, **{label: key})
+        count.add(row["count"], **{label: key})
+    return [secs, count]
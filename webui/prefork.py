@@ -0,0 +1,214 @@
+"""Preload-then-fork multi-worker serving.
+
+The parent does the expensive setup once: discovery, module instantiation,
+subsystem imports (which index the catalogs) and the derived lookup
+tables.  It then runs ``gc.freeze()`` so the collector does not touch
+those objects again and forks the workers, which share the pages
+copy-on-write and all accept on one listening socket.  Platforms without
+``os.fork`` fall back to a single process.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import signal
+import socket
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from dndcs.core import loader
+from dndcs.core.discovery import get_module_index
+from dndcs.logger import get_logger, stop_logging
+
+log = get_logger("ui.prefork")
+
+# Seconds after workers (re)start before their memory is reported.
+REPORT_DELAY = 3.0
+# A worker that exits within STARTUP_GRACE seconds of being forked counts
+# as a startup failure.  Replacements for those are delayed by
+# RESPAWN_DELAY, doubling up to MAX_RESPAWN_DELAY, and after
+# MAX_STARTUP_FAILURES in a row the server gives up.
+STARTUP_GRACE = 5.0
+RESPAWN_DELAY = 0.5
+MAX_RESPAWN_DELAY = 30.0
+MAX_STARTUP_FAILURES = 5
+
+
+def preload(module_ids: List[str]) -> Dict[str, float]:
+    """Build everything workers should share; return step timings in seconds."""
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    get_module_index()
+    timings["discovery"] = time.perf_counter() - start
+    for module_id in module_ids:
+        step = time.perf_counter()
+        loader.warmup_modules([module_id])
+        mod = loader.load_module_by_manifest_id(module_id)
+        for table in ("feats", "companions"):
+            getattr(mod, table, None)
+        timings[f"module {module_id}"] = time.perf_counter() - step
+    return timings
+
+
+def process_memory(pid: int) -> Dict[str, int]:
+    """Return RSS, PSS and shared memory of ``pid`` in KiB where available.
+
+    PSS splits shared pages between the processes mapping them, so the sum
+    over all workers is the real footprint.  Empty on non-Linux systems.
+    """
+    out: Dict[str, int] = {}
+    try:
+        text = Path(f"/proc/{pid}/smaps_rollup").read_text()
+    except OSError:
+        try:
+            text = Path(f"/proc/{pid}/status").read_text().replace("VmRSS", "Rss")
+        except OSError:
+            return out
+    for line in text.splitlines():
+        key, _, rest = line.partition(":")
+        if key in ("Rss", "Pss", "Shared_Clean", "Shared_Dirty"):
+            out[key.lower()] = int(rest.split()[0])
+    if "shared_clean" in out or "shared_dirty" in out:
+        out["shared"] = out.pop("shared_clean", 0) + out.pop("shared_dirty", 0)
+    return out
+
+
+def _format_memory(mem: Dict[str, int]) -> str:
+    if not mem:
+        return "memory n/a"
+    return " ".join(f"{k}={v / 1024:.1f}MiB" for k, v in mem.items())
+
+
+def serve_prefork(
+    make_server: Callable[[socket.socket], Any],
+    host: str,
+    port: int,
+    workers: int,
+    module_ids: List[str],
+    on_fork: Optional[Callable[[], None]] = None,
+    on_started: Optional[Callable[[], None]] = None,
+) -> int:
+    """Preload, bind ``host:port`` and fork ``workers`` processes.
+
+    ``make_server(sock)`` runs in each worker and must serve on ``sock``
+    until the process is told to stop; ``on_fork`` runs in each worker
+    before it and ``on_started`` in the parent once all workers exist.
+    Workers that die unexpectedly are replaced, with a growing delay while
+    they keep dying right after start.  SIGINT or SIGTERM in the parent
+    stops all workers.  Returns 0 after a requested stop and 1 when the
+    workers kept failing to start.
+    """
+    started = time.perf_counter()
+    timings = preload(module_ids)
+    step = time.perf_counter()
+    gc.collect()
+    gc.freeze()
+    timings["gc.freeze"] = time.perf_counter() - step
+    for name, secs in timings.items():
+        log.info("prefork: %s %.1fms", name, secs * 1000)
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+
+    children: Dict[int, int] = {}
+    spawned: Dict[int, float] = {}
+    respawns: Dict[int, float] = {}  # slot -> when to fork its replacement
+    failures = 0
+    code = 0
+    stopping = False
+
+    def _spawn(slot: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            code = 0
+            try:
+                if on_fork is not None:
+                    on_fork()
+                make_server(sock)
+            except BaseException:
+                log.exception("Worker %d crashed", os.getpid())
+                code = 1
+            finally:
+                # os._exit skips atexit; write out the queued log records.
+                stop_logging()
+                os._exit(code)
+        children[pid] = slot
+        spawned[pid] = time.monotonic()
+
+    def _stop(signum, _frame) -> None:
+        nonlocal stopping
+        stopping = True
+
+    previous = {s: signal.signal(s, _stop) for s in (signal.SIGINT, signal.SIGTERM)}
+    try:
+        for slot in range(workers):
+            _spawn(slot)
+        log.info(
+            "prefork: %d worker(s) started in %.1fms on http://%s:%d",
+            workers, (time.perf_counter() - started) * 1000, host, port,
+        )
+        if on_started is not None:
+            on_started()
+        report_at: Optional[float] = time.monotonic() + REPORT_DELAY
+        while not stopping:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                if not respawns:
+                    break
+                pid, status = 0, 0
+            now = time.monotonic()
+            if pid:
+                dead_slot = children.pop(pid, None)
+                lived = now - spawned.pop(pid, now)
+                if dead_slot is None or stopping:
+                    continue
+                if lived < STARTUP_GRACE:
+                    failures += 1
+                    if failures >= MAX_STARTUP_FAILURES:
+                        log.error(
+                            "Worker %d exited with status %d %.1fs after start; "
+                            "%d workers in a row failed to start, giving up",
+                            pid, status, lived, failures,
+                        )
+                        code = 1
+                        break
+                else:
+                    failures = 0
+                delay = min(MAX_RESPAWN_DELAY, RESPAWN_DELAY * 2 ** max(0, failures - 1))
+                log.warning("Worker %d exited with status %d; restarting in %.1fs", pid, status, delay)
+                respawns[dead_slot] = now + delay
+                continue
+            for slot, due in list(respawns.items()):
+                if now >= due:
+                    del respawns[slot]
+                    _spawn(slot)
+                    report_at = now + REPORT_DELAY
+            if report_at is not None and now >= report_at:
+                report_at = None
+                log.info("prefork: parent pid=%d %s", os.getpid(), _format_memory(process_memory(os.getpid())))
+                for child in sorted(children):
+                    log.info("prefork: worker pid=%d %s", child, _format_memory(process_memory(child)))
+            time.sleep(0.2)
+    finally:
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in list(children):
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+        sock.close()
+    return code
@@ -1,14 +1,28 @@
 from __future__ import annotations
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 import os, threading, time, webbrowser
-from typing import Dict, Any
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 import uvicorn
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from dndcs.core import models, registry, discovery, loader
-from dndcs.logger import get_logger, init_logging
+from dndcs.core import registry, discovery, loader
+from dndcs.core.incremental import DeriveState
+from dndcs.core.jsonpatch import InvalidPatch, PatchConflict
+from dndcs.logger import get_logger, init_logging, logging_stats
+from dndcs_core.services.module_objects import MODULE_OBJECTS
+from dndcs_core.services.watcher import ModuleReloader
+from webui import batch
+from webui.backends import encode, load_module, make_backend
+from webui.coalesce import SingleFlight
+from webui.compression import CompressionMiddleware, CompressionStats
+from webui.derive_cache import derive_cache_from_env, derive_states_from_env
+from webui.etag import bare_etag, json_response, make_etag, not_modified
+from webui.dispatch import Dispatcher
+from webui import metrics
+from webui.prefork import process_memory, serve_prefork
 
 log = get_logger("ui")
 
@@ -24,62 +38,286 @@ def _safe_join(base: Path, rel: str) -> Path:
     return p
 
 
-def create_app() -> FastAPI:
-    app = FastAPI(title="DnDCS UI", version="0.2.0")
+class RequestLogMiddleware:
+    """Log method, path, status and duration of every HTTP request.
+
+    Plain ASGI rather than ``@app.middleware("http")`` so that streamed
+    request bodies reach the endpoint untouched.  With ``metrics`` the
+    same measurements, plus request and response sizes, feed the
+    ``/metrics`` histograms.
+    """
+
+    def __init__(self, app: ASGIApp, http_metrics: Optional[metrics.HTTPMetrics] = None) -> None:
+        self.app = app
+        self.metrics = http_metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        status = 500
+        sizes = [0, 0]  # request body, response body
 
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next):
-        start = time.time()
+        async def _receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                sizes[0] += len(message.get("body", b""))
+            return message
+
+        async def _send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                sizes[1] += len(message.get("body", b""))
+            await send(message)
+
+        m = self.metrics
+        if m is not None:
+            m.in_flight.inc()
         try:
-            response = await call_next(request)
-        except HTTPException as exc:
-            log.error(
-                "%s %s -> %d: %s",
-                request.method,
-                request.url.path,
-                exc.status_code,
-                exc.detail,
-            )
-            raise
+            await self.app(scope, _receive if m is not None else receive, _send)
         except Exception:
-            log.exception("%s %s -> 500", request.method, request.url.path)
+            log.exception("%s %s -> 500", scope["method"], scope["path"])
             raise
-        duration = (time.time() - start) * 1000
-        log.info(
-            "%s %s -> %d (%.1fms)",
-            request.method,
-            request.url.path,
-            response.status_code,
-            duration,
-        )
-        return response
+        finally:
+            duration = time.perf_counter() - start
+            if m is not None:
+                m.in_flight.dec()
+                route = metrics.route_label(scope)
+                m.duration.observe(duration, route, scope["method"], str(status))
+                m.request_size.observe(sizes[0], route)
+                m.response_size.observe(sizes[1], route)
+        log.info("%s %s -> %d (%.1fms)", scope["method"], scope["path"], status, duration * 1000)
+
+
+def _collect_stats(
+    reg: metrics.Registry,
+    dispatcher: Dispatcher,
+    backend: Any,
+    derive_cache: Any,
+    flights: SingleFlight,
+    compression: CompressionStats,
+) -> List[metrics.Family]:
+    """Export the counters ``/api/stats`` already keeps, read at scrape time."""
+    out: List[metrics.Family] = []
+    stats = dispatcher.stats()
+    out.append(reg.family("dispatch_in_flight", "gauge", "Blocking calls running").add(stats["in_flight"]))
+    out.append(reg.family("dispatch_queued", "gauge", "Blocking calls waiting for a thread").add(stats["queued"]))
+    out += metrics.timing_families(reg, "dispatch_wait", "Dispatcher queue wait", stats["queue_wait"], "label")
+    out += metrics.timing_families(reg, "dispatch_exec", "Dispatcher execution", stats["execution"], "label")
+
+    stats = backend.stats()
+    if "batches" in stats:
+        for key in ("batches", "items", "restarts"):
+            out.append(reg.family(f"backend_{key}_total", "counter", f"Derive backend {key}").add(stats[key]))
+        out += metrics.timing_families(reg, "backend_wait", "Derive backend queue wait", stats["queue_wait"], "op")
+        out += metrics.timing_families(reg, "backend_exec", "Derive backend execution", stats["execution"], "op")
+
+    stats = derive_cache.stats()
+    for key in ("hits", "misses", "evictions", "invalidations"):
+        out.append(reg.family(f"derive_cache_{key}_total", "counter", f"Derive cache {key}").add(stats[key]))
+    out.append(reg.family("derive_cache_entries", "gauge", "Derive cache entries").add(stats["entries"]))
+    out.append(reg.family("derive_cache_bytes", "gauge", "Derive cache size").add(stats["bytes"]))
+
+    stats = flights.stats()
+    executed = reg.family("coalesce_executed_total", "counter", "Requests computed")
+    coalesced = reg.family("coalesce_coalesced_total", "counter", "Requests that joined one in flight")
+    for label, row in sorted(stats.items()):
+        if isinstance(row, dict):
+            executed.add(row["executed"], label=label)
+            coalesced.add(row["coalesced"], label=label)
+    out += [executed, coalesced]
+
+    families = {
+        key: reg.family(f"compression_{key}_total", "counter", f"Compressed responses: {key.replace('_', ' ')}")
+        for key in ("responses", "cache_hits", "bytes_in", "bytes_out")
+    }
+    cpu = reg.family("compression_cpu_seconds_total", "counter", "CPU time spent compressing")
+    for enc, row in compression.to_dict().items():
+        for key, family in families.items():
+            family.add(row[key], encoding=enc)
+        cpu.add(row["cpu_ms"] / 1000, encoding=enc)
+    out += list(families.values()) + [cpu]
+
+    owned = reg.family("module_objects_bytes", "gauge", "Memory held by executed module files")
+    for owner, size in sorted(MODULE_OBJECTS.memory_by_owner().items()):
+        owned.add(size, owner=owner)
+    out.append(owned)
+    stats = logging_stats()
+    if stats:
+        out.append(reg.family("log_queue_depth", "gauge", "Log records waiting to be written").add(stats["queued"]))
+        dropped = reg.family("log_dropped_total", "counter", "Log records dropped because the queue was full")
+        for level, count in sorted(stats["dropped"].items()):
+            dropped.add(count, level=level)
+        out.append(dropped)
+    memory = reg.family("process_memory_bytes", "gauge", "Process memory from /proc")
+    for kind, kib in process_memory(os.getpid()).items():
+        memory.add(kib * 1024, kind=kind)
+    out.append(memory)
+    return out
+
+
+def create_app(
+    watch_interval: float = 1.0,
+    dispatch_threads: int | None = None,
+    derive_backend: str = "thread",
+    derive_processes: int | None = None,
+    derive_batch: int = 16,
+    derive_mp_context: str = "spawn",
+) -> FastAPI:
+    app = FastAPI(title="DnDCS UI", version="0.2.0")
+    reloader = ModuleReloader(interval=watch_interval)
+    app.state.module_reloader = reloader
+    # Module loading, validation and derivation are blocking; the async
+    # handlers hand them to this pool so the event loop stays responsive.
+    dispatcher = Dispatcher(max_workers=dispatch_threads)
+    app.state.dispatcher = dispatcher
+    backend = make_backend(
+        derive_backend,
+        dispatcher,
+        processes=derive_processes,
+        batch_size=derive_batch,
+        mp_context=derive_mp_context,
+    )
+    app.state.derive_backend = backend
+    derive_cache = derive_cache_from_env()
+    derive_cache.attach()
+    app.state.derive_cache = derive_cache
+    # Bases for /api/derive/patch, by the ETag of the result they produced.
+    derive_states = derive_states_from_env()
+    derive_states.attach()
+    # Identical requests that arrive while one is being computed share it.
+    flights = SingleFlight()
+    app.state.flights = flights
+    compression = CompressionStats()
+    app.state.metrics = metrics_registry = metrics.Registry()
+    http_metrics = metrics.HTTPMetrics(metrics_registry)
+    derive_seconds = metrics_registry.histogram(
+        "derive_seconds", "Time to derive a character (cache misses only)", ("module",)
+    )
+    module_loads = metrics_registry.counter("module_loads_total", "Module builds", ("module", "result"))
+    module_load_seconds = metrics_registry.histogram("module_load_seconds", "Module build time", ("module",))
+
+    def _on_module_build(module_id: str, seconds: float, ok: bool) -> None:
+        module_loads.inc(module_id, "ok" if ok else "error")
+        module_load_seconds.observe(seconds, module_id)
+
+    loader.MODULE_CACHE.add_build_listener(_on_module_build)
+    metrics_registry.add_collector(
+        lambda: _collect_stats(metrics_registry, dispatcher, backend, derive_cache, flights, compression)
+    )
+
+    def _shutdown() -> None:
+        loader.MODULE_CACHE.remove_build_listener(_on_module_build)
+        derive_cache.detach()
+        derive_states.detach()
+        backend.shutdown()
+        dispatcher.shutdown(wait=False)
+
+    async def _module_token(module_id: str) -> Optional[str]:
+        token = loader.MODULE_CACHE.token(module_id)
+        if token is None:
+            # Not built in this process yet, or out of date: (re)build it
+            # off the event loop once so results can be keyed.
+            await flights.run(
+                "load_module",
+                module_id,
+                lambda: dispatcher.run(loader.load_module_by_manifest_id, module_id, label="load_module"),
+            )
+            token = loader.MODULE_CACHE.token(module_id)
+        return token
+
+    async def _derive_key(payload: Any) -> Optional[Tuple[str, str]]:
+        """Return ``(module_id, key)`` identifying the derive result of ``payload``."""
+        module_id = payload.get("module") if isinstance(payload, dict) else None
+        if not isinstance(module_id, str):
+            return None
+        token = await _module_token(module_id)
+        if token is None:
+            return None
+        return module_id, derive_cache.key(payload, module_id, token)
+
+    async def _derive(
+        payload: Any,
+        modules: Optional[Dict[str, Any]] = None,
+        keyed: Optional[Tuple[str, str]] = None,
+    ) -> bytes:
+        # Identical characters derived by an unchanged module build get
+        # the stored response bytes back; identical concurrent requests
+        # share one computation.
+        if keyed is None:
+            keyed = await _derive_key(payload)
+        if keyed is None:
+            return await backend.execute("derive", payload, modules)
+        module_id, key = keyed
+        if derive_cache.enabled:
+            body = derive_cache.get(key)
+            if body is not None:
+                return body
+
+        async def _compute() -> bytes:
+            started = time.perf_counter()
+            result = await backend.execute("derive", payload, modules)
+            derive_seconds.observe(time.perf_counter() - started, module_id)
+            derive_cache.put(key, module_id, result)
+            return result
+
+        return await flights.run("derive", key, _compute)
+
+    app.router.add_event_handler("shutdown", _shutdown)
+
+    app.add_middleware(CompressionMiddleware, stats=compression)
+    app.add_middleware(RequestLogMiddleware, http_metrics=http_metrics)
 
     @app.get("/api/ping")
     def ping():
         return {"ok": True}
 
+    @app.get("/api/stats")
+    def api_stats():
+        return {
+            "dispatcher": dispatcher.stats(),
+            "backend": backend.stats(),
+            "derive_cache": derive_cache.stats(),
+            "derive_states": derive_states.stats(),
+            "coalescing": flights.stats(),
+            "compression": compression.to_dict(),
+            "process": dict(pid=os.getpid(), **process_memory(os.getpid())),
+            "logging": logging_stats(),
+            "module_objects": {
+                "files": len(MODULE_OBJECTS.records()),
+                "bytes_by_owner": MODULE_OBJECTS.memory_by_owner(),
+            },
+        }
+
+    @app.get("/metrics")
+    def prometheus_metrics():
+        return Response(metrics_registry.render(), media_type=metrics.CONTENT_TYPE)
+
     @app.get("/api/routes")
     def routes():
         return {"routes": [r.path for r in app.routes]}
 
     @app.get("/api/modules")
-    def api_modules():
-        mods = []
-        for man in discovery.discover_modules():
-            entry = {
-                "id": man.get("id"),
-                "name": man.get("name"),
-                "version": man.get("version"),
-                "description": man.get("description", ""),
-            }
-            icon_rel = man.get("icon")
-            if icon_rel:
-                entry["icon"] = f"/mods/{man['id']}/assets/{icon_rel.split('assets/')[-1]}"
-            mods.append(entry)
-        return {"modules": mods}
+    def api_modules(request: Request):
+        body = encode({"modules": discovery.get_module_index().listing()})
+        etag = make_etag("modules", body)
+        return not_modified(request, etag) or json_response(body, etag)
+
+    @app.post("/api/modules/reload")
+    def api_modules_reload(module: str | None = None, force: bool = True):
+        if module is not None and module not in discovery.get_module_index():
+            raise HTTPException(status_code=404, detail=f"Module '{module}' not found")
+        # A manual reload re-executes the module files even if their mtimes
+        # did not change; ``force=false`` reuses the unchanged ones.
+        reloaded = reloader.reload(module, force=force)
+        return {"reloaded": reloaded, "reload_count": reloader.reload_count}
 
     @app.get("/api/spells")
     def api_spells(
+        request: Request,
         module: str | None = None,
         name: str | None = None,
         cls: str | None = None,
@@ -88,6 +326,11 @@ def create_app() -> FastAPI:
         mod = loader.load_module_by_manifest_id(module_id)
         if mod is None:
             raise HTTPException(status_code=404, detail=f"Module '{module_id}' not found")
+        token = loader.MODULE_CACHE.token(module_id)
+        etag = make_etag("spells", module_id, token, name, cls)
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
         search_fn = None
         for sm in mod.subsystems.get("spells", []):
             if hasattr(sm, "search"):
@@ -95,8 +338,14 @@ def create_app() -> FastAPI:
                 break
         if search_fn is None:
             raise HTTPException(status_code=404, detail="No spell search available")
-        spells = search_fn(name=name, cls=cls)
-        return {"spells": spells}
+        # Runs on the server's thread pool; identical searches running at
+        # the same time share one result.
+        spells = flights.do(
+            "spells",
+            (module_id, token, name, cls),
+            lambda: search_fn(name=name, cls=cls),
+        )
+        return json_response(encode({"spells": spells}), etag)
 
     @app.post("/api/log")
     async def api_log(req: Request):
@@ -113,93 +362,190 @@ def create_app() -> FastAPI:
 
     @app.get("/mods/{module_id}/assets/{path:path}")
     def serve_asset(module_id: str, path: str):
-        for man in discovery.discover_modules():
-            if man.get("id") == module_id:
-                base = Path(man["__manifest_dir__"]) / "assets"
-                if not base.exists():
-                    raise HTTPException(status_code=404, detail="No assets for module")
-                file_path = _safe_join(base, path)
-                if not file_path.exists():
-                    raise HTTPException(status_code=404, detail="Asset not found")
-                return FileResponse(file_path)
-        raise HTTPException(status_code=404, detail="Module not found")
+        index = discovery.get_module_index()
+        if module_id not in index:
+            raise HTTPException(status_code=404, detail="Module not found")
+        base = index.asset_root(module_id)
+        if base is None:
+            raise HTTPException(status_code=404, detail="No assets for module")
+        file_path = _safe_join(base, path)
+        if not file_path.exists():
+            raise HTTPException(status_code=404, detail="Asset not found")
+        return FileResponse(file_path)
 
     @app.post("/api/new_character")
     async def api_new_character(req: Request):
         data = await req.json()
-        module_id = data.get("module_id") or registry.default_module_id()
-
-        log.info(
-            "new_character: requested=%s; discovered=%s",
-            module_id, [m.get("id") for m in discovery.discover_modules()]
-        )
-
-        mod = loader.load_module_by_manifest_id(module_id)
-        if mod is None:
-            raise HTTPException(status_code=404, detail=f"Module '{module_id}' not found")
-
-        abilities = {k: models.AbilityScore(name=k, score=v) for k, v in mod.template_abilities().items()}
-        skills = [models.Skill(name=s["name"], ability=s["ability"]) for s in mod.template_skills()]
-
-        char = models.Character(
-            name=data.get("name", "New Hero"),
-            level=int(data.get("level", 1)),
-            module=module_id,
-            abilities=abilities,
-            skills=skills,
-            items=[],
-            feats=[],
-        )
-        return JSONResponse(char.model_dump(by_alias=True, exclude_none=True))
+        return Response(await backend.execute("new_character", data), media_type="application/json")
 
     @app.post("/api/derive")
     async def api_derive(req: Request):
         payload = await req.json()
+        keyed = await _derive_key(payload)
+        if keyed is None:
+            return json_response(await _derive(payload))
+        # The tag is known before deriving, so a client re-posting the
+        # character it already has a result for gets a 304 at once.
+        etag = make_etag("derive", keyed[1])
+        response = not_modified(req, etag) or json_response(await _derive(payload, keyed=keyed), etag)
+        derive_states.put(etag, keyed[0], payload)
+        return response
+
+    @app.post("/api/derive/patch")
+    async def api_derive_patch(req: Request):
+        # ``If-Match`` names an earlier derive result; the body is an
+        # RFC 6902 patch to the character it was derived from.
+        base = req.headers.get("if-match")
+        entry = derive_states.get(bare_etag(base)) if base else None
+        if entry is None:
+            raise HTTPException(
+                status_code=412,
+                detail="If-Match must name a recent derive result; POST the full character to /api/derive",
+            )
         try:
-            char = models.Character.model_validate(payload)
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Invalid character: {e}")
+            patch = await req.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Body must be a JSON Patch document")
+        module_id, previous = entry
 
-        log.info(
-            "derive: requested module=%s; discovered=%s",
-            char.module, [m.get("id") for m in discovery.discover_modules()]
-        )
+        def _apply() -> DeriveState:
+            mod = load_module(module_id)
+            try:
+                state = previous if isinstance(previous, DeriveState) else mod.derive_state(previous)
+                state = mod.derive_incremental(state, patch)
+                if state.char.module != module_id:
+                    state = load_module(state.char.module).derive_state(state.payload)
+            except PatchConflict as exc:
+                raise HTTPException(status_code=409, detail=str(exc))
+            except InvalidPatch as exc:
+                raise HTTPException(status_code=400, detail=str(exc))
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=f"Invalid character: {exc}")
+            return state
 
-        mod = loader.load_module_by_manifest_id(char.module)
-        if mod is None:
-            raise HTTPException(status_code=404, detail=f"Module '{char.module}' not found")
+        state = await dispatcher.run(_apply, label="derive_patch")
+        body = encode(state.output)
+        keyed = await _derive_key(state.payload)
+        if keyed is None:
+            return json_response(body)
+        etag = make_etag("derive", keyed[1])
+        derive_states.put(etag, keyed[0], state)
+        derive_cache.put(keyed[1], keyed[0], body)
+        return json_response(body, etag)
+
+    @app.post("/api/derive/batch")
+    async def api_derive_batch(req: Request, order: str = "input"):
+        if order not in batch.ORDERS:
+            raise HTTPException(status_code=400, detail=f"order must be one of {', '.join(batch.ORDERS)}")
+        # Modules are resolved once per batch and reused for every item.
+        modules: Dict[str, Any] = {}
+
+        async def _run(index: int, item: Any) -> bytes:
+            if isinstance(item, batch.BatchItemError):
+                return batch.error_line(index, 400, item)
+            try:
+                body = await _derive(item, modules)
+            except HTTPException as exc:
+                return batch.error_line(index, exc.status_code, exc.detail)
+            except Exception as exc:
+                log.exception("derive batch item %d failed", index)
+                return batch.error_line(index, 500, f"{type(exc).__name__}: {exc}")
+            return batch.result_line(index, body)
 
-        d = mod.derive(char)
-        data: Dict[str, Any] = d.model_dump() if hasattr(d, "model_dump") else dict(d)
-        return JSONResponse(data)
+        items = batch.iter_items(req.stream(), req.headers.get("content-type", ""))
+        return batch.NDJSONStreamingResponse(batch.stream_results(items, _run, order=order))
 
     @app.post("/api/validate")
     async def api_validate(req: Request):
         payload = await req.json()
-        try:
-            char = models.Character.model_validate(payload)
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Invalid character: {e}")
-
-        mod = loader.load_module_by_manifest_id(char.module)
-        if mod is None:
-            raise HTTPException(status_code=404, detail=f"Module '{char.module}' not found")
-
-        issues = list(mod.validate(char))
-        return {"issues": issues}
+        return Response(await backend.execute("validate", payload), media_type="application/json")
 
     # Mount static LAST so /api/* routes work
     app.mount("/", StaticFiles(directory=_static_dir(), html=True), name="static")
     return app
 
 
-def serve(host: str = "127.0.0.1", port: int = 8000, open_browser: bool = True) -> None:
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    open_browser: bool = True,
+    warmup: bool = False,
+    load_workers: int | None = None,
+    watch: bool = False,
+    watch_interval: float = 1.0,
+    dispatch_threads: int | None = None,
+    derive_backend: str = "thread",
+    derive_processes: int | None = None,
+    derive_batch: int = 16,
+    workers: int = 1,
+) -> None:
     # Ensure logging is configured for UI runs.
     init_logging()
-    app = create_app()
-    if open_browser:
+    if warmup:
+        module_id = registry.default_module_id()
+        timings = loader.warmup_modules([module_id], max_workers=load_workers)
+        for path, secs in sorted(timings.get(module_id, {}).items(), key=lambda kv: -kv[1]):
+            log.info("warmup: %s %.1fms", path, secs * 1000)
+    if workers > 1 and not hasattr(os, "fork"):
+        log.warning("--workers needs os.fork; serving with a single process instead")
+        workers = 1
+    mp_context = "spawn"
+    if workers > 1 and derive_backend == "process":
+        # Every server worker gets its own derive pool; share the cores out
+        # instead of starting workers x cores processes.  The pools fork
+        # from the preloaded worker so they share its pages too.
+        cores = os.cpu_count() or 1
+        if derive_processes is None:
+            derive_processes = max(1, cores // workers)
+            log.warning(
+                "--workers %d with --derive-backend process: %d derive process(es) per worker",
+                workers, derive_processes,
+            )
+        elif workers * derive_processes > cores:
+            log.warning(
+                "--workers %d x --derive-processes %d exceeds %d core(s)",
+                workers, derive_processes, cores,
+            )
+        mp_context = "fork"
+    app = create_app(
+        watch_interval=watch_interval,
+        dispatch_threads=dispatch_threads,
+        derive_backend=derive_backend,
+        derive_processes=derive_processes,
+        derive_batch=derive_batch,
+        derive_mp_context=mp_context,
+    )
+
+    def _start_background() -> None:
+        app.state.derive_backend.start()
+        if watch:
+            app.state.module_reloader.start()
+
+    def _open_browser() -> None:
+        if not open_browser:
+            return
         def _open():
             time.sleep(0.6)
             webbrowser.open(f"http://{host}:{port}/")
         threading.Thread(target=_open, daemon=True).start()
+
+    if workers > 1:
+        def _run_worker(sock):
+            uvicorn.Server(uvicorn.Config(app, log_level="info")).run(sockets=[sock])
+
+        # Threads and worker pools are created after the fork, in each worker.
+        code = serve_prefork(
+            _run_worker,
+            host,
+            port,
+            workers,
+            [registry.default_module_id()],
+            on_fork=_start_background,
+            on_started=_open_browser,
+        )
+        if code:
+            raise SystemExit(code)
+        return
+    _start_background()
+    _open_browser()
     uvicorn.run(app, host=host, port=port, log_level="info")
@@ -1,20 +1,41 @@
+import { deepCopy } from "../util/deepCopy.js";
+import { diffMembers } from "../util/jsonPatch.js";
 import { logError } from "../util/logging.js";
 
+// Last ETag and body per method + URL. The server tags responses by what
+// produced them, so sending the tag back turns an unchanged result into an
+// empty 304. Bodies are kept as text so callers never share one object.
+const etagCache = new Map();
+
 async function requestJSON(url, options = {}, context = "api request") {
+  const cacheKey = `${options.method || "GET"} ${url}`;
+  const cached = etagCache.get(cacheKey);
   try {
     const response = await fetch(url, {
       ...options,
       headers: {
         "Content-Type": "application/json",
+        ...(cached ? { "If-None-Match": cached.etag } : {}),
         ...(options.headers || {}),
       },
     });
 
+    if (response.status === 304 && cached) {
+      return JSON.parse(cached.text);
+    }
+
     if (!response.ok) {
       throw new Error(`${response.status} ${response.statusText}`);
     }
 
-    return await response.json();
+    const text = await response.text();
+    const etag = response.headers.get("ETag");
+    if (etag) {
+      etagCache.set(cacheKey, { etag, text });
+    } else {
+      etagCache.delete(cacheKey);
+    }
+    return JSON.parse(text);
   } catch (error) {
     await logError(error, context);
     throw error;
@@ -36,15 +57,56 @@ export function apiNewCharacter(moduleId, name = "New Hero") {
   );
 }
 
-export function apiDerive(character) {
-  return requestJSON(
+// The character behind the last derive result and that result's ETag.
+// Later derives send only a JSON Patch against it; the server answers
+// 412/409 when it no longer has (or cannot patch) that base, and the full
+// character is posted instead.
+let lastDerive = null;
+
+async function derivePatch(base, patch) {
+  const response = await fetch("/api/derive/patch", {
+    method: "POST",
+    headers: { "Content-Type": "application/json-patch+json", "If-Match": base.etag },
+    body: JSON.stringify(patch),
+  });
+  if (response.status === 412 || response.status === 409) {
+    return null;
+  }
+  if (!response.ok) {
+    throw new Error(`${response.status} ${response.statusText}`);
+  }
+  return { etag: response.headers.get("ETag"), result: await response.json() };
+}
+
+export async function apiDerive(character) {
+  const snapshot = deepCopy(character);
+  const base = lastDerive;
+  const patch = base ? diffMembers(base.character, snapshot) : [];
+  if (patch.length) {
+    try {
+      const patched = await derivePatch(base, patch);
+      if (patched) {
+        lastDerive = patched.etag ? { etag: patched.etag, character: snapshot } : null;
+        return patched.result;
+      }
+    } catch (error) {
+      lastDerive = null;
+      await logError(error, "derive");
+      throw error;
+    }
+  }
+  lastDerive = null;
+  const result = await requestJSON(
     "/api/derive",
     {
       method: "POST",
-      body: JSON.stringify(character),
+      body: JSON.stringify(snapshot),
     },
     "derive"
   );
+  const etag = etagCache.get("POST /api/derive")?.etag;
+  if (etag) lastDerive = { etag, character: snapshot };
+  return result;
 }
 
 export function apiValidate(character) {
@@ -0,0 +1,53 @@
+// RFC 6902 operations that turn one character into another, one level
+// below the top: an edited item or ability becomes a replace of just that
+// element, which lets the server rederive only what depends on it.
+
+function pointer(...tokens) {
+  return tokens.map((t) => "/" + String(t).replace(/~/g, "~0").replace(/\//g, "~1")).join("");
+}
+
+function same(a, b) {
+  return JSON.stringify(a) === JSON.stringify(b);
+}
+
+function isObject(value) {
+  return value !== null && typeof value === "object" && !Array.isArray(value);
+}
+
+function diffElements(member, before, after, ops) {
+  if (Array.isArray(before) && Array.isArray(after) && before.length === after.length) {
+    before.forEach((value, i) => {
+      if (!same(value, after[i])) ops.push({ op: "replace", path: pointer(member, i), value: after[i] });
+    });
+    return;
+  }
+  if (isObject(before) && isObject(after)) {
+    Object.keys(before).forEach((key) => {
+      if (!(key in after)) ops.push({ op: "remove", path: pointer(member, key) });
+    });
+    Object.entries(after).forEach(([key, value]) => {
+      if (!(key in before)) {
+        ops.push({ op: "add", path: pointer(member, key), value });
+      } else if (!same(before[key], value)) {
+        ops.push({ op: "replace", path: pointer(member, key), value });
+      }
+    });
+    return;
+  }
+  ops.push({ op: "replace", path: pointer(member), value: after });
+}
+
+export function diffMembers(before, after) {
+  const ops = [];
+  Object.keys(before).forEach((key) => {
+    if (!(key in after)) ops.push({ op: "remove", path: pointer(key) });
+  });
+  Object.entries(after).forEach(([key, value]) => {
+    if (!(key in before)) {
+      ops.push({ op: "add", path: pointer(key), value });
+    } else if (!same(before[key], value)) {
+      diffElements(key, before[key], value, ops);
+    }
+  });
+  return ops;
+}